@@ -1,9 +1,17 @@
+from utils.lazy import lazy_exports
+
 from .placer import GreedyPlacer
-from .local_search import (
-    hill_climbing,
-    simulated_annealing,
-    iterated_local_search,
-    compare_local_search_methods
-)
-from .greedy import GreedyAlgorithm
-from .random_search import RandomSearch 
\ No newline at end of file
+
+# Everything but the placer is imported on first use, so loading the GA
+# does not pull in local search or the exact solver
+_LAZY = {
+    'hill_climbing': '.local_search',
+    'simulated_annealing': '.local_search',
+    'iterated_local_search': '.local_search',
+    'compare_local_search_methods': '.local_search',
+    'GreedyAlgorithm': '.greedy',
+    'RandomSearch': '.random_search',
+    'BranchAndBound': '.branch_and_bound'
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
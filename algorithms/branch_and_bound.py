@@ -0,0 +1,207 @@
+from models import DNA
+from algorithms.greedy import GreedyAlgorithm
+from utils.canonical import group_cylinder_types
+import copy
+import math
+
+class BranchAndBound:
+    def __init__(self, cylinders, container, placer):
+        self.cylinders = cylinders
+        self.container = container
+        self.placer = placer
+        self.best_solution = None
+        self.best_fitness = 0
+        self.proven_optimal = False
+        self.nodes_explored = 0
+        self.nodes_pruned = 0
+
+    def solve(self, max_nodes=None, verbose=True, should_stop=None):
+        """
+        Exhaustive search over placement orders with pruning
+
+        Identical cylinders (same diameter and weight) are treated as one
+        type, so orders that only swap them are explored once. A node is
+        pruned when a remaining cylinder no longer fits anywhere, or when the
+        best reachable center of mass cannot beat the incumbent.
+
+        Args:
+            max_nodes: Stop after this many nodes (result is then not proven)
+            verbose: Print progress
+            should_stop: Optional callable checked at every node; the search
+                ends early (not proven) once it returns True
+
+        Returns:
+            Best DNA found, or None if no valid order exists
+        """
+        if verbose:
+            print(f"Running Branch and Bound ({len(self.cylinders)} cylinders)...")
+
+        self.best_solution = None
+        self.best_fitness = 0
+        self.proven_optimal = False
+        self.nodes_explored = 0
+        self.nodes_pruned = 0
+        self._max_nodes = max_nodes
+        self._should_stop = should_stop
+        self._aborted = False
+
+        if not self._root_feasible():
+            # Weight or area rules out every order
+            self.proven_optimal = True
+            if verbose:
+                print("  Instance is infeasible (weight or area bound)")
+            return None
+
+        self._seed_incumbent()
+
+        self._work = [copy.deepcopy(c) for c in self.cylinders]
+        self._types = group_cylinder_types(self.cylinders)
+        self._density_score = self._packing_density() * 1000
+
+        remaining = {key: list(indices) for key, indices in self._types.items()}
+        self._search([], remaining, 0.0, 0.0, 0.0)
+
+        self.proven_optimal = not self._aborted
+
+        if self.best_solution is not None:
+            # Re-evaluate through the normal path so the fitness is exactly comparable
+            self.best_solution.calculate_fitness(self.cylinders, self.container, self.placer)
+            self.best_fitness = self.best_solution.fitness
+
+        if verbose:
+            status = "optimal" if self.proven_optimal else "best found (search stopped early)"
+            print(f"  Nodes explored: {self.nodes_explored}, pruned: {self.nodes_pruned}")
+            if self.best_solution:
+                print(f"  Placement order: {self.best_solution.genes}")
+                print(f"  Fitness: {self.best_fitness:.2f} ({status})")
+            else:
+                print("  No valid order exists")
+
+        return self.best_solution
+
+    def _root_feasible(self):
+        total_weight = sum(c.weight for c in self.cylinders)
+        if total_weight > self.container.max_weight:
+            return False
+
+        # The placer keeps every cylinder fully inside the safe zone
+        safe_area = (self.container.safe_x_max - self.container.safe_x_min) * \
+                    (self.container.safe_y_max - self.container.safe_y_min)
+        total_area = sum(c.get_area() for c in self.cylinders)
+        if total_area > safe_area:
+            return False
+
+        for c in self.cylinders:
+            if c.diameter > self.container.safe_x_max - self.container.safe_x_min:
+                return False
+            if c.diameter > self.container.safe_y_max - self.container.safe_y_min:
+                return False
+
+        return True
+
+    def _seed_incumbent(self):
+        # Start from the best greedy order so the bound prunes from the first node
+        greedy = GreedyAlgorithm(self.cylinders, self.container, self.placer)
+        results = greedy.solve_all_strategies(verbose=False)
+        best = max(results.values(), key=lambda r: r['fitness'])
+        if best['fitness'] > 0:
+            self.best_solution = best['solution'].copy()
+            self.best_fitness = best['fitness']
+
+    def _packing_density(self):
+        total_area = sum(c.get_area() for c in self.cylinders)
+        return total_area / (self.container.width * self.container.depth)
+
+    def _search(self, order, remaining, placed_weight, moment_x, moment_y):
+        if self._max_nodes is not None and self.nodes_explored >= self._max_nodes:
+            self._aborted = True
+            return
+        if self._should_stop is not None and self._should_stop():
+            self._aborted = True
+            return
+
+        self.nodes_explored += 1
+
+        if len(order) == len(self.cylinders):
+            fitness = DNA.score_placement(self._work, self.container)
+            if fitness > self.best_fitness:
+                dna = DNA(len(self.cylinders))
+                dna.genes = list(order)
+                dna.fitness = fitness
+                self.best_solution = dna
+                self.best_fitness = fitness
+            return
+
+        if self._upper_bound(remaining, placed_weight, moment_x, moment_y) <= self.best_fitness:
+            self.nodes_pruned += 1
+            return
+
+        # Position of the next cylinder of every remaining type. Placing more
+        # cylinders only removes free positions, so if any type has nowhere to
+        # go now, no completion of this prefix is feasible.
+        children = []
+        for key, indices in remaining.items():
+            if not indices:
+                continue
+            index = indices[0]
+            position = self.placer.find_valid_position(self._work[index], self._work, self.container)
+            if position is None:
+                self.nodes_pruned += 1
+                return
+            children.append((key, index, position))
+
+        for key, index, position in children:
+            cylinder = self._work[index]
+            cylinder.set_position(position[0], position[1])
+            remaining[key].pop(0)
+            order.append(index)
+
+            self._search(
+                order,
+                remaining,
+                placed_weight + cylinder.weight,
+                moment_x + cylinder.weight * position[0],
+                moment_y + cylinder.weight * position[1]
+            )
+
+            order.pop()
+            remaining[key].insert(0, index)
+            cylinder.x = None
+            cylinder.y = None
+            cylinder.placed = False
+
+            if self._aborted:
+                return
+
+    def _upper_bound(self, remaining, placed_weight, moment_x, moment_y):
+        # Best fitness any completion could reach: every remaining cylinder
+        # lands somewhere inside the safe zone, so the final center of mass
+        # lies in a box we can compute from the placed prefix.
+        container = self.container
+        total_weight = placed_weight
+        low_x = high_x = moment_x
+        low_y = high_y = moment_y
+
+        for indices in remaining.values():
+            for index in indices:
+                c = self._work[index]
+                total_weight += c.weight
+                low_x += c.weight * (container.safe_x_min + c.radius)
+                high_x += c.weight * (container.safe_x_max - c.radius)
+                low_y += c.weight * (container.safe_y_min + c.radius)
+                high_y += c.weight * (container.safe_y_max - c.radius)
+
+        if total_weight == 0:
+            return math.inf
+
+        dx = self._axis_distance(low_x / total_weight, high_x / total_weight, container.width / 2)
+        dy = self._axis_distance(low_y / total_weight, high_y / total_weight, container.depth / 2)
+        centeredness = 1 - (dx / container.width + dy / container.depth) / 2
+
+        # Small slack so rounding never prunes an order that ties the bound
+        return 10000 + self._density_score + centeredness * 500 + 1e-9
+
+    def _axis_distance(self, low, high, target):
+        if low <= target <= high:
+            return 0.0
+        return min(abs(low - target), abs(high - target))
@@ -1,6 +1,8 @@
 import copy
+from utils.canonical import FitnessCache
 
-def hill_climbing(dna, cylinders, container, placer, max_iterations=50, verbose=False):
+def hill_climbing(dna, cylinders, container, placer, max_iterations=50, verbose=False, cache=None,
+                  should_stop=None):
     """
     Hill climbing local search with swap operations
     
@@ -11,10 +13,16 @@ def hill_climbing(dna, cylinders, container, placer, max_iterations=50, verbose=
         placer: GreedyPlacer object
         max_iterations: Maximum number of improvement rounds
         verbose: Print progress
+        cache: FitnessCache to share evaluations with other searches
+        should_stop: Optional callable; the search returns its current DNA
+            once it returns True
         
     Returns:
         Improved DNA object
     """
+    if cache is None:
+        cache = FitnessCache(cylinders)
+    
     initial_fitness = dna.fitness
     if verbose:
         print(f"Starting local search with fitness: {initial_fitness:.2f}")
@@ -30,11 +38,18 @@ def hill_climbing(dna, cylinders, container, placer, max_iterations=50, verbose=
         best_fitness = dna.fitness
         
         for i in range(len(dna.genes)):
+            if should_stop is not None and should_stop():
+                # Keep the best swap found so far
+                break
             for j in range(i + 1, len(dna.genes)):
+                # Swapping identical cylinders gives the same placement
+                if cache.same_type(dna.genes[i], dna.genes[j]):
+                    continue
+                
                 test_dna = dna.copy()
                 test_dna.genes[i], test_dna.genes[j] = test_dna.genes[j], test_dna.genes[i]
                 
-                test_dna.calculate_fitness(cylinders, container, placer)
+                test_dna.calculate_fitness(cylinders, container, placer, cache)
                 
                 if test_dna.fitness > best_fitness:
                     best_fitness = test_dna.fitness
@@ -48,8 +63,11 @@ def hill_climbing(dna, cylinders, container, placer, max_iterations=50, verbose=
             
             if verbose:
                 print(f"  Iteration {iteration}: Swapped positions {i} and {j}, fitness: {best_fitness:.2f}")
+        
+        if should_stop is not None and should_stop():
+            break
     
-    dna.calculate_fitness(cylinders, container, placer)
+    dna.calculate_fitness(cylinders, container, placer, cache)
     
     if verbose:
         improvement = dna.fitness - initial_fitness
@@ -60,7 +78,7 @@ def hill_climbing(dna, cylinders, container, placer, max_iterations=50, verbose=
 
 def simulated_annealing(dna, cylinders, container, placer, 
                         initial_temp=100, cooling_rate=0.95, 
-                        max_iterations=1000, verbose=False):
+                        max_iterations=1000, verbose=False, cache=None, rng=None):
     """
     Simulated annealing local search
     
@@ -73,6 +91,8 @@ def simulated_annealing(dna, cylinders, container, placer,
         cooling_rate: How fast to cool (0.9-0.99)
         max_iterations: Maximum iterations
         verbose: Print progress
+        cache: FitnessCache to share evaluations with other searches
+        rng: random.Random to draw from (default: the random module)
         
     Returns:
         Improved DNA object
@@ -80,6 +100,11 @@ def simulated_annealing(dna, cylinders, container, placer,
     import random
     import math
     
+    if cache is None:
+        cache = FitnessCache(cylinders)
+    if rng is None:
+        rng = random
+    
     initial_fitness = dna.fitness
     if verbose:
         print(f"Starting simulated annealing with fitness: {initial_fitness:.2f}")
@@ -90,15 +115,15 @@ def simulated_annealing(dna, cylinders, container, placer,
     temperature = initial_temp
     
     for iteration in range(max_iterations):
-        i = random.randint(0, len(current_solution.genes) - 1)
-        j = random.randint(0, len(current_solution.genes) - 1)
+        i = rng.randint(0, len(current_solution.genes) - 1)
+        j = rng.randint(0, len(current_solution.genes) - 1)
         
-        if i == j:
+        if i == j or cache.same_type(current_solution.genes[i], current_solution.genes[j]):
             continue
         
         test_solution = current_solution.copy()
         test_solution.genes[i], test_solution.genes[j] = test_solution.genes[j], test_solution.genes[i]
-        test_solution.calculate_fitness(cylinders, container, placer)
+        test_solution.calculate_fitness(cylinders, container, placer, cache)
         
         delta = test_solution.fitness - current_solution.fitness
         
@@ -110,7 +135,7 @@ def simulated_annealing(dna, cylinders, container, placer,
                     print(f"  Iteration {iteration}: New best fitness: {best_solution.fitness:.2f}")
         else:
             acceptance_prob = math.exp(delta / temperature) if temperature > 0 else 0
-            if random.random() < acceptance_prob:
+            if rng.random() < acceptance_prob:
                 current_solution = test_solution
         
         temperature *= cooling_rate
@@ -126,7 +151,7 @@ def simulated_annealing(dna, cylinders, container, placer,
 
 
 def iterated_local_search(dna, cylinders, container, placer, 
-                          num_restarts=5, verbose=False):
+                          num_restarts=5, verbose=False, cache=None, rng=None, should_stop=None):
     """
     Iterated local search: Run hill climbing multiple times with perturbations
     
@@ -137,12 +162,20 @@ def iterated_local_search(dna, cylinders, container, placer,
         placer: GreedyPlacer object
         num_restarts: Number of times to restart with perturbation
         verbose: Print progress
+        cache: FitnessCache to share evaluations with other searches
+        rng: random.Random to draw from (default: the random module)
+        should_stop: Optional callable; no further restarts once it returns True
         
     Returns:
         Best improved DNA object
     """
     import random
     
+    if cache is None:
+        cache = FitnessCache(cylinders)
+    if rng is None:
+        rng = random
+    
     initial_fitness = dna.fitness
     if verbose:
         print(f"Starting iterated local search with fitness: {initial_fitness:.2f}")
@@ -152,19 +185,23 @@ def iterated_local_search(dna, cylinders, container, placer,
     
     for restart in range(num_restarts):
         current_solution = hill_climbing(current_solution, cylinders, container, placer, 
-                                        max_iterations=20, verbose=False)
+                                        max_iterations=20, verbose=False, cache=cache,
+                                        should_stop=should_stop)
         
         if current_solution.fitness > best_solution.fitness:
             best_solution = current_solution.copy()
             if verbose:
                 print(f"  Restart {restart + 1}: New best fitness: {best_solution.fitness:.2f}")
         
+        if should_stop is not None and should_stop():
+            break
+        
         if restart < num_restarts - 1:
             current_solution = best_solution.copy()
-            num_swaps = random.randint(2, 4)
+            num_swaps = rng.randint(2, 4)
             for _ in range(num_swaps):
-                i = random.randint(0, len(current_solution.genes) - 1)
-                j = random.randint(0, len(current_solution.genes) - 1)
+                i = rng.randint(0, len(current_solution.genes) - 1)
+                j = rng.randint(0, len(current_solution.genes) - 1)
                 current_solution.genes[i], current_solution.genes[j] = current_solution.genes[j], current_solution.genes[i]
     
     if verbose:
@@ -185,9 +222,10 @@ def compare_local_search_methods(dna, cylinders, container, placer):
     print(f"Initial fitness: {dna.fitness:.2f}\n")
     
     results = {}
+    cache = FitnessCache(cylinders)
     
     print("1. Hill Climbing:")
-    hc_solution = hill_climbing(dna.copy(), cylinders, container, placer, verbose=True)
+    hc_solution = hill_climbing(dna.copy(), cylinders, container, placer, verbose=True, cache=cache)
     results['hill_climbing'] = {
         'solution': hc_solution,
         'fitness': hc_solution.fitness,
@@ -196,7 +234,7 @@ def compare_local_search_methods(dna, cylinders, container, placer):
     print()
     
     print("2. Simulated Annealing:")
-    sa_solution = simulated_annealing(dna.copy(), cylinders, container, placer, verbose=True)
+    sa_solution = simulated_annealing(dna.copy(), cylinders, container, placer, verbose=True, cache=cache)
     results['simulated_annealing'] = {
         'solution': sa_solution,
         'fitness': sa_solution.fitness,
@@ -205,7 +243,7 @@ def compare_local_search_methods(dna, cylinders, container, placer):
     print()
     
     print("3. Iterated Local Search:")
-    ils_solution = iterated_local_search(dna.copy(), cylinders, container, placer, verbose=True)
+    ils_solution = iterated_local_search(dna.copy(), cylinders, container, placer, verbose=True, cache=cache)
     results['iterated_local_search'] = {
         'solution': ils_solution,
         'fitness': ils_solution.fitness,
@@ -1,15 +1,20 @@
 from models import DNA
+from utils.canonical import FitnessCache
 import random
 import copy
 
 class RandomSearch:
-    def __init__(self, cylinders, container, placer):
+    def __init__(self, cylinders, container, placer, rng=random):
         self.cylinders = cylinders
         self.container = container
         self.placer = placer
         self.best_solution = None
         self.best_fitness = 0
         self.history = []
+        # Orders that only swap identical cylinders are looked up, not re-placed
+        self.cache = FitnessCache(cylinders)
+        # random.Random for reproducible runs (see DNA)
+        self.rng = rng
     
     def solve(self, num_trials=1000, verbose=True):
         """
@@ -25,8 +30,8 @@ class RandomSearch:
         valid_count = 0
         
         for trial in range(num_trials):
-            dna = DNA(len(self.cylinders))
-            dna.calculate_fitness(self.cylinders, self.container, self.placer)
+            dna = DNA(len(self.cylinders), self.rng)
+            dna.calculate_fitness(self.cylinders, self.container, self.placer, self.cache)
             
             if dna.fitness > 0:
                 valid_count += 1
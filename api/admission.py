@@ -0,0 +1,158 @@
+import heapq
+import itertools
+import threading
+import time
+
+# Lower runs first; quick algorithms jump ahead of GA and portfolio runs
+PRIORITIES = {
+    'greedy': 0,
+    'random': 1,
+    'genetic': 2,
+    'portfolio': 2
+}
+
+
+class Rejected(Exception):
+    """
+    A request that was not admitted
+
+    status is 429 when the wait queue is full (rejected straight away) and
+    503 when the request waited max_wait seconds without getting a slot.
+    """
+    def __init__(self, status, message, retry_after):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Limits how many solver slots are in use at once
+
+    Every solve entry point (/solve, jobs, streams and batch items) takes
+    its slots here, so together they never run more than max_concurrent
+    solver processes or threads. Most solves take one slot; a portfolio
+    takes one per member process. Up to max_waiting more requests wait,
+    lowest priority value first and first come first served within a
+    priority. Anything beyond that is rejected immediately.
+
+    Usage:
+        with controller.admit(priority, slots) as ticket:
+            ...
+        ticket.wait_seconds, ticket.service_seconds
+    """
+    def __init__(self, max_concurrent=4, max_waiting=32, max_wait=30.0):
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.max_wait = max_wait
+        self.running = 0
+        self.waiting = []
+        self.condition = threading.Condition()
+        self._counter = itertools.count()
+        self.admitted = 0
+        self.rejected = {429: 0, 503: 0}
+
+    def admit(self, priority=0, slots=1, max_wait=None):
+        """
+        Args:
+            priority: Lower is served first (see PRIORITIES)
+            slots: Solver slots the request occupies, capped at max_concurrent
+            max_wait: Seconds to wait for the slots instead of the
+                controller's max_wait; float('inf') waits as long as it takes
+        """
+        return Ticket(self, priority, min(slots, self.max_concurrent),
+                      self.max_wait if max_wait is None else max_wait)
+
+    def try_admit(self, priority=0, slots=1):
+        """
+        Take the slots only if they are free right now and nobody waits
+
+        Returns:
+            An entered Ticket (call release() when done), or None
+        """
+        ticket = Ticket(self, priority, min(slots, self.max_concurrent), 0)
+        with self.condition:
+            if not self._fits(ticket.slots) or self.waiting:
+                return None
+            self._take(ticket.slots)
+        ticket._started = time.perf_counter()
+        return ticket
+
+    def _fits(self, slots):
+        return self.running + slots <= self.max_concurrent
+
+    def _take(self, slots):
+        # Caller holds the condition
+        self.running += slots
+        self.admitted += 1
+
+    def _acquire(self, priority, slots, max_wait):
+        entry = (priority, next(self._counter), slots)
+        deadline = time.monotonic() + max_wait
+        with self.condition:
+            if self._fits(slots) and not self.waiting:
+                self._take(slots)
+                return
+
+            if len(self.waiting) >= self.max_waiting:
+                self.rejected[429] += 1
+                raise Rejected(429, f"{len(self.waiting)} requests are already waiting", 1)
+
+            heapq.heappush(self.waiting, entry)
+            while not (self._fits(slots) and self.waiting[0] == entry):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.waiting.remove(entry)
+                    heapq.heapify(self.waiting)
+                    self.condition.notify_all()
+                    self.rejected[503] += 1
+                    raise Rejected(503, f"no solver slot within {max_wait:g}s", int(max_wait))
+                self.condition.wait(None if remaining == float('inf') else remaining)
+
+            heapq.heappop(self.waiting)
+            self._take(slots)
+            # The next waiter may fit as well
+            self.condition.notify_all()
+
+    def _release(self, slots):
+        with self.condition:
+            self.running -= slots
+            self.condition.notify_all()
+
+    def stats(self):
+        with self.condition:
+            return {
+                'running': self.running,
+                'waiting': len(self.waiting),
+                'max_concurrent': self.max_concurrent,
+                'max_waiting': self.max_waiting,
+                'admitted': self.admitted,
+                'rejected': dict(self.rejected)
+            }
+
+
+class Ticket:
+    # Context manager for one admitted request; records queue and service time
+    def __init__(self, controller, priority, slots=1, max_wait=None):
+        self.controller = controller
+        self.priority = priority
+        self.slots = slots
+        self.max_wait = controller.max_wait if max_wait is None else max_wait
+        self.wait_seconds = 0.0
+        self.service_seconds = 0.0
+        self._started = None
+
+    def __enter__(self):
+        start = time.perf_counter()
+        self.controller._acquire(self.priority, self.slots, self.max_wait)
+        self._started = time.perf_counter()
+        self.wait_seconds = self._started - start
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def release(self):
+        self.service_seconds = time.perf_counter() - self._started
+        self.controller._release(self.slots)
@@ -1,7 +1,38 @@
+import os
 from flask import Flask
 
 def create_app():
     app = Flask(__name__)
+    # Path of the SQLite solution store; unset disables it
+    app.config['SOLUTION_STORE_PATH'] = os.environ.get('CARGO_SOLUTION_STORE')
+    # Admission for every solve (/api/solve, jobs, streams and batch items):
+    # solver slots in use at once (unset means one per CPU; a portfolio takes
+    # one per member), requests allowed to wait, seconds they may wait, and
+    # the time budget of a single GA or portfolio solve
+    app.config['SOLVE_MAX_CONCURRENT'] = int(os.environ['CARGO_SOLVE_MAX_CONCURRENT']) if os.environ.get('CARGO_SOLVE_MAX_CONCURRENT') else None
+    app.config['SOLVE_MAX_WAITING'] = int(os.environ.get('CARGO_SOLVE_MAX_WAITING', 32))
+    app.config['SOLVE_MAX_WAIT'] = float(os.environ.get('CARGO_SOLVE_MAX_WAIT', 30.0))
+    app.config['SOLVE_TIME_LIMIT'] = float(os.environ.get('CARGO_SOLVE_TIME_LIMIT', 120.0))
+    # Background solves for /api/jobs: running at once, waiting, finished ones kept
+    app.config['JOB_WORKERS'] = int(os.environ.get('CARGO_JOB_WORKERS', 2))
+    app.config['JOB_QUEUE_LIMIT'] = int(os.environ.get('CARGO_JOB_QUEUE_LIMIT', 16))
+    app.config['JOB_RETENTION'] = int(os.environ.get('CARGO_JOB_RETENTION', 100))
+    # Streamed solves: running at once, events kept for resuming, seconds
+    # a run survives without a client
+    app.config['STREAM_MAX_SESSIONS'] = int(os.environ.get('CARGO_STREAM_MAX_SESSIONS', 8))
+    app.config['STREAM_BUFFER'] = int(os.environ.get('CARGO_STREAM_BUFFER', 256))
+    app.config['STREAM_RESUME_GRACE'] = float(os.environ.get('CARGO_STREAM_RESUME_GRACE', 5.0))
+    # /api/solve result cache: entries kept in memory (0 disables it) and an
+    # optional SQLite file that keeps results across restarts
+    app.config['RESULT_CACHE_SIZE'] = int(os.environ.get('CARGO_RESULT_CACHE_SIZE', 128))
+    app.config['RESULT_CACHE_PATH'] = os.environ.get('CARGO_RESULT_CACHE')
+    # /api/render image cache: images kept in memory (0 disables it) and an
+    # optional SQLite file shared across restarts
+    app.config['RENDER_CACHE_SIZE'] = int(os.environ.get('CARGO_RENDER_CACHE_SIZE', 512))
+    app.config['RENDER_CACHE_PATH'] = os.environ.get('CARGO_RENDER_CACHE')
+    # /api/solve-batch: worker processes (unset means one per CPU) and items per request
+    app.config['BATCH_WORKERS'] = int(os.environ['CARGO_BATCH_WORKERS']) if os.environ.get('CARGO_BATCH_WORKERS') else None
+    app.config['BATCH_MAX_ITEMS'] = int(os.environ.get('CARGO_BATCH_MAX_ITEMS', 1000))
     
     from api.routes import api_bp
     app.register_blueprint(api_bp, url_prefix='/api')
@@ -0,0 +1,167 @@
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+class BatchPool:
+    """
+    Process pool shared by /solve-batch requests
+
+    Created on first use and recreated if a worker dies, so one crashed
+    item does not take the endpoint down with it.
+    """
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or os.cpu_count()
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def get(self):
+        with self.lock:
+            if self.executor is None:
+                # multiprocessing is only imported once a batch comes in
+                from concurrent.futures import ProcessPoolExecutor
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self.executor
+
+    def reset(self, expected=None):
+        # With expected, only that (broken) executor is replaced. Every
+        # future of a broken pool fails at once, and all but the first
+        # caller would otherwise shut down the executor that replaced it.
+        with self.lock:
+            if expected is not None and self.executor is not expected:
+                return
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+def solve_item(index, item, store_path=None):
+    """
+    Solve one batch item in a worker process
+
+    Args:
+        index: Position of the item in the request
+        item: Dict with container, cylinders, algorithm and params (already
+            merged with the batch defaults); params.time_limit is the
+            item's budget in seconds
+        store_path: SolutionStore file, or None
+
+    Returns:
+        NDJSON record with index, id, status ('solved', 'failed' or
+        'error'), seconds and either result or error
+    """
+    from api.routes import parse_problem, solve_problem, encode_result
+    from utils import SolutionStore
+
+    start = time.perf_counter()
+    record = {'index': index, 'id': item.get('id', index)}
+    try:
+        container, cylinders = parse_problem(item)
+        params = item.get('params', {})
+        store = SolutionStore(store_path) if store_path and params.get('use_store', True) else None
+        result = solve_problem(container, cylinders, item.get('algorithm', 'genetic'), params, store=store)
+        if result:
+            record['status'] = 'solved'
+            record['result'] = encode_result(result, params)
+        else:
+            record['status'] = 'failed'
+            record['error'] = 'No solution found'
+    except Exception as e:
+        record['status'] = 'error'
+        record['error'] = f"{type(e).__name__}: {e}"
+    record['seconds'] = time.perf_counter() - start
+    return record
+
+
+def run_batch(pool, items, defaults, store_path=None, admission=None, time_cap=None):
+    """
+    Fan items out over the pool and yield their records as they finish
+
+    Each item is capped at time_cap seconds like a /solve request (see
+    with_time_budget). With an AdmissionController an item is only
+    submitted once it holds its solver slots. A batch that cannot get a
+    slot within the controller's max_wait reports its remaining items as
+    errors.
+
+    Closing the generator (the client went away) cancels the items that
+    have not started yet.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+    from api.routes import admission_for, with_time_budget
+
+    def error_record(index, message):
+        return {'index': index, 'id': items[index].get('id', index), 'status': 'error',
+                'error': message, 'seconds': None}
+
+    pending = []
+    for index, item in enumerate(items):
+        merged = dict(item)
+        merged.setdefault('algorithm', defaults.get('algorithm', 'genetic'))
+        params = {**defaults.get('params', {}), **item.get('params', {})}
+        merged['params'] = with_time_budget(merged['algorithm'], params, cap=time_cap)
+        pending.append((index, merged))
+    pending.reverse()
+
+    def submit(index, merged):
+        # Another batch may have replaced the executor since our last
+        # submit, or it broke before any of our futures noticed; a broken
+        # or shut down executor raises a RuntimeError here
+        executor = pool.get()
+        try:
+            return executor.submit(solve_item, index, merged, store_path), executor
+        except RuntimeError:
+            pool.reset(expected=executor)
+            executor = pool.get()
+            return executor.submit(solve_item, index, merged, store_path), executor
+
+    futures = {}
+    try:
+        while pending or futures:
+            # Submit while slots are free; block for one only when nothing of
+            # this batch is running, so finished items keep streaming out
+            while pending:
+                index, merged = pending[-1]
+                ticket = None
+                if admission is not None:
+                    priority, slots = admission_for(merged['algorithm'], merged.get('cylinders') or [])
+                    if futures:
+                        ticket = admission.try_admit(priority, slots)
+                        if ticket is None:
+                            break
+                    else:
+                        from api.admission import Rejected
+                        try:
+                            ticket = admission.admit(priority, slots).__enter__()
+                        except Rejected as e:
+                            for index, _ in reversed(pending):
+                                yield error_record(index, f"Server busy: {e}")
+                            pending = []
+                            break
+                pending.pop()
+                try:
+                    future, executor = submit(index, merged)
+                except RuntimeError as e:
+                    if ticket is not None:
+                        ticket.release()
+                    yield error_record(index, f"{type(e).__name__}: {e}")
+                    continue
+                if ticket is not None:
+                    # Also frees the slots of items cancelled below
+                    future.add_done_callback(lambda _, ticket=ticket: ticket.release())
+                futures[future] = (index, executor)
+
+            if not futures:
+                break
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, source = futures.pop(future)
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    pool.reset(expected=source)
+                    yield error_record(index, 'Worker process died')
+                except Exception as e:
+                    yield error_record(index, f"{type(e).__name__}: {e}")
+    finally:
+        for future in futures:
+            future.cancel()
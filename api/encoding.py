@@ -0,0 +1,79 @@
+"""
+Compact columnar encoding of API results
+
+Opt in with params.response_format = 'columnar'. Cylinders become parallel
+id/x/y arrays without the diameter, radius and weight the client sent in
+the first place, and generation_history becomes parallel arrays of at most
+params.history_points (default 100) generations.
+"""
+
+COLUMNAR = 'columnar'
+DEFAULT_HISTORY_POINTS = 100
+
+
+def wants_columnar(params):
+    return params.get('response_format') == COLUMNAR
+
+
+def cylinder_columns(cylinders):
+    """
+    Args:
+        cylinders: list of {'id', 'x', 'y', ...} dicts
+
+    Returns:
+        {'id': [...], 'x': [...], 'y': [...]} (x and y are None for
+        cylinders that were not placed)
+    """
+    return {
+        'id': [cyl['id'] for cyl in cylinders],
+        'x': [cyl['x'] for cyl in cylinders],
+        'y': [cyl['y'] for cyl in cylinders]
+    }
+
+
+def downsample_indices(length, max_points):
+    # Evenly spaced indices that always include the first and last one
+    if length <= max_points:
+        return list(range(length))
+    if max_points < 2:
+        return [length - 1]
+    return sorted({round(i * (length - 1) / (max_points - 1)) for i in range(max_points)})
+
+
+def history_columns(history, max_points=DEFAULT_HISTORY_POINTS):
+    """
+    Args:
+        history: list of {'generation', 'best', 'avg', ...} dicts
+
+    Returns:
+        dict of parallel arrays, one entry per kept generation
+    """
+    kept = [history[i] for i in downsample_indices(len(history), max_points)]
+    columns = {'generation': [h['generation'] for h in kept]}
+    for field in ('best', 'avg', 'worst'):
+        if kept and field in kept[0]:
+            columns[field] = [h[field] for h in kept]
+    return columns
+
+
+def columnar_result(result, params):
+    """
+    Re-encode a /solve result (see solve_problem) in columnar form
+
+    The input is left untouched, so cached full results can be served in
+    either format.
+    """
+    encoded = dict(result)
+    encoded['format'] = COLUMNAR
+
+    details = dict(result['details'])
+    details['columns'] = cylinder_columns(details.pop('cylinders'))
+    encoded['details'] = details
+
+    if 'generation_history' in encoded:
+        history = encoded.pop('generation_history')
+        max_points = int(params.get('history_points', DEFAULT_HISTORY_POINTS))
+        encoded['history'] = history_columns(history, max_points)
+        encoded['history']['total'] = len(history)
+
+    return encoded
@@ -0,0 +1,152 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+class QueueFull(Exception):
+    pass
+
+
+class Job:
+    """
+    One submitted solve
+
+    Status goes queued -> running -> done | failed | cancelled. A queued job
+    is cancelled straight away; a running one is asked to stop and the
+    solver checks cancel_requested between generations, keeping the best
+    solution found so far as its result.
+    """
+    def __init__(self, job_id, description=None):
+        self.id = job_id
+        self.description = description or {}
+        self.status = 'queued'
+        self.result = None
+        self.error = None
+        self.progress = None
+        self.cancel_requested = False
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+
+    @property
+    def finished(self):
+        return self.status in ('done', 'failed', 'cancelled')
+
+    def to_dict(self, with_result=False):
+        data = {
+            'id': self.id,
+            'status': self.status,
+            'progress': self.progress,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'error': self.error
+        }
+        data.update(self.description)
+        if with_result:
+            data['result'] = self.result
+        return data
+
+
+class JobManager:
+    """
+    Runs solves on a bounded pool of worker threads
+
+    At most max_workers jobs run at once and at most max_queued wait for a
+    worker; submit() raises QueueFull beyond that so callers can push back
+    instead of piling up work. Finished jobs, with their results, are kept
+    for polling until max_finished newer ones have finished.
+    """
+    def __init__(self, max_workers=2, max_queued=16, max_finished=100):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='solve-job')
+        self._finished_order = OrderedDict()
+
+    def submit(self, fn, *args, description=None, **kwargs):
+        """
+        Queue fn(job, *args, **kwargs); its return value becomes job.result
+
+        Returns:
+            The new Job
+        """
+        with self.lock:
+            waiting = sum(1 for job in self.jobs.values() if job.status == 'queued')
+            if waiting >= self.max_queued:
+                raise QueueFull(f"{waiting} jobs are already waiting")
+
+            job = Job(uuid.uuid4().hex, description)
+            self.jobs[job.id] = job
+            job.future = self.executor.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a queued job or ask a running one to stop
+
+        Returns:
+            The Job, or None if the id is unknown
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+            job.cancel_requested = True
+            if job.status == 'queued' and job.future.cancel():
+                self._finish(job, 'cancelled')
+        return job
+
+    def stats(self):
+        with self.lock:
+            counts = {}
+            for job in self.jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            'max_workers': self.max_workers,
+            'max_queued': self.max_queued,
+            'jobs': counts
+        }
+
+    def shutdown(self):
+        with self.lock:
+            for job in self.jobs.values():
+                job.cancel_requested = True
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run(self, job, fn, args, kwargs):
+        with self.lock:
+            if job.cancel_requested:
+                self._finish(job, 'cancelled')
+                return
+            job.status = 'running'
+            job.started_at = time.time()
+
+        try:
+            result = fn(job, *args, **kwargs)
+        except Exception as e:
+            with self.lock:
+                job.error = str(e)
+                self._finish(job, 'failed')
+            return
+
+        with self.lock:
+            job.result = result
+            self._finish(job, 'cancelled' if job.cancel_requested else 'done')
+
+    def _finish(self, job, status):
+        # Caller holds the lock
+        job.status = status
+        job.finished_at = time.time()
+        self._finished_order[job.id] = None
+        while len(self._finished_order) > self.max_finished:
+            old_id, _ = self._finished_order.popitem(last=False)
+            self.jobs.pop(old_id, None)
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+def request_fingerprint(container, cylinders, algorithm, params):
+    """
+    Hash of everything that determines a /solve response
+
+    Unlike instance_hash the cylinder order matters here, since results
+    refer to cylinders by index.
+    """
+    data = {
+        'container': [float(container.width), float(container.depth), float(container.max_weight)],
+        'cylinders': [[float(cyl.diameter), float(cyl.weight)] for cyl in cylinders],
+        'algorithm': algorithm,
+        'params': params
+    }
+    encoded = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def layout_fingerprint(container, cylinders, options):
+    """
+    Hash of a placed solution and the options it is drawn with
+
+    Keys /api/render images; two requests that would draw the same
+    picture share one entry.
+    """
+    data = {
+        'container': [float(container.width), float(container.depth)],
+        'cylinders': [
+            [cyl.id, float(cyl.diameter), float(cyl.weight)] + ([float(cyl.x), float(cyl.y)] if cyl.placed else [])
+            for cyl in cylinders
+        ],
+        'options': options
+    }
+    encoded = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of API results, optionally backed by a SQLite file
+
+    The in-memory part holds max_entries results. With a path, results are
+    also written to the file (itself capped at max_file_entries, least
+    recently used first out), so they survive restarts and can be shared
+    by several server processes.
+    """
+    def __init__(self, max_entries=128, path=None, max_file_entries=10000):
+        self.max_entries = max_entries
+        self.path = path
+        self.max_file_entries = max_file_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS results (
+                        key TEXT PRIMARY KEY,
+                        result TEXT NOT NULL,
+                        created REAL NOT NULL,
+                        last_used REAL NOT NULL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_results_last_used ON results(last_used)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        """
+        Returns:
+            (result, created) where created is a time.time() timestamp, or
+            None on a miss
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        if self.path:
+            with self._connect() as conn:
+                row = conn.execute("SELECT result, created FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+            if row is not None:
+                entry = (json.loads(row[0]), row[1])
+                with self.lock:
+                    self._remember(key, entry)
+                    self.hits += 1
+                return entry
+
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, result):
+        created = time.time()
+        with self.lock:
+            self._remember(key, (result, created))
+
+        if self.path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, result, created, last_used) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(result), created, created)
+                )
+                count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+                if count > self.max_file_entries:
+                    conn.execute(
+                        "DELETE FROM results WHERE key IN "
+                        "(SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                        (count - self.max_file_entries,)
+                    )
+
+    def __len__(self):
+        with self.lock:
+            return len(self.entries)
+
+    def _remember(self, key, entry):
+        # Caller holds the lock
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
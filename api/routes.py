@@ -1,40 +1,173 @@
-from flask import Blueprint, request, jsonify, Response
-from models import Container, Cylinder, DNA
+from flask import Blueprint, request, jsonify, Response, current_app, g
+from models import Container, Cylinder
 from solvers import CargoPackingSolver
-from algorithms import GreedyAlgorithm, RandomSearch, GreedyPlacer, hill_climbing
-from utils import calculate_center_of_mass, calculate_packing_density, check_all_constraints
+from algorithms import GreedyPlacer
+from utils import calculate_center_of_mass, calculate_packing_density, check_all_constraints, SolutionStore
+from utils.metrics import REGISTRY
+from api.jobs import JobManager, QueueFull
+from api.streams import StreamSessions, TooManyStreams, format_event_id, parse_event_id
+from api.result_cache import ResultCache, request_fingerprint, layout_fingerprint
+from api.batch import BatchPool, run_batch
+from api.admission import AdmissionController, Rejected, PRIORITIES
+from api.encoding import columnar_result, cylinder_columns, wants_columnar
+from visualization.svg_renderer import SvgRenderer
 import json
+import os
+import random
 import time
 import copy
 
 api_bp = Blueprint('api', __name__)
 
+_solution_store = None
+
+# Request params that do not change the solve itself
+UNCACHED_PARAMS = ('use_cache', 'response_format', 'history_points')
+
+def get_solution_store():
+    global _solution_store
+    path = current_app.config.get('SOLUTION_STORE_PATH')
+    if not path:
+        return None
+    if _solution_store is None or _solution_store.path != path:
+        _solution_store = SolutionStore(path)
+    return _solution_store
+
+_job_manager = None
+
+def get_job_manager():
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager(
+            max_workers=current_app.config.get('JOB_WORKERS', 2),
+            max_queued=current_app.config.get('JOB_QUEUE_LIMIT', 16),
+            max_finished=current_app.config.get('JOB_RETENTION', 100)
+        )
+    return _job_manager
+
+_stream_sessions = None
+
+def get_stream_sessions():
+    global _stream_sessions
+    if _stream_sessions is None:
+        _stream_sessions = StreamSessions(
+            max_sessions=current_app.config.get('STREAM_MAX_SESSIONS', 8),
+            buffer_size=current_app.config.get('STREAM_BUFFER', 256),
+            resume_grace=current_app.config.get('STREAM_RESUME_GRACE', 5.0)
+        )
+    return _stream_sessions
+
+_result_cache = None
+
+def get_result_cache():
+    global _result_cache
+    size = current_app.config.get('RESULT_CACHE_SIZE', 128)
+    if not size:
+        return None
+    path = current_app.config.get('RESULT_CACHE_PATH')
+    if _result_cache is None or _result_cache.path != path:
+        _result_cache = ResultCache(max_entries=size, path=path)
+    return _result_cache
+
+_render_cache = None
+
+def get_render_cache():
+    global _render_cache
+    size = current_app.config.get('RENDER_CACHE_SIZE', 512)
+    if not size:
+        return None
+    path = current_app.config.get('RENDER_CACHE_PATH')
+    if _render_cache is None or _render_cache.path != path:
+        _render_cache = ResultCache(max_entries=size, path=path)
+    return _render_cache
+
+_batch_pool = None
+
+def get_batch_pool():
+    global _batch_pool
+    if _batch_pool is None:
+        _batch_pool = BatchPool(max_workers=current_app.config.get('BATCH_WORKERS'))
+    return _batch_pool
+
+_admission_controller = None
+
+def get_admission_controller():
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController(
+            max_concurrent=current_app.config.get('SOLVE_MAX_CONCURRENT') or os.cpu_count(),
+            max_waiting=current_app.config.get('SOLVE_MAX_WAITING', 32),
+            max_wait=current_app.config.get('SOLVE_MAX_WAIT', 30.0)
+        )
+    return _admission_controller
+
+REQUEST_SECONDS = REGISTRY.histogram('cargo_http_request_duration_seconds',
+                                     'API request latency (time to the first byte for streams)',
+                                     ('endpoint', 'method', 'status'))
+SOLVE_SECONDS = REGISTRY.histogram('cargo_solve_duration_seconds', 'Time spent in solve_problem',
+                                   ('algorithm', 'outcome'))
+
+def _queue_depths():
+    depths = {}
+    if _admission_controller is not None:
+        depths[('solve',)] = _admission_controller.stats()['waiting']
+    if _job_manager is not None:
+        depths[('jobs',)] = _job_manager.stats()['jobs'].get('queued', 0)
+    return depths
+
+def _in_flight():
+    running = {}
+    if _admission_controller is not None:
+        running[('solve',)] = _admission_controller.stats()['running']
+    if _job_manager is not None:
+        running[('jobs',)] = _job_manager.stats()['jobs'].get('running', 0)
+    if _stream_sessions is not None:
+        running[('stream',)] = _stream_sessions.running()
+    return running
+
+def _result_cache_lookups():
+    if _result_cache is None:
+        return None
+    return {('hit',): _result_cache.hits, ('miss',): _result_cache.misses}
+
+REGISTRY.gauge('cargo_queue_depth', 'Requests waiting for a solver', ('queue',), function=_queue_depths)
+REGISTRY.gauge('cargo_solves_in_flight', 'Solves running now (source "solve": admission slots held by all entry points)',
+               ('source',), function=_in_flight)
+REGISTRY.gauge('cargo_result_cache_lookups', '/api/solve result cache lookups since start', ('result',),
+               function=_result_cache_lookups)
+
+@api_bp.before_request
+def start_timer():
+    g.request_start = time.perf_counter()
+
 def add_cors_headers(response):
     response.headers['Access-Control-Allow-Origin'] = 'http://localhost:5173'
-    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, DELETE, OPTIONS'
+    response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Last-Event-ID, If-None-Match'
+    response.headers['Access-Control-Expose-Headers'] = 'X-Stream-Session, X-Cache, Age, X-Queue-Wait, X-Service-Time, Retry-After, ETag, Location'
     return response
 
 @api_bp.after_request
 def after_request(response):
+    start = g.get('request_start')
+    if start is not None:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint=endpoint, method=request.method,
+                                status=response.status_code)
     return add_cors_headers(response)
 
 @api_bp.route('/health', methods=['GET'])
 def health():
     return jsonify({'status': 'ok'})
 
+@api_bp.route('/metrics', methods=['GET'])
+def metrics():
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
 
-@api_bp.route('/solve', methods=['POST'])
-def solve():
-    """
-    Solve a custom problem instance
-    """
-    data = request.json
-    
+
+def parse_problem(data):
     container_data = data.get('container')
     cylinders_data = data.get('cylinders')
-    algorithm = data.get('algorithm', 'genetic')
-    params = data.get('params', {})
     
     container = Container(
         width=float(container_data['width']),
@@ -50,6 +183,124 @@ def solve():
             weight=float(cyl['weight'])
         ))
     
+    return container, cylinders
+
+
+@api_bp.route('/solve', methods=['POST'])
+def solve():
+    """
+    Solve a custom problem instance
+
+    Results are cached by a fingerprint of the instance, algorithm and
+    params (see get_result_cache); the X-Cache header says HIT, MISS or
+    BYPASS (params.use_cache false, or a profiled run) and hits carry an
+    Age header in seconds. params.seed makes runs reproducible, and
+    params.response_format 'columnar' selects the compact encoding in
+    api/encoding.py.
+
+    Solves go through the admission controller shared with jobs, streams
+    and batch items (see get_admission_controller); a portfolio takes one slot
+    per member process. X-Queue-Wait and X-Service-Time report the
+    seconds spent waiting for a slot and solving, and a full queue or a
+    too long wait is answered with 429 or 503 and Retry-After.
+    """
+    data = request.json
+    algorithm = data.get('algorithm', 'genetic')
+    params = data.get('params', {})
+    container, cylinders = parse_problem(data)
+    store = get_solution_store() if params.get('use_store', True) else None
+    
+    # Profiled runs are there to be timed, so they always run
+    cache = get_result_cache() if params.get('use_cache', True) and not params.get('profile') else None
+    key = None
+    if cache is not None:
+        # Options that only change the encoding share one entry
+        key = request_fingerprint(container, cylinders, algorithm,
+                                  {k: v for k, v in params.items() if k not in UNCACHED_PARAMS})
+        hit = cache.get(key)
+        if hit is not None:
+            result, created = hit
+            response = jsonify({'success': True, 'result': encode_result(result, params)})
+            response.headers['X-Cache'] = 'HIT'
+            response.headers['Age'] = str(int(max(0, time.time() - created)))
+            return response
+    
+    priority, slots = admission_for(algorithm, cylinders)
+    try:
+        with get_admission_controller().admit(priority, slots) as ticket:
+            result = solve_problem(container, cylinders, algorithm, with_time_budget(algorithm, params), store=store)
+    except Rejected as e:
+        response = jsonify({'success': False, 'error': f'Server busy: {e}'})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, e.status
+    
+    if result:
+        if cache is not None:
+            cache.put(key, result)
+        response, status = jsonify({'success': True, 'result': encode_result(result, params)}), 200
+    else:
+        response, status = jsonify({'success': False, 'error': 'No solution found'}), 400
+    response.headers['X-Cache'] = 'MISS' if cache is not None else 'BYPASS'
+    response.headers['X-Queue-Wait'] = f"{ticket.wait_seconds:.3f}"
+    response.headers['X-Service-Time'] = f"{ticket.service_seconds:.3f}"
+    return response, status
+
+
+def encode_result(result, params):
+    return columnar_result(result, params) if wants_columnar(params) else result
+
+
+def admission_for(algorithm, cylinders):
+    # (priority, slots) of a solve; a portfolio runs one process per member
+    priority = PRIORITIES.get(algorithm, max(PRIORITIES.values()))
+    if algorithm != 'portfolio':
+        return priority, 1
+    from solvers.portfolio import portfolio_members
+    return priority, len(portfolio_members(len(cylinders)))
+
+
+def with_time_budget(algorithm, params, cap=None):
+    # Caps params.time_limit at cap seconds (default SOLVE_TIME_LIMIT); GA
+    # runs without a limit of their own get the cap
+    if cap is None:
+        cap = current_app.config.get('SOLVE_TIME_LIMIT')
+    if not cap or algorithm not in ('genetic', 'portfolio'):
+        return params
+    default = 10 if algorithm == 'portfolio' else cap
+    return dict(params, time_limit=min(float(params.get('time_limit') or default), cap))
+
+
+def solve_problem(container, cylinders, algorithm, params, store=None, job=None):
+    start = time.perf_counter()
+    outcome = 'error'
+    try:
+        result = _solve_problem(container, cylinders, algorithm, params, store, job)
+        outcome = 'solved' if result else 'failed'
+        return result
+    finally:
+        SOLVE_SECONDS.observe(time.perf_counter() - start, algorithm=algorithm, outcome=outcome)
+
+
+def _solve_problem(container, cylinders, algorithm, params, store=None, job=None):
+    """
+    Run one of the algorithms and build the API result
+
+    Args:
+        container: Container
+        cylinders: List of Cylinder objects
+        algorithm: 'genetic', 'greedy', 'random' or 'portfolio'
+        params: Request parameters
+        store: SolutionStore for the genetic algorithm, or None
+        job: Job when running in the job queue; the genetic algorithm then
+            reports progress on it and stops early once it is cancelled
+
+    Returns:
+        Result dict, or None if nothing was found
+    """
+    # A private generator per seeded solve: other threads' solves neither
+    # disturb it nor get disturbed by it
+    rng = random.Random(params['seed']) if params.get('seed') is not None else random
+    
     placer = GreedyPlacer(step_size=params.get('step_size', 0.3))
     
     result = None
@@ -60,14 +311,34 @@ def solve():
             cylinders=cylinders,
             population_size=params.get('population_size', 100),
             mutation_rate=params.get('mutation_rate', 0.05),
-            step_size=params.get('step_size', 0.3)
+            step_size=params.get('step_size', 0.3),
+            initial_orders=params.get('initial_orders'),
+            seed_greedy=params.get('seed_greedy', False),
+            seed_fraction=params.get('seed_fraction', 0.2),
+            store=store,
+            profile=params.get('profile', False),
+            rng=rng
         )
         
-        solution = solver.solve(
-            max_generations=params.get('max_generations', 200),
-            verbose=False,
-            use_local_search=params.get('use_local_search', True)
+        max_generations = params.get('max_generations', 200)
+        events = solver.iter_solve(
+            max_generations=max_generations,
+            use_local_search=params.get('use_local_search', True),
+            time_limit=params.get('time_limit')
         )
+        for event in events:
+            if job is None:
+                continue
+            if event['type'] == 'generation':
+                job.progress = {
+                    'generation': event['generation'] + 1,
+                    'total_generations': max_generations,
+                    'best_fitness': event['best_fitness']
+                }
+            if job.cancel_requested:
+                break
+        events.close()
+        solution = solver.best_solution
         
         if solution:
             details = solver.get_solution_details(solution)
@@ -94,10 +365,17 @@ def solve():
                 'generation_history': [
                     {'generation': h['generation'], 'best': h['best'], 'avg': h['avg']}
                     for h in solver.generation_history
-                ]
+                ],
+                'store_hit': solver.store_hit
             }
+            if solver.skipped_seeds:
+                result['skipped_seeds'] = solver.skipped_seeds
+            if solver.profiler is not None:
+                result['profile'] = solver.profile_summary()
     
     elif algorithm == 'greedy':
+        from algorithms import GreedyAlgorithm
+        
         solver = GreedyAlgorithm(cylinders, container, placer)
         solution = solver.solve(strategy=params.get('strategy', 'largest_first'), verbose=False)
         
@@ -131,7 +409,9 @@ def solve():
             }
     
     elif algorithm == 'random':
-        solver = RandomSearch(cylinders, container, placer)
+        from algorithms import RandomSearch
+        
+        solver = RandomSearch(cylinders, container, placer, rng=rng)
         solution = solver.solve(num_trials=params.get('num_trials', 1000), verbose=False)
         
         if solution:
@@ -166,104 +446,34 @@ def solve():
                 'statistics': stats
             }
     
-    if result:
-        return jsonify({'success': True, 'result': result})
-    else:
-        return jsonify({'success': False, 'error': 'No solution found'}), 400
-
-@api_bp.route('/solve-stream', methods=['POST'])
-def solve_stream():
-    data = request.json
-    
-    container_data = data.get('container')
-    cylinders_data = data.get('cylinders')
-    params = data.get('params', {})
-    
-    container = Container(
-        width=float(container_data['width']),
-        depth=float(container_data['depth']),
-        max_weight=float(container_data['max_weight'])
-    )
-    
-    cylinders = []
-    for i, cyl in enumerate(cylinders_data):
-        cylinders.append(Cylinder(
-            cylinder_id=i,
-            diameter=float(cyl['diameter']),
-            weight=float(cyl['weight'])
-        ))
-    
-    def generate():
-        import time
+    elif algorithm == 'portfolio':
+        from solvers import PortfolioSolver
         
-        solver = CargoPackingSolver(
+        solver = PortfolioSolver(
             container=container,
             cylinders=cylinders,
+            step_size=params.get('step_size', 0.3),
             population_size=params.get('population_size', 100),
-            mutation_rate=params.get('mutation_rate', 0.05),
-            step_size=params.get('step_size', 0.3)
+            mutation_rate=params.get('mutation_rate', 0.05)
         )
+        # Member i runs with seed + i in its own process
+        solution = solver.solve(time_limit=params.get('time_limit', 10), seed=params.get('seed'), verbose=False)
         
-        max_gens = params.get('max_generations', 200)
-        animation_delay = params.get('animation_delay', 0.05)
-        
-        yield f"data: {json.dumps({'type': 'start', 'total_generations': max_gens})}\n\n"
-        
-        for gen in range(max_gens):
-            solver.population.calculate_fitness()
-            stats = solver.population.get_stats()
-            
-            current_best = solver.population.get_best()
-            if current_best.fitness > 0 and (solver.best_solution is None or current_best.fitness > solver.best_fitness):
-                solver.best_solution = current_best.copy()
-                solver.best_fitness = current_best.fitness
-            
-            progress_data = {
-                'type': 'progress',
-                'generation': gen,
-                'best_fitness': stats['best'],
-                'avg_fitness': stats['avg'],
-                'worst_fitness': stats['worst'],
-                'solution': None
-            }
-            
-            if solver.best_solution and solver.best_solution.fitness > 0:
-                details = solver.get_solution_details(solver.best_solution)
-                if details and details['cylinders']:
-                    progress_data['solution'] = {
-                        'placement_order': solver.best_solution.genes,
-                        'cylinders': [
-                            {
-                                'id': cyl.id,
-                                'x': cyl.x,
-                                'y': cyl.y,
-                                'diameter': cyl.diameter,
-                                'radius': cyl.radius,
-                                'weight': cyl.weight
-                            }
-                            for cyl in details['cylinders'] if cyl.placed
-                        ],
-                        'center_of_mass': details['center_of_mass'] if details['center_of_mass'][0] else [0, 0],
-                        'packing_density': details['packing_density']
-                    }
-            
-            yield f"data: {json.dumps(progress_data)}\n\n"
-            
-            time.sleep(animation_delay)
+        if solution:
+            cylinder_copies = [copy.deepcopy(c) for c in cylinders]
+            placer.place_cylinders(cylinder_copies, solution.genes, container)
+            center_x, center_y = calculate_center_of_mass(cylinder_copies)
+            density = calculate_packing_density(cylinder_copies, container)
+            is_valid, _ = check_all_constraints(cylinder_copies, container)
             
-            solver.population.normalize_fitness()
-            solver.population.reproduce()
-        
-        if solver.best_solution:
-            details = solver.get_solution_details(solver.best_solution)
-            final_data = {
-                'type': 'complete',
-                'solution': {
-                    'placement_order': solver.best_solution.genes,
-                    'fitness': solver.best_solution.fitness,
-                    'valid': details['valid'],
-                    'center_of_mass': details['center_of_mass'],
-                    'packing_density': details['packing_density'],
+            result = {
+                'algorithm': 'Portfolio',
+                'solution': solution.genes,
+                'fitness': solution.fitness,
+                'details': {
+                    'valid': is_valid,
+                    'center_of_mass': (center_x, center_y),
+                    'packing_density': density,
                     'cylinders': [
                         {
                             'id': cyl.id,
@@ -273,14 +483,432 @@ def solve_stream():
                             'radius': cyl.radius,
                             'weight': cyl.weight
                         }
-                        for cyl in details['cylinders']
+                        for cyl in cylinder_copies
                     ]
+                },
+                'winner': solver.winner,
+                'proven_optimal': solver.proven_optimal,
+                'members': solver.member_results
+            }
+    
+    return result
+
+
+@api_bp.route('/solve-batch', methods=['POST'])
+def solve_batch():
+    """
+    Solve many instances in parallel and stream the results as NDJSON
+
+    Body: {'items': [{'id', 'container', 'cylinders', 'algorithm', 'params'}],
+    'algorithm': default algorithm, 'params': default params}. Item params
+    override the defaults; params.time_limit is an item's budget in seconds,
+    capped at SOLVE_TIME_LIMIT like /solve. Items take solver slots from
+    the shared admission controller before they are handed to the pool.
+
+    One JSON line per item is written as soon as it finishes, in completion
+    order: index, id, status ('solved', 'failed' or 'error'), seconds and
+    result or error. A bad item only fails its own line.
+    """
+    data = request.json or {}
+    items = data.get('items')
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        return jsonify({'success': False, 'error': "'items' must be a list of objects"}), 400
+    
+    max_items = current_app.config.get('BATCH_MAX_ITEMS', 1000)
+    if len(items) > max_items:
+        return jsonify({'success': False, 'error': f'At most {max_items} items per batch'}), 413
+    
+    defaults = {'algorithm': data.get('algorithm', 'genetic'), 'params': data.get('params', {})}
+    records = run_batch(get_batch_pool(), items, defaults, store_path=current_app.config.get('SOLUTION_STORE_PATH'),
+                        admission=get_admission_controller(), time_cap=current_app.config.get('SOLVE_TIME_LIMIT'))
+    
+    def generate():
+        for record in records:
+            yield json.dumps(record) + '\n'
+    
+    response = Response(generate(), mimetype='application/x-ndjson')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    response.headers['X-Batch-Size'] = str(len(items))
+    return response
+
+
+def run_solve_job(job, admission, container, cylinders, algorithm, params, store):
+    # Jobs are background work: they wait for their slots as long as it takes
+    priority, slots = admission_for(algorithm, cylinders)
+    with admission.admit(priority, slots, max_wait=float('inf')):
+        result = solve_problem(container, cylinders, algorithm, params, store=store, job=job)
+    return encode_result(result, params) if result else result
+
+
+@api_bp.route('/jobs', methods=['POST'])
+def submit_job():
+    """
+    Queue a solve and return its job id straight away
+
+    Takes the same body as /solve. Poll /jobs/<id> for progress and
+    /jobs/<id>/result for the result; DELETE /jobs/<id> cancels.
+    """
+    data = request.json
+    algorithm = data.get('algorithm', 'genetic')
+    params = data.get('params', {})
+    container, cylinders = parse_problem(data)
+    store = get_solution_store() if params.get('use_store', True) else None
+    
+    try:
+        job = get_job_manager().submit(
+            run_solve_job, get_admission_controller(), container, cylinders, algorithm, params, store,
+            description={'algorithm': algorithm, 'cylinders': len(cylinders)}
+        )
+    except QueueFull as e:
+        response = jsonify({'success': False, 'error': f'Job queue is full: {e}'})
+        response.headers['Retry-After'] = '5'
+        return response, 503
+    
+    response = jsonify({'success': True, 'job': job.to_dict()})
+    response.headers['Location'] = f"{request.script_root}/api/jobs/{job.id}"
+    return response, 202
+
+
+@api_bp.route('/jobs', methods=['GET'])
+def job_stats():
+    return jsonify(get_job_manager().stats())
+
+
+@api_bp.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Unknown job'}), 404
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+
+@api_bp.route('/jobs/<job_id>/result', methods=['GET'])
+def job_result(job_id):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Unknown job'}), 404
+    if not job.finished:
+        return jsonify({'success': False, 'job': job.to_dict()}), 202
+    if job.status == 'failed':
+        return jsonify({'success': False, 'job': job.to_dict(), 'error': job.error}), 500
+    if job.result is None:
+        return jsonify({'success': False, 'job': job.to_dict(), 'error': 'No solution found'}), 400
+    # A cancelled genetic job keeps the best solution found before it stopped
+    return jsonify({'success': True, 'job': job.to_dict(), 'result': job.result})
+
+
+@api_bp.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    job = get_job_manager().cancel(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Unknown job'}), 404
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+@api_bp.route('/solve-stream', methods=['POST'])
+def solve_stream():
+    """
+    Run the genetic algorithm and stream progress as server-sent events
+
+    Events: 'start' (generation count and the static cylinder data),
+    throttled 'progress' frames with the population stats and, only when
+    the best solution improved, its [id, x, y] positions, and a final
+    'complete' with the full solution. params.frame_interval sets the
+    minimum time between frames in seconds (default 0.1). With
+    params.response_format 'columnar', layouts are sent as id/x/y arrays
+    ('columns') instead of 'positions' rows and 'cylinders' dicts.
+    params.time_limit is capped at SOLVE_TIME_LIMIT, as for /solve.
+
+    The solve runs in a stream session that outlives the connection.
+    Every event has an id "<session>:<seq>"; posting again with that id in
+    a Last-Event-ID header (or GET /solve-stream/<session>) resumes the
+    same run. A run with no client attached for STREAM_RESUME_GRACE
+    seconds is cancelled.
+    """
+    session_id, seq = parse_event_id(request.headers.get('Last-Event-ID'))
+    session = get_stream_sessions().get(session_id) if session_id else None
+    if session is not None:
+        return stream_response(session, seq)
+    
+    data = request.json
+    # The run holds an admission slot, so it gets the same cap as /solve
+    params = with_time_budget('genetic', data.get('params', {}))
+    container, cylinders = parse_problem(data)
+    
+    try:
+        session = get_stream_sessions().start(
+            stream_frames(container, cylinders, params, admission=get_admission_controller())
+        )
+    except TooManyStreams as e:
+        response = jsonify({'success': False, 'error': f'Too many streams: {e}'})
+        response.headers['Retry-After'] = '5'
+        return response, 503
+    return stream_response(session, -1)
+
+
+@api_bp.route('/solve-stream/<session_id>', methods=['GET'])
+def resume_stream(session_id):
+    session = get_stream_sessions().get(session_id)
+    if session is None:
+        return jsonify({'success': False, 'error': 'Unknown stream'}), 404
+    
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    resumed_id, seq = parse_event_id(last_event_id)
+    if resumed_id != session_id:
+        seq = -1
+    return stream_response(session, seq)
+
+
+@api_bp.route('/solve-stream/<session_id>', methods=['DELETE'])
+def cancel_stream(session_id):
+    session = get_stream_sessions().get(session_id)
+    if session is None:
+        return jsonify({'success': False, 'error': 'Unknown stream'}), 404
+    session.cancel()
+    return jsonify({'success': True})
+
+
+def stream_frames(container, cylinders, params, admission=None):
+    # Event dicts for one streamed genetic solve (see solve_stream). With an
+    # AdmissionController the run holds a solver slot; a stream that gets
+    # none ends with an 'error' event.
+    if admission is None:
+        yield from _stream_frames(container, cylinders, params)
+        return
+    with admission.admit(PRIORITIES['genetic']):
+        yield from _stream_frames(container, cylinders, params)
+
+
+def _stream_frames(container, cylinders, params):
+    solver = CargoPackingSolver(
+        container=container,
+        cylinders=cylinders,
+        population_size=params.get('population_size', 100),
+        mutation_rate=params.get('mutation_rate', 0.05),
+        step_size=params.get('step_size', 0.3),
+        initial_orders=params.get('initial_orders'),
+        seed_greedy=params.get('seed_greedy', False),
+        seed_fraction=params.get('seed_fraction', 0.2),
+        rng=random.Random(params['seed']) if params.get('seed') is not None else None
+    )
+    
+    max_gens = params.get('max_generations', 200)
+    frame_interval = params.get('frame_interval', 0.1)
+    columnar = wants_columnar(params)
+    
+    # Sizes and weights never change, so they are sent once; progress
+    # frames only carry positions
+    start_data = {
+        'type': 'start',
+        'total_generations': max_gens,
+        'cylinders': [
+            {'id': cyl.id, 'diameter': cyl.diameter, 'radius': cyl.radius, 'weight': cyl.weight}
+            for cyl in cylinders
+        ]
+    }
+    if solver.skipped_seeds:
+        start_data['skipped_seeds'] = solver.skipped_seeds
+    yield start_data
+    
+    # The solver runs flat out; a frame goes out at most every
+    # frame_interval seconds with the latest stats, plus the new layout
+    # if the best solution improved since the previous frame
+    last_frame = None
+    improved = False
+    
+    for event in solver.iter_solve(max_generations=max_gens, time_limit=params.get('time_limit')):
+        if event['type'] != 'generation':
+            continue
+        improved = improved or event['improved']
+        
+        now = time.perf_counter()
+        last_generation = event['generation'] == max_gens - 1
+        if last_frame is not None and now - last_frame < frame_interval and not last_generation:
+            continue
+        last_frame = now
+        
+        stats = event['stats']
+        progress_data = {
+            'type': 'progress',
+            'generation': event['generation'],
+            'best_fitness': stats['best'],
+            'avg_fitness': stats['avg'],
+            'worst_fitness': stats['worst'],
+            'solution': None
+        }
+        
+        if improved and solver.best_solution:
+            details = solver.get_solution_details(solver.best_solution)
+            progress_data['solution'] = {
+                'placement_order': solver.best_solution.genes,
+                'fitness': solver.best_fitness,
+                'center_of_mass': details['center_of_mass'] if details['center_of_mass'][0] else [0, 0],
+                'packing_density': details['packing_density']
+            }
+            placed = [cyl for cyl in details['cylinders'] if cyl.placed]
+            if columnar:
+                progress_data['solution']['columns'] = {
+                    'id': [cyl.id for cyl in placed],
+                    'x': [cyl.x for cyl in placed],
+                    'y': [cyl.y for cyl in placed]
                 }
+            else:
+                progress_data['solution']['positions'] = [[cyl.id, cyl.x, cyl.y] for cyl in placed]
+            improved = False
+        
+        yield progress_data
+    
+    if solver.best_solution:
+        details = solver.get_solution_details(solver.best_solution)
+        final_data = {
+            'type': 'complete',
+            'solution': {
+                'placement_order': solver.best_solution.genes,
+                'fitness': solver.best_solution.fitness,
+                'valid': details['valid'],
+                'center_of_mass': details['center_of_mass'],
+                'packing_density': details['packing_density'],
+                'cylinders': [
+                    {
+                        'id': cyl.id,
+                        'x': cyl.x,
+                        'y': cyl.y,
+                        'diameter': cyl.diameter,
+                        'radius': cyl.radius,
+                        'weight': cyl.weight
+                    }
+                    for cyl in details['cylinders']
+                ]
             }
-            yield f"data: {json.dumps(final_data)}\n\n"
+        }
+        if columnar:
+            final_data['solution']['columns'] = cylinder_columns(final_data['solution'].pop('cylinders'))
+        yield final_data
+
+
+def stream_response(session, after):
+    # Sends the session's events after sequence number `after`. A client
+    # disconnect closes this generator, which detaches it from the session.
+    keepalive = current_app.config.get('STREAM_KEEPALIVE', 15.0)
+    
+    def generate():
+        last = after
+        session.attach()
+        try:
+            while True:
+                events, done = session.read(last, timeout=keepalive)
+                if not events and not done:
+                    # Writing is what notices a closed connection
+                    yield ": keepalive\n\n"
+                    continue
+                for seq, event in events:
+                    yield f"id: {format_event_id(session.id, seq)}\ndata: {json.dumps(event)}\n\n"
+                    last = max(last, seq)
+                if done:
+                    return
+        finally:
+            session.detach()
     
     response = Response(generate(), mimetype='text/event-stream')
     response.headers['Cache-Control'] = 'no-cache'
     response.headers['X-Accel-Buffering'] = 'no'
+    response.headers['X-Stream-Session'] = session.id
+    
+    return response
+
+
+# Largest image /api/render draws, in pixels
+MAX_RENDER_WIDTH = 4096
+
+def render_options(options):
+    # Validated SvgRenderer options; raises ValueError
+    width = int(options.get('width', 600))
+    if not 16 <= width <= MAX_RENDER_WIDTH:
+        raise ValueError(f"width must be between 16 and {MAX_RENDER_WIDTH}")
+    label_threshold = options.get('label_threshold')
+    return {
+        'width_px': width,
+        'labels': bool(options.get('labels', True)),
+        'label_threshold': int(label_threshold) if label_threshold is not None else None,
+        'title': str(options['title']) if options.get('title') else None
+    }
+
+
+def place_cylinders(cylinders, data):
+    # Positions come with the cylinders (as in result.details.cylinders) or
+    # as [[id, x, y], ...] positions (as in stream frames)
+    for cyl, cyl_data in zip(cylinders, data.get('cylinders')):
+        if cyl_data.get('x') is not None and cyl_data.get('y') is not None:
+            cyl.set_position(float(cyl_data['x']), float(cyl_data['y']))
+    for cyl_id, x, y in data.get('positions') or []:
+        cylinders[int(cyl_id)].set_position(float(x), float(y))
+
+
+@api_bp.route('/render', methods=['POST'])
+def render():
+    """
+    Draw a placed solution as SVG
+
+    Body: container and cylinders as for /solve, with x and y on the placed
+    cylinders or a positions list of [id, x, y], and optional options
+    {'width', 'labels', 'label_threshold', 'title'}.
+
+    Images are cached by a hash of the layout and options (see
+    get_render_cache), which is also their ETag; Location points at
+    GET /api/render/<hash>, which serves the cached image to <img> tags.
+    A miss is streamed while it is drawn.
+    """
+    data = request.json or {}
+    try:
+        container, cylinders = parse_problem(data)
+        place_cylinders(cylinders, data)
+        options = render_options(data.get('options', {}))
+    except (KeyError, TypeError, ValueError, IndexError) as e:
+        return jsonify({'success': False, 'error': f'Bad render request: {e}'}), 400
+    
+    key = layout_fingerprint(container, cylinders, options)
+    if request.if_none_match.contains(key):
+        return svg_headers(Response(status=304), key)
+    
+    cache = get_render_cache()
+    hit = cache.get(key) if cache is not None else None
+    if hit is not None:
+        response = svg_headers(Response(hit[0]['svg'], mimetype='image/svg+xml'), key)
+        response.headers['X-Cache'] = 'HIT'
+        return response
+    
+    renderer = SvgRenderer(container, cylinders, **options)
+    
+    def generate():
+        chunks = []
+        for chunk in renderer.iter_svg():
+            chunks.append(chunk)
+            yield chunk
+        # Only complete images are cached
+        if cache is not None:
+            cache.put(key, {'svg': ''.join(chunks)})
     
-    return response
\ No newline at end of file
+    response = svg_headers(Response(generate(), mimetype='image/svg+xml'), key)
+    response.headers['X-Cache'] = 'MISS' if cache is not None else 'BYPASS'
+    return response
+
+
+@api_bp.route('/render/<key>', methods=['GET'])
+def cached_render(key):
+    if request.if_none_match.contains(key):
+        return svg_headers(Response(status=304), key)
+    cache = get_render_cache()
+    hit = cache.get(key) if cache is not None else None
+    if hit is None:
+        return jsonify({'success': False, 'error': 'Unknown image, POST the layout to /api/render'}), 404
+    response = svg_headers(Response(hit[0]['svg'], mimetype='image/svg+xml'), key)
+    response.headers['X-Cache'] = 'HIT'
+    return response
+
+
+def svg_headers(response, key):
+    # The key is a hash of everything drawn, so the image never changes
+    response.set_etag(key)
+    response.headers['Location'] = f'/api/render/{key}'
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
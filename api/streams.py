@@ -0,0 +1,178 @@
+import threading
+import time
+import uuid
+from collections import deque
+
+class TooManyStreams(Exception):
+    pass
+
+
+class StreamSession:
+    """
+    One streamed solve, running in its own thread
+
+    Events produced by the solver get increasing sequence numbers and go
+    into a bounded buffer, so a client that reconnects with the last id it
+    saw picks up where it left off. The newest event carrying a layout is
+    kept aside as well: if a reconnect falls behind the buffer, it still
+    gets the current best layout before the buffered events.
+
+    The run is cancelled once no client has been attached for
+    resume_grace seconds, or straight away by cancel().
+    """
+    def __init__(self, session_id, buffer_size=256, resume_grace=5.0):
+        self.id = session_id
+        self.resume_grace = resume_grace
+        self.events = deque(maxlen=buffer_size)
+        self.last_layout = None
+        self.next_seq = 0
+        self.finished = False
+        self.cancelled = False
+        self.finished_at = None
+        self.clients = 0
+        self.detached_at = time.monotonic()
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def start(self, frames):
+        # frames: iterable of event dicts; it is closed if the run is cancelled
+        self.thread = threading.Thread(target=self._run, args=(frames,), name=f'solve-stream-{self.id[:8]}',
+                                       daemon=True)
+        self.thread.start()
+
+    def publish(self, event):
+        with self.condition:
+            seq = self.next_seq
+            self.next_seq += 1
+            self.events.append((seq, event))
+            if event.get('solution'):
+                self.last_layout = (seq, event)
+            self.condition.notify_all()
+
+    def cancel(self):
+        with self.condition:
+            self.cancelled = True
+            self.condition.notify_all()
+
+    def should_stop(self):
+        with self.condition:
+            if self.cancelled:
+                return True
+            if self.clients == 0 and time.monotonic() - self.detached_at > self.resume_grace:
+                self.cancelled = True
+                return True
+            return False
+
+    def attach(self):
+        with self.condition:
+            self.clients += 1
+
+    def detach(self):
+        with self.condition:
+            self.clients -= 1
+            if self.clients == 0:
+                self.detached_at = time.monotonic()
+
+    def read(self, after, timeout):
+        """
+        Wait for events newer than sequence number `after`
+
+        Returns:
+            (events, done): list of (seq, event) pairs, and whether the
+            session has finished and nothing newer will come
+        """
+        with self.condition:
+            if self.next_seq - 1 <= after and not self.finished:
+                self.condition.wait(timeout)
+
+            pending = [(seq, event) for seq, event in self.events if seq > after]
+            oldest = pending[0][0] if pending else self.next_seq
+            if oldest > after + 1 and self.last_layout is not None \
+                    and after < self.last_layout[0] < oldest:
+                # Events were dropped from the buffer; resend the best layout
+                pending.insert(0, self.last_layout)
+
+            done = self.finished and (not pending or pending[-1][0] == self.next_seq - 1)
+            return pending, done
+
+    def _run(self, frames):
+        try:
+            for event in frames:
+                self.publish(event)
+                if self.should_stop():
+                    self.publish({'type': 'cancelled'})
+                    break
+        except Exception as e:
+            self.publish({'type': 'error', 'error': str(e)})
+        finally:
+            close = getattr(frames, 'close', None)
+            if close is not None:
+                close()
+            with self.condition:
+                self.finished = True
+                self.finished_at = time.monotonic()
+                self.condition.notify_all()
+
+
+class StreamSessions:
+    """
+    Registry of streamed solves
+
+    At most max_sessions may run at once; start() raises TooManyStreams
+    beyond that. Finished sessions stay available for late reconnects for
+    `retention` seconds.
+    """
+    def __init__(self, max_sessions=8, buffer_size=256, resume_grace=5.0, retention=60.0):
+        self.max_sessions = max_sessions
+        self.buffer_size = buffer_size
+        self.resume_grace = resume_grace
+        self.retention = retention
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def start(self, frames):
+        with self.lock:
+            self._sweep()
+            running = sum(1 for session in self.sessions.values() if not session.finished)
+            if running >= self.max_sessions:
+                raise TooManyStreams(f"{running} streams are already running")
+            session = StreamSession(uuid.uuid4().hex, self.buffer_size, self.resume_grace)
+            self.sessions[session.id] = session
+        session.start(frames)
+        return session
+
+    def get(self, session_id):
+        with self.lock:
+            return self.sessions.get(session_id)
+
+    def running(self):
+        with self.lock:
+            return sum(1 for session in self.sessions.values() if not session.finished)
+
+    def _sweep(self):
+        # Caller holds the lock
+        now = time.monotonic()
+        expired = [session_id for session_id, session in self.sessions.items()
+                   if session.finished and now - session.finished_at > self.retention]
+        for session_id in expired:
+            del self.sessions[session_id]
+
+
+def format_event_id(session_id, seq):
+    return f"{session_id}:{seq}"
+
+
+def parse_event_id(event_id):
+    """
+    Split a Last-Event-ID value into (session_id, seq)
+
+    Returns:
+        (session_id, seq), or (None, None) if it is not one of ours
+    """
+    if not event_id or ':' not in event_id:
+        return None, None
+    session_id, seq = event_id.rsplit(':', 1)
+    try:
+        return session_id, int(seq)
+    except ValueError:
+        return None, None
@@ -0,0 +1,253 @@
+"""
+Benchmark harness - warmup, repeats, fixed seeds, JSON results, comparison
+
+Every timed call is preceded by random.seed(seed), an untimed setup and a
+garbage collection, so each repeat does exactly the same work and the
+spread only measures noise.
+"""
+import gc
+import json
+import math
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+
+
+class Benchmark:
+    def __init__(self, name, run, setup=None, group='micro', warmup=2, repeats=10, seed=0, params=None):
+        """
+        Args:
+            name: Unique name, e.g. "calculate_fitness[reference/instance_01]"
+            run: Callable timed on every repeat; receives setup's return value
+            setup: Optional untimed callable run before every call
+            group: 'micro' or 'macro'
+            warmup: Untimed calls before measuring
+            repeats: Timed calls
+            seed: Seed for the global random module before each setup
+            params: Extra information stored with the result
+        """
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.group = group
+        self.warmup = warmup
+        self.repeats = repeats
+        self.seed = seed
+        self.params = params or {}
+
+    def measure(self):
+        samples = []
+        for i in range(self.warmup + self.repeats):
+            random.seed(self.seed)
+            state = self.setup() if self.setup is not None else None
+            # Garbage left by setup or earlier repeats should not be collected mid-measurement
+            gc.collect()
+
+            start = time.perf_counter()
+            self.run(state)
+            elapsed = time.perf_counter() - start
+
+            if i >= self.warmup:
+                samples.append(elapsed)
+
+        return {
+            'group': self.group,
+            'params': self.params,
+            'seed': self.seed,
+            'warmup': self.warmup,
+            'stats': summarize(samples),
+            'samples': samples
+        }
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    quartiles = statistics.quantiles(ordered, n=4) if len(ordered) >= 2 else [ordered[0]] * 3
+    return {
+        'median': statistics.median(ordered),
+        'mean': statistics.fmean(ordered),
+        'stdev': statistics.stdev(ordered) if len(ordered) >= 2 else 0.0,
+        'min': ordered[0],
+        'max': ordered[-1],
+        'iqr': quartiles[2] - quartiles[0],
+        'count': len(ordered)
+    }
+
+
+def run_benchmarks(benchmarks, pattern=None, verbose=True):
+    """
+    Run benchmarks (optionally only names matching a regex)
+
+    Returns:
+        JSON-ready dict with meta and per-benchmark results
+    """
+    results = {}
+    for benchmark in benchmarks:
+        if pattern and not re.search(pattern, benchmark.name):
+            continue
+
+        results[benchmark.name] = benchmark.measure()
+
+        if verbose:
+            stats = results[benchmark.name]['stats']
+            print(f"  {benchmark.name:<55} median {format_seconds(stats['median']):>10}  "
+                  f"iqr {format_seconds(stats['iqr']):>10}  (n={stats['count']})")
+
+    return {'meta': environment(), 'results': results}
+
+
+def environment():
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(results, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_results(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def mann_whitney_greater(baseline, current):
+    """
+    One-sided Mann-Whitney U test that `current` tends to be slower
+
+    Uses the normal approximation with tie and continuity corrections,
+    which is adequate from about 5 samples per side. No assumption is made
+    about the shape of the timing distributions.
+
+    Returns:
+        p-value (small means current is significantly larger)
+    """
+    n_a, n_b = len(baseline), len(current)
+    if n_a == 0 or n_b == 0:
+        return 1.0
+
+    combined = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    n = len(combined)
+
+    # Average ranks over ties
+    ranks = [0.0] * n
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = rank
+        t = j - i + 1
+        tie_term += t ** 3 - t
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, side) in zip(ranks, combined) if side == 1)
+    u = rank_sum - n_b * (n_b + 1) / 2
+
+    mean = n_a * n_b / 2
+    variance = n_a * n_b / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_results(baseline, current, alpha=0.01, threshold=0.1):
+    """
+    Compare two result files benchmark by benchmark
+
+    A benchmark is flagged 'slower' only if the slowdown is both
+    statistically significant (p < alpha) and larger than `threshold`
+    (relative change of the median); 'faster' is the mirror image.
+
+    Returns:
+        List of dicts (name, status, ratio, p_slower, p_faster)
+    """
+    rows = []
+    base_results = baseline['results']
+    current_results = current['results']
+
+    for name in sorted(set(base_results) | set(current_results)):
+        if name not in current_results:
+            rows.append({'name': name, 'status': 'missing', 'ratio': None, 'p_slower': None, 'p_faster': None})
+            continue
+        if name not in base_results:
+            rows.append({'name': name, 'status': 'new', 'ratio': None, 'p_slower': None, 'p_faster': None})
+            continue
+
+        base_samples = base_results[name]['samples']
+        current_samples = current_results[name]['samples']
+        ratio = statistics.median(current_samples) / statistics.median(base_samples)
+        p_slower = mann_whitney_greater(base_samples, current_samples)
+        p_faster = mann_whitney_greater(current_samples, base_samples)
+
+        if p_slower < alpha and ratio > 1 + threshold:
+            status = 'slower'
+        elif p_faster < alpha and ratio < 1 - threshold:
+            status = 'faster'
+        else:
+            status = 'unchanged'
+
+        rows.append({'name': name, 'status': status, 'ratio': ratio, 'p_slower': p_slower, 'p_faster': p_faster})
+
+    return rows
+
+
+def environment_differences(baseline, current):
+    # Timings are only comparable between runs on the same interpreter and machine
+    keys = ('python', 'implementation', 'platform', 'machine', 'cpu_count')
+    base_meta = baseline.get('meta', {})
+    current_meta = current.get('meta', {})
+    return [
+        f"{key}: {base_meta.get(key)} -> {current_meta.get(key)}"
+        for key in keys if base_meta.get(key) != current_meta.get(key)
+    ]
+
+
+def print_comparison(rows):
+    for row in rows:
+        if row['ratio'] is None:
+            print(f"  {row['name']:<55} {row['status']}")
+            continue
+        marker = {'slower': '!!', 'faster': '++'}.get(row['status'], '  ')
+        p = row['p_slower'] if row['status'] == 'slower' else row['p_faster'] if row['status'] == 'faster' \
+            else min(row['p_slower'], row['p_faster'])
+        print(f"{marker}{row['name']:<55} x{row['ratio']:.3f}  p={p:.4f}  {row['status']}")
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.3f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f}ms"
+    return f"{seconds * 1e6:.1f}us"
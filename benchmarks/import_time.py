@@ -0,0 +1,126 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Entry point -> import budget in milliseconds (cumulative time of the
+# module as reported by -X importtime, best of several cold starts).
+# api.routes is mostly Flask itself.
+BUDGETS_MS = {
+    'utils': 50,
+    'solvers': 60,
+    'main': 60,
+    'scripts.solve_instances': 60,
+    'scripts.batch_solve': 100,
+    'api.routes': 250
+}
+
+# Heavy modules that must stay unloaded until they are actually used
+HEAVY = ('numpy', 'matplotlib')
+SOLVE_ONLY = HEAVY + ('multiprocessing', 'algorithms.local_search', 'algorithms.branch_and_bound',
+                      'solvers.portfolio')
+FORBIDDEN = {
+    'utils': HEAVY,
+    'solvers': SOLVE_ONLY,
+    'main': SOLVE_ONLY,
+    'scripts.solve_instances': HEAVY + ('algorithms.local_search', 'solvers.portfolio'),
+    'scripts.batch_solve': HEAVY + ('algorithms.local_search', 'solvers.portfolio'),
+    'api.routes': SOLVE_ONLY
+}
+
+
+def parse_importtime(stderr):
+    """
+    Parse the output of python -X importtime
+
+    Returns:
+        dict mapping module name to cumulative import time in microseconds
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            # The header line
+            continue
+        times[parts[2].strip()] = cumulative
+    return times
+
+
+def measure_import(module, repeats=5):
+    """
+    Import a module in fresh interpreters
+
+    Returns:
+        (best cumulative milliseconds, set of all modules it loaded)
+    """
+    best = None
+    loaded = set()
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=ROOT, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"importing {module} failed:\n{completed.stderr}")
+        times = parse_importtime(completed.stderr)
+        loaded = set(times)
+        ms = times[module] / 1000.0
+        best = ms if best is None else min(best, ms)
+    return best, loaded
+
+
+def check_imports(budgets=BUDGETS_MS, repeats=5, scale=1.0):
+    """
+    Measure every entry point against its budget
+
+    Returns:
+        list of dicts with module, ms, budget_ms, heavy (forbidden modules
+        that got loaded) and ok
+    """
+    rows = []
+    for module, budget in budgets.items():
+        ms, loaded = measure_import(module, repeats)
+        heavy = sorted(name for name in FORBIDDEN.get(module, ()) if name in loaded)
+        rows.append({
+            'module': module,
+            'ms': ms,
+            'budget_ms': budget * scale,
+            'heavy': heavy,
+            'ok': ms <= budget * scale and not heavy
+        })
+    return rows
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Check cold import times of the entry points against budgets")
+    parser.add_argument('--repeats', type=int, default=5, help="Cold starts per entry point (the best one counts)")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiply every budget, e.g. for slow CI machines")
+    parser.add_argument('modules', nargs='*', help="Only check these entry points")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    budgets = {m: b for m, b in BUDGETS_MS.items() if not args.modules or m in args.modules}
+
+    rows = check_imports(budgets, args.repeats, args.scale)
+    print(f"{'entry point':<26} {'import':>10} {'budget':>10}  status")
+    for row in rows:
+        status = 'ok' if row['ok'] else 'OVER BUDGET' if not row['heavy'] else f"loads {', '.join(row['heavy'])}"
+        print(f"{row['module']:<26} {row['ms']:>8.1f}ms {row['budget_ms']:>8.1f}ms  {status}")
+
+    failed = [row['module'] for row in rows if not row['ok']]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
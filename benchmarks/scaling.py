@@ -0,0 +1,183 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+import copy
+import json
+import math
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from models import DNA
+from algorithms import GreedyPlacer
+from utils import check_all_constraints
+from utils.generator import generate_instance, FAMILIES, TIGHTNESS
+from benchmarks.harness import git_revision
+
+DEFAULT_SIZES = [10, 30, 100, 300, 1000, 3000, 10000]
+
+
+def largest_first_order(cylinders):
+    return sorted(range(len(cylinders)), key=lambda i: -cylinders[i].diameter)
+
+
+# tracemalloc slows placement down several times; only trace when it fits the budget
+TRACE_OVERHEAD = 10
+
+
+def measure_size(n, family, tightness, seed, step_size, budget, repeats):
+    """
+    Measure one point of a scaling curve
+
+    Placement and full fitness evaluations are timed untraced, until
+    `repeats` evaluations are done or the budget is spent. Peak memory comes
+    from one extra placement under tracemalloc, skipped (None) when that
+    would blow the budget.
+
+    Returns:
+        dict with the measurements for this size
+    """
+    start = time.perf_counter()
+    container, cylinders = generate_instance(n, family, tightness, seed=seed)
+    generate_seconds = time.perf_counter() - start
+
+    placer = GreedyPlacer(step_size=step_size)
+    order = largest_first_order(cylinders)
+
+    start = time.perf_counter()
+    placed = [copy.deepcopy(c) for c in cylinders]
+    success = placer.place_cylinders(placed, order, container)
+    placement_seconds = time.perf_counter() - start
+    spent = placement_seconds
+
+    start = time.perf_counter()
+    valid, _ = check_all_constraints(placed, container)
+    constraint_seconds = time.perf_counter() - start
+
+    # Full fitness evaluations, as the GA runs them
+    dna = DNA(n)
+    dna.genes = order
+    timings = []
+    while len(timings) < repeats and spent + placement_seconds <= budget:
+        start = time.perf_counter()
+        dna.calculate_fitness(cylinders, container, placer)
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        spent += elapsed
+
+    evaluation_seconds = statistics.median(timings) if timings else placement_seconds
+
+    peak_memory = None
+    if spent + placement_seconds * TRACE_OVERHEAD <= budget:
+        tracemalloc.start()
+        traced = [copy.deepcopy(c) for c in cylinders]
+        placer.place_cylinders(traced, order, container)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        'n': n,
+        'status': 'ok',
+        'generate_seconds': generate_seconds,
+        'placement_seconds': placement_seconds,
+        'evaluation_seconds': evaluation_seconds,
+        'evaluations_per_second': 1.0 / evaluation_seconds if evaluation_seconds > 0 else None,
+        'evaluations_timed': len(timings),
+        'constraint_seconds': constraint_seconds,
+        'peak_memory_bytes': peak_memory,
+        'placed': bool(success),
+        'valid': bool(success and valid),
+        'container': [container.width, container.depth]
+    }
+
+
+def predict_seconds(points, n):
+    # Extrapolate placement time from the last two measured sizes (power law)
+    if not points:
+        return 0.0
+    if len(points) == 1:
+        n0, t0 = points[0]
+        return t0 * (n / n0) ** 3
+    (n0, t0), (n1, t1) = points[-2], points[-1]
+    if t0 <= 0 or t1 <= 0 or n1 == n0:
+        return t1 * (n / n1) ** 3
+    exponent = max(1.0, math.log(t1 / t0) / math.log(n1 / n0))
+    return t1 * (n / n1) ** exponent
+
+
+def run_curve(family, tightness, sizes, seed, step_size, budget, repeats, verbose=True):
+    rows = []
+    points = []
+    for n in sizes:
+        predicted = predict_seconds(points, n)
+        if predicted > budget:
+            rows.append({'n': n, 'status': 'skipped', 'predicted_seconds': predicted})
+            if verbose:
+                print(f"  n={n:>6}: skipped (predicted {predicted:.1f}s > budget {budget}s)")
+            continue
+
+        row = measure_size(n, family, tightness, seed + n, step_size, budget, repeats)
+        rows.append(row)
+        points.append((n, row['placement_seconds']))
+
+        if verbose:
+            memory = 'n/a' if row['peak_memory_bytes'] is None else f"{row['peak_memory_bytes'] / 1024:.0f} KiB"
+            print(f"  n={n:>6}: place {row['placement_seconds']:.4f}s, "
+                  f"{row['evaluations_per_second']:.2f} evals/s, "
+                  f"check {row['constraint_seconds']:.4f}s, "
+                  f"peak {memory}, valid {row['valid']}")
+    return rows
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure how placement and evaluation scale with n")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--families', nargs='+', default=list(FAMILIES), choices=FAMILIES)
+    parser.add_argument('--tightness', nargs='+', default=list(TIGHTNESS), choices=list(TIGHTNESS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--step-size', type=float, default=0.5)
+    parser.add_argument('--budget', type=float, default=30.0,
+                        help="Seconds per size; sizes predicted to exceed it are skipped")
+    parser.add_argument('--repeats', type=int, default=5, help="Timed evaluations per size")
+    parser.add_argument('--output', default='benchmarks/results/scaling.json')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    result = {
+        'benchmark': 'scaling',
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'step_size': args.step_size,
+            'budget': args.budget,
+            'repeats': args.repeats
+        },
+        'curves': {}
+    }
+
+    for family in args.families:
+        for tightness in args.tightness:
+            name = f"{family}_{tightness}"
+            print(f"{name}:")
+            result['curves'][name] = run_curve(
+                family, tightness, args.sizes, args.seed, args.step_size, args.budget, args.repeats
+            )
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+import copy
+import glob
+from models import DNA, Population
+from algorithms import (
+    GreedyPlacer,
+    GreedyAlgorithm,
+    hill_climbing,
+    simulated_annealing,
+    iterated_local_search
+)
+from solvers import CargoPackingSolver
+from utils import load_instance_from_file, check_all_constraints
+from benchmarks.harness import (
+    Benchmark,
+    run_benchmarks,
+    save_results,
+    load_results,
+    compare_results,
+    environment_differences,
+    print_comparison
+)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+STEP_SIZE = 0.3
+POPULATION_SIZE = 50
+
+
+def bundled_instances(categories=('reference', 'challenging')):
+    instances = []
+    for category in categories:
+        for path in sorted(glob.glob(os.path.join(DATA_DIR, category, 'instance_*.txt'))):
+            name = f"{category}/{os.path.splitext(os.path.basename(path))[0]}"
+            container, cylinders = load_instance_from_file(path)
+            instances.append((name, container, cylinders))
+    return instances
+
+
+def instance_benchmarks(name, container, cylinders, seed, micro_repeats, macro_repeats):
+    placer = GreedyPlacer(step_size=STEP_SIZE)
+    n = len(cylinders)
+    params = {'instance': name, 'cylinders': n, 'step_size': STEP_SIZE}
+
+    # A placed greedy layout for the constraint check
+    greedy = GreedyAlgorithm(cylinders, container, placer).solve(verbose=False)
+    placed = [copy.deepcopy(c) for c in cylinders]
+    placer.place_cylinders(placed, greedy.genes, container)
+
+    def random_dna():
+        dna = DNA(n)
+        dna.calculate_fitness(cylinders, container, placer)
+        return dna
+
+    def fresh_placement():
+        return [copy.deepcopy(c) for c in cylinders], DNA(n).genes
+
+    def population():
+        pop = Population(POPULATION_SIZE, n, 0.05, cylinders, container, placer)
+        pop.calculate_fitness()
+        pop.normalize_fitness()
+        return pop
+
+    def ga_events():
+        solver = CargoPackingSolver(container, cylinders, population_size=POPULATION_SIZE,
+                                    mutation_rate=0.05, step_size=STEP_SIZE)
+        events = solver.iter_solve(max_generations=sys.maxsize)
+        # Skip the 'start' event so each run is exactly one generation
+        next(events)
+        return events
+
+    def ga_run(_):
+        solver = CargoPackingSolver(container, cylinders, population_size=POPULATION_SIZE,
+                                    mutation_rate=0.05, step_size=STEP_SIZE)
+        solver.solve(max_generations=10, verbose=False)
+
+    micro = dict(group='micro', warmup=3, repeats=micro_repeats, seed=seed, params=params)
+    macro = dict(group='macro', warmup=1, repeats=macro_repeats, seed=seed, params=params)
+
+    return [
+        Benchmark(f"place_cylinders[{name}]",
+                  lambda state: placer.place_cylinders(state[0], state[1], container),
+                  setup=fresh_placement, **micro),
+        Benchmark(f"calculate_fitness[{name}]",
+                  lambda dna: dna.calculate_fitness(cylinders, container, placer),
+                  setup=lambda: DNA(n), **micro),
+        Benchmark(f"check_all_constraints[{name}]",
+                  lambda _: check_all_constraints(placed, container), **micro),
+        Benchmark(f"reproduce[{name}]",
+                  lambda pop: pop.reproduce(),
+                  setup=population, **micro),
+        Benchmark(f"ga_generation[{name}]", next, setup=ga_events, **macro),
+        Benchmark(f"ga_10_generations[{name}]", ga_run, **macro),
+        Benchmark(f"hill_climbing[{name}]",
+                  lambda dna: hill_climbing(dna, cylinders, container, placer),
+                  setup=random_dna, **macro),
+        Benchmark(f"simulated_annealing[{name}]",
+                  lambda dna: simulated_annealing(dna, cylinders, container, placer),
+                  setup=random_dna, **macro),
+        Benchmark(f"iterated_local_search[{name}]",
+                  lambda dna: iterated_local_search(dna, cylinders, container, placer),
+                  setup=random_dna, **macro)
+    ]
+
+
+def build_suite(seed=0, micro_repeats=20, macro_repeats=5, categories=('reference', 'challenging')):
+    benchmarks = []
+    for name, container, cylinders in bundled_instances(categories):
+        benchmarks.extend(instance_benchmarks(name, container, cylinders, seed, micro_repeats, macro_repeats))
+    return benchmarks
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite for the packing solvers")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Run the suite and write JSON results")
+    run.add_argument('--output', default='benchmarks/results/latest.json')
+    run.add_argument('--filter', help="Only run benchmarks whose name matches this regex")
+    run.add_argument('--seed', type=int, default=0)
+    run.add_argument('--micro-repeats', type=int, default=20)
+    run.add_argument('--macro-repeats', type=int, default=5)
+    run.add_argument('--categories', nargs='+', default=['reference', 'challenging'])
+
+    compare = commands.add_parser('compare', help="Compare two result files")
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--alpha', type=float, default=0.01, help="Significance level")
+    compare.add_argument('--threshold', type=float, default=0.1,
+                         help="Ignore changes of the median smaller than this fraction")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.command == 'run':
+        benchmarks = build_suite(args.seed, args.micro_repeats, args.macro_repeats, args.categories)
+        print(f"Running {len(benchmarks)} benchmarks" + (f" matching '{args.filter}'" if args.filter else ""))
+        results = run_benchmarks(benchmarks, pattern=args.filter)
+        save_results(results, args.output)
+        print(f"\nResults saved to {args.output}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    differences = environment_differences(baseline, current)
+    if differences:
+        print("Warning: results come from different environments")
+        for difference in differences:
+            print(f"  {difference}")
+        print()
+
+    rows = compare_results(baseline, current, alpha=args.alpha, threshold=args.threshold)
+    print_comparison(rows)
+
+    slower = [row['name'] for row in rows if row['status'] == 'slower']
+    print(f"\n{len(slower)} significant slowdown(s)")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
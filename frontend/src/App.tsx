@@ -1,11 +1,13 @@
-import { useState } from 'react'
+import { useRef, useState } from 'react'
 import axios from 'axios'
 import './App.css'
-import type { Container, Cylinder, Solution, ProgressUpdate, Algorithm } from './types'
+import type { Container, Cylinder, Solution, ProgressUpdate, StreamCylinder, Algorithm } from './types'
 import SolutionVisualization from './components/SolutionVisualization'
 import PresetSelector from './components/PresetSelector'
+import { expandColumnarSolution } from './utils/fileParser'
 
 const API_URL = 'http://127.0.0.1:5000/api'
+const MAX_STREAM_RETRIES = 3
 
 function App() {
   const [container, setContainer] = useState<Container>({
@@ -27,13 +29,14 @@ function App() {
   const [progress, setProgress] = useState<ProgressUpdate | null>(null)
   const [selectedPreset, setSelectedPreset] = useState<string>('custom')
   const [abortController, setAbortController] = useState<AbortController | null>(null)
+  const streamSessionRef = useRef<string | null>(null)
 
   const [advancedSettings, setAdvancedSettings] = useState({
     population_size: 100,
     mutation_rate: 0.05,
     max_generations: 200,
     step_size: 0.3,
-    animation_delay: 0.02,
+    frame_interval: 0.1,
     use_local_search: true
   })
 
@@ -87,6 +90,11 @@ function App() {
   }
 
   const stopSolving = () => {
+    if (streamSessionRef.current) {
+      // Stop the server-side run now instead of after the resume grace period
+      fetch(`${API_URL}/solve-stream/${streamSessionRef.current}`, { method: 'DELETE' }).catch(() => {})
+      streamSessionRef.current = null
+    }
     if (abortController) {
       abortController.abort()
       setAbortController(null)
@@ -120,11 +128,14 @@ function App() {
         params: {
           ...advancedSettings,
           strategy: 'largest_first',
-          num_trials: 1000
+          num_trials: 1000,
+          time_limit: 10,
+          response_format: 'columnar'
         }
       })
 
       if (response.data.success) {
+        response.data.result = expandColumnarSolution(response.data.result, cylinders)
         setSolution(response.data.result)
         addLog(`Solution found! Fitness: ${response.data.result.fitness.toFixed(2)}`)
         addLog(`Valid: ${response.data.result.details.valid ? 'Yes' : 'No'}`)
@@ -152,114 +163,168 @@ function App() {
     addLog(`Cylinders: ${cylinders.length}`)
     addLog(`Population: ${advancedSettings.population_size}, Mutation: ${advancedSettings.mutation_rate}, Generations: ${advancedSettings.max_generations}`)
 
-    try {
-      const response = await fetch(`${API_URL}/solve-stream`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          container,
-          cylinders,
-          params: advancedSettings
-        }),
-        signal: controller.signal
-      })
-
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`)
+    let streamCylinders: Record<number, StreamCylinder> = {}
+    // Frames are throttled, so log the first frame at or past every 50th generation
+    let nextLogGeneration = 0
+    // The server keeps the run going for a few seconds after a dropped
+    // connection; reconnecting with the last event id resumes it
+    let lastEventId: string | null = null
+    let retries = 0
+    // Set by an 'error' event: the solve failed on the server
+    let failed = false
+
+    const handleEvent = (data: any) => {
+      if (data.type === 'start') {
+        streamCylinders = {}
+        for (const cyl of data.cylinders as StreamCylinder[]) {
+          streamCylinders[cyl.id] = cyl
+        }
+        addLog(`Evolution starting: ${data.total_generations} generations`)
       }
+      else if (data.type === 'progress') {
+        const update = data as ProgressUpdate
+        setProgress({
+          generation: update.generation,
+          best_fitness: update.best_fitness,
+          avg_fitness: update.avg_fitness,
+          worst_fitness: update.worst_fitness
+        })
+
+        // Frames without a solution mean the best layout is unchanged
+        if (update.solution && update.solution.positions.length > 0) {
+          setSolution({
+            algorithm: `Genetic Algorithm (Gen ${update.generation})`,
+            solution: update.solution.placement_order,
+            fitness: update.solution.fitness,
+            details: {
+              valid: update.solution.fitness > 0,
+              center_of_mass: update.solution.center_of_mass,
+              packing_density: update.solution.packing_density,
+              cylinders: update.solution.positions.map(([id, x, y]) => ({ ...streamCylinders[id], x, y }))
+            }
+          })
+        }
 
-      if (!response.body) {
-        throw new Error('No response body')
+        if (update.generation >= nextLogGeneration) {
+          nextLogGeneration = (Math.floor(update.generation / 50) + 1) * 50
+          addLog(`Gen ${data.generation}: best=${data.best_fitness.toFixed(2)}, avg=${data.avg_fitness.toFixed(2)}`)
+        }
+      }
+      else if (data.type === 'complete') {
+        setSolution({
+          algorithm: 'Genetic Algorithm (Final)',
+          solution: data.solution.placement_order,
+          fitness: data.solution.fitness,
+          details: data.solution
+        })
+        addLog(`Final solution! Fitness: ${data.solution.fitness.toFixed(2)}`)
+        addLog(`Valid: ${data.solution.valid ? 'Yes' : 'No'}`)
+        addLog(`Packing density: ${(data.solution.packing_density * 100).toFixed(2)}%`)
       }
+      else if (data.type === 'cancelled') {
+        addLog('Evolution cancelled')
+      }
+      else if (data.type === 'error') {
+        failed = true
+        addLog(`ERROR: Solve failed: ${data.error}`)
+      }
+    }
 
-      const reader = response.body.getReader()
-      const decoder = new TextDecoder()
-      let buffer = ''
+    while (true) {
+      try {
+        const headers: Record<string, string> = {
+          'Content-Type': 'application/json',
+        }
+        if (lastEventId) {
+          headers['Last-Event-ID'] = lastEventId
+        }
 
-      const processChunk = async (): Promise<void> => {
-        const { done, value } = await reader.read()
-        
-        if (done) {
-          setSolving(false)
-          setAbortController(null)
-          addLog('Evolution complete!')
-          return
+        const response = await fetch(`${API_URL}/solve-stream`, {
+          method: 'POST',
+          headers,
+          body: JSON.stringify({
+            container,
+            cylinders,
+            params: advancedSettings
+          }),
+          signal: controller.signal
+        })
+
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`)
         }
 
-        buffer += decoder.decode(value, { stream: true })
-        const lines = buffer.split('\n\n')
-        buffer = lines.pop() || ''
+        if (!response.body) {
+          throw new Error('No response body')
+        }
 
-        for (const line of lines) {
-          if (line.startsWith('data: ')) {
-            try {
-              const data = JSON.parse(line.slice(6))
+        streamSessionRef.current = response.headers.get('X-Stream-Session')
 
-              if (data.type === 'start') {
-                addLog(`Evolution starting: ${data.total_generations} generations`)
-              }
-              else if (data.type === 'progress') {
-                setProgress({
-                  generation: data.generation,
-                  best_fitness: data.best_fitness,
-                  avg_fitness: data.avg_fitness,
-                  worst_fitness: data.worst_fitness
-                })
-
-                if (data.solution && data.solution.cylinders && data.solution.cylinders.length > 0) {
-                  setSolution({
-                    algorithm: `Genetic Algorithm (Gen ${data.generation})`,
-                    solution: data.solution.placement_order,
-                    fitness: data.best_fitness,
-                    details: {
-                      valid: data.best_fitness > 0,
-                      center_of_mass: data.solution.center_of_mass,
-                      packing_density: data.solution.packing_density,
-                      cylinders: data.solution.cylinders
-                    }
-                  })
-                }
-
-                if (data.generation % 50 === 0) {
-                  addLog(`Gen ${data.generation}: best=${data.best_fitness.toFixed(2)}, avg=${data.avg_fitness.toFixed(2)}`)
-                }
-              }
-              else if (data.type === 'complete') {
-                setSolution({
-                  algorithm: 'Genetic Algorithm (Final)',
-                  solution: data.solution.placement_order,
-                  fitness: data.solution.fitness,
-                  details: data.solution
-                })
-                addLog(`Final solution! Fitness: ${data.solution.fitness.toFixed(2)}`)
-                addLog(`Valid: ${data.solution.valid ? 'Yes' : 'No'}`)
-                addLog(`Packing density: ${(data.solution.packing_density * 100).toFixed(2)}%`)
-                setSolving(false)
-                setAbortController(null)
-                return
+        const reader = response.body.getReader()
+        const decoder = new TextDecoder()
+        let buffer = ''
+
+        while (true) {
+          const { done, value } = await reader.read()
+          if (done) {
+            break
+          }
+
+          buffer += decoder.decode(value, { stream: true })
+          const blocks = buffer.split('\n\n')
+          buffer = blocks.pop() || ''
+
+          for (const block of blocks) {
+            let data: string | null = null
+            for (const line of block.split('\n')) {
+              if (line.startsWith('id: ')) {
+                lastEventId = line.slice(4)
+              } else if (line.startsWith('data: ')) {
+                data = line.slice(6)
               }
+            }
+            if (data === null) {
+              continue
+            }
+            try {
+              handleEvent(JSON.parse(data))
             } catch (e) {
               console.error('Error parsing SSE:', e)
             }
+            if (failed) {
+              break
+            }
+          }
+          if (failed) {
+            await reader.cancel()
+            break
           }
         }
 
-        return processChunk()
-      }
-
-      await processChunk()
-    } catch (error: any) {
-      if (error.name === 'AbortError') {
-        addLog('Algorithm stopped by user')
-      } else {
+        if (!failed) {
+          addLog('Evolution complete!')
+        }
+        break
+      } catch (error: any) {
+        if (error.name === 'AbortError') {
+          addLog('Algorithm stopped by user')
+          break
+        }
+        if (lastEventId && retries < MAX_STREAM_RETRIES) {
+          retries += 1
+          addLog(`Connection lost, resuming (attempt ${retries})...`)
+          await new Promise(resolve => setTimeout(resolve, 1000))
+          continue
+        }
         console.error('Stream error:', error)
         addLog('ERROR: Streaming failed')
+        break
       }
-      setSolving(false)
-      setAbortController(null)
     }
+
+    streamSessionRef.current = null
+    setSolving(false)
+    setAbortController(null)
   }
 
   return (
@@ -275,6 +340,7 @@ function App() {
             <option value="genetic">Genetic Algorithm</option>
             <option value="greedy">Greedy Algorithm</option>
             <option value="random">Random Search</option>
+            <option value="portfolio">Portfolio (parallel race)</option>
           </select>
 
           <div className="preset-group">
@@ -42,7 +42,15 @@ export default function SolutionVisualization({
   )
 }
 
-function SVGContent({ container, cylinders, centerOfMass, colors, padding }: any) {
+interface SVGContentProps {
+  container: Container
+  cylinders: PlacedCylinder[]
+  centerOfMass: [number, number]
+  colors: string[]
+  padding: number
+}
+
+function SVGContent({ container, cylinders, centerOfMass, colors, padding }: SVGContentProps) {
   const canvasWidth = 800
   const canvasHeight = 600
   
@@ -98,6 +106,11 @@ function SVGContent({ container, cylinders, centerOfMass, colors, padding }: any
       </text>
 
       {cylinders.map((cyl, idx) => {
+        // Unplaced cylinders have no position and are not drawn; idx still
+        // counts them so every cylinder keeps its color
+        if (cyl.x == null || cyl.y == null) {
+          return null
+        }
         const cx = toScreenX(cyl.x)
         const cy = toScreenY(cyl.y)
         const r = toScreenDist(cyl.radius)
@@ -11,8 +11,9 @@ export interface Container {
   
   export interface PlacedCylinder {
     id: number
-    x: number
-    y: number
+    // null for cylinders that were not placed
+    x: number | null
+    y: number | null
     diameter: number
     radius: number
     weight: number
@@ -31,6 +32,35 @@ export interface Container {
     fitness: number
     details: SolutionDetails
     generation_history?: GenerationStats[]
+    profile?: Record<string, PhaseTiming>
+  }
+  
+  // params.response_format = 'columnar': parallel arrays instead of lists of objects
+  export interface CylinderColumns {
+    id: number[]
+    x: (number | null)[]
+    y: (number | null)[]
+  }
+  
+  export interface HistoryColumns {
+    generation: number[]
+    best: number[]
+    avg: number[]
+    worst?: number[]
+    // Generations before downsampling
+    total: number
+  }
+  
+  export interface ColumnarSolution extends Omit<Solution, 'details' | 'generation_history'> {
+    format: 'columnar'
+    details: Omit<SolutionDetails, 'cylinders'> & { columns: CylinderColumns }
+    history?: HistoryColumns
+  }
+  
+  export interface PhaseTiming {
+    seconds: number
+    calls: number
+    percent: number
   }
   
   export interface GenerationStats {
@@ -45,12 +75,22 @@ export interface Container {
     best_fitness: number
     avg_fitness: number
     worst_fitness?: number
+    // Only present when the best solution improved since the previous frame
     solution?: {
       placement_order: number[]
-      cylinders: PlacedCylinder[]
+      fitness: number
+      // [id, x, y] of each placed cylinder; sizes come from the start event
+      positions: [number, number, number][]
       center_of_mass: [number, number]
       packing_density: number
-    }
+    } | null
+  }
+  
+  export interface StreamCylinder {
+    id: number
+    diameter: number
+    radius: number
+    weight: number
   }
   
-  export type Algorithm = 'genetic' | 'greedy' | 'random'
\ No newline at end of file
+  export type Algorithm = 'genetic' | 'greedy' | 'random' | 'portfolio'
\ No newline at end of file
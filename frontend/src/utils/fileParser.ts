@@ -1,4 +1,4 @@
-import type { Container, Cylinder } from '../types'
+import type { Container, Cylinder, ColumnarSolution, GenerationStats, Solution } from '../types'
 
 export interface ParsedInstance {
   container: Container
@@ -36,4 +36,41 @@ export function parseInstanceFile(text: string): ParsedInstance | null {
   }
 
   return { container, cylinders }
-}
\ No newline at end of file
+}
+
+// Rebuilds a regular Solution from a columnar API result, taking sizes and
+// weights from the cylinders that were sent with the request
+export function expandColumnarSolution(result: Solution | ColumnarSolution, cylinders: Cylinder[]): Solution {
+  if (!('format' in result) || result.format !== 'columnar') {
+    return result as Solution
+  }
+
+  const { format: _format, history, details, ...rest } = result
+  const { columns, ...detailFields } = details
+
+  const placed = columns.id.map((id, i) => ({
+    id,
+    // null stays null: unplaced cylinders come back exactly as in the full encoding
+    x: columns.x[i],
+    y: columns.y[i],
+    diameter: cylinders[id].diameter,
+    radius: cylinders[id].diameter / 2,
+    weight: cylinders[id].weight
+  }))
+
+  let generation_history: GenerationStats[] | undefined
+  if (history) {
+    generation_history = history.generation.map((generation, i) => ({
+      generation,
+      best: history.best[i],
+      avg: history.avg[i],
+      worst: history.worst ? history.worst[i] : undefined
+    }))
+  }
+
+  return {
+    ...rest,
+    details: { ...detailFields, cylinders: placed },
+    generation_history
+  }
+}
@@ -1,6 +1,6 @@
+import sys
 from models import Container, Cylinder
 from solvers import CargoPackingSolver
-from tests.test_instances import get_all_test_instances
 
 def load_instance_from_dict(data):
     container = Container(
@@ -20,7 +20,7 @@ def load_instance_from_dict(data):
     return container, cylinders
 
 
-def run_instance(instance_data):
+def run_instance(instance_data, profile=False):
     print(f"\nTesting {instance_data['name']}...")
     
     container, cylinders = load_instance_from_dict(instance_data)
@@ -34,7 +34,8 @@ def run_instance(instance_data):
         cylinders=cylinders,
         population_size=params['population_size'],
         mutation_rate=params['mutation_rate'],
-        step_size=params['step_size']
+        step_size=params['step_size'],
+        profile=profile
     )
     
     best_solution = solver.solve(
@@ -47,16 +48,18 @@ def run_instance(instance_data):
     return solver
 
 
-def run_all_examples():
+def run_all_examples(profile=False):
     print("=" * 60)
     print("CARGO PACKING GENETIC ALGORITHM - TEST INSTANCES")
     print("=" * 60)
     
+    from tests.test_instances import get_all_test_instances
+    
     instances = get_all_test_instances()
     solvers = []
     
     for instance in instances:
-        solver = run_instance(instance)
+        solver = run_instance(instance, profile=profile)
         solvers.append(solver)
     
     print("\nAll tests completed!")
@@ -64,4 +67,5 @@ def run_all_examples():
 
 
 if __name__ == "__main__":
-    run_all_examples()
\ No newline at end of file
+    # --profile prints where each run spent its time
+    run_all_examples(profile='--profile' in sys.argv[1:])
\ No newline at end of file
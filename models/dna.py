@@ -2,20 +2,27 @@ import random
 import copy
 
 class DNA:
-    def __init__(self, num_cylinders):
-        # Initialize DNA with a random permutation of cylinder indices
+    def __init__(self, num_cylinders, rng=random):
+        # Initialize DNA with a random permutation of cylinder indices.
+        # rng is a random.Random (or the random module itself); solvers pass
+        # their own so concurrent seeded runs do not share one stream
         self.num_cylinders = num_cylinders
         self.genes = list(range(num_cylinders))
-        random.shuffle(self.genes)
+        rng.shuffle(self.genes)
         self.fitness = 0
     
-    def calculate_fitness(self, cylinders, container, placer):
-        # Calculate fitness based on placement success and quality
-        from utils.helpers import (
-            check_all_constraints,
-            calculate_packing_density,
-            calculate_center_of_mass
-        )
+    def calculate_fitness(self, cylinders, container, placer, cache=None, profiler=None):
+        # Calculate fitness based on placement success and quality.
+        # With a FitnessCache, orders equivalent to one already seen are not re-placed
+        if profiler is not None:
+            self._calculate_fitness_profiled(cylinders, container, placer, cache, profiler)
+            return
+        
+        if cache is not None:
+            fitness = cache.get(self.genes)
+            if fitness is not None:
+                self.fitness = fitness
+                return
         
         cylinder_copies = [copy.deepcopy(c) for c in cylinders]
         
@@ -23,34 +30,90 @@ class DNA:
         
         if not success:
             self.fitness = 0
-            return
+        else:
+            self.fitness = DNA.score_placement(cylinder_copies, container)
         
-        is_valid, error_msg = check_all_constraints(cylinder_copies, container)
+        if cache is not None:
+            cache.put(self.genes, self.fitness)
+    
+    def _calculate_fitness_profiled(self, cylinders, container, placer, cache, profiler):
+        # Same steps as calculate_fitness, timed per phase (PhaseProfiler)
+        from utils.helpers import check_all_constraints
+        clock = profiler.clock
+        
+        if cache is not None:
+            start = clock()
+            fitness = cache.get(self.genes)
+            profiler.add('cache', clock() - start)
+            if fitness is not None:
+                self.fitness = fitness
+                return
+        
+        start = clock()
+        cylinder_copies = [copy.deepcopy(c) for c in cylinders]
+        placed = clock()
+        profiler.add('deepcopy', placed - start)
+        
+        success = placer.place_cylinders(cylinder_copies, self.genes, container)
+        checked = clock()
+        profiler.add('placement', checked - placed)
+        
+        self.fitness = 0
+        if success:
+            is_valid, _ = check_all_constraints(cylinder_copies, container)
+            scored = clock()
+            profiler.add('constraints', scored - checked)
+            if is_valid:
+                self.fitness = DNA.score_valid_placement(cylinder_copies, container)
+                profiler.add('scoring', clock() - scored)
+        
+        if cache is not None:
+            start = clock()
+            cache.put(self.genes, self.fitness)
+            profiler.add('cache', clock() - start, calls=0)
+    
+    @staticmethod
+    def score_placement(cylinders, container):
+        # Score cylinders that have already been placed (0 if any constraint fails)
+        from utils.helpers import check_all_constraints
+        
+        is_valid, error_msg = check_all_constraints(cylinders, container)
         
         if not is_valid:
-            self.fitness = 0
-            return
+            return 0
         
-        self.fitness = 10000
+        return DNA.score_valid_placement(cylinders, container)
+    
+    @staticmethod
+    def score_valid_placement(cylinders, container):
+        # Fitness of a placement already known to satisfy every constraint
+        from utils.helpers import (
+            calculate_packing_density,
+            calculate_center_of_mass
+        )
+        
+        fitness = 10000
         
-        density = calculate_packing_density(cylinder_copies, container)
-        self.fitness += density * 1000
+        density = calculate_packing_density(cylinders, container)
+        fitness += density * 1000
         
-        center_x, center_y = calculate_center_of_mass(cylinder_copies)
+        center_x, center_y = calculate_center_of_mass(cylinders)
         container_center_x = container.width / 2
         container_center_y = container.depth / 2
         
         dx = abs(center_x - container_center_x) / container.width
         dy = abs(center_y - container_center_y) / container.depth
         centeredness = 1 - (dx + dy) / 2
-        self.fitness += centeredness * 500
+        fitness += centeredness * 500
+        
+        return fitness
     
-    def crossover(self, partner):
+    def crossover(self, partner, rng=random):
         # Create a child DNA by combining genes from self and partner
-        child = DNA(self.num_cylinders)
+        child = DNA(self.num_cylinders, rng)
         
-        start = random.randint(0, self.num_cylinders - 1)
-        end = random.randint(start + 1, self.num_cylinders)
+        start = rng.randint(0, self.num_cylinders - 1)
+        end = rng.randint(start + 1, self.num_cylinders)
         
         child.genes = [-1] * self.num_cylinders
         child.genes[start:end] = self.genes[start:end]
@@ -63,10 +126,10 @@ class DNA:
         
         return child
     
-    def mutate(self, mutation_rate):
+    def mutate(self, mutation_rate, rng=random):
         for i in range(len(self.genes)):
-            if random.random() < mutation_rate:
-                j = random.randint(0, len(self.genes) - 1)
+            if rng.random() < mutation_rate:
+                j = rng.randint(0, len(self.genes) - 1)
                 self.genes[i], self.genes[j] = self.genes[j], self.genes[i]
     
     def copy(self):
@@ -1,22 +1,72 @@
 import random
 from models.dna import DNA
+from utils.canonical import FitnessCache
 
 class Population:
-    def __init__(self, size, num_cylinders, mutation_rate, cylinders, container, placer):
+    def __init__(self, size, num_cylinders, mutation_rate, cylinders, container, placer, rng=random):
         self.size = size
         self.mutation_rate = mutation_rate
         self.cylinders = cylinders
         self.container = container
         self.placer = placer
         self.generation = 0
+        # Shared by every generation, so repeated or equivalent orders are evaluated once
+        self.cache = FitnessCache(cylinders)
+        # Optional PhaseProfiler (utils.profiler); None keeps the hot paths untimed
+        self.profiler = None
+        # Source of every random choice the GA makes (see DNA)
+        self.rng = rng
         
         self.population = []
         for i in range(size):
-            self.population.append(DNA(num_cylinders))
+            self.population.append(DNA(num_cylinders, rng))
+    
+    def seed(self, orders, fraction=0.2):
+        """
+        Replace part of the random population with known orders
+
+        The first len(orders) slots get the orders as-is, the rest of the
+        seeded share gets mutated variants of them.
+
+        Args:
+            orders: List of placement orders (permutations of cylinder indices)
+            fraction: Share of the population to seed (0-1)
+
+        Returns:
+            Number of individuals replaced
+        """
+        num_cylinders = len(self.cylinders)
+        for order in orders:
+            if sorted(order) != list(range(num_cylinders)):
+                raise ValueError(f"Seed order {order} is not a permutation of {num_cylinders} cylinders")
+        
+        # Greedy strategies often agree, keep each distinct order once
+        orders = [list(order) for order in dict.fromkeys(tuple(order) for order in orders)]
+        
+        if not orders:
+            return 0
+        
+        num_seeded = min(self.size, int(round(self.size * fraction)))
+        
+        for k in range(num_seeded):
+            dna = DNA(num_cylinders, self.rng)
+            dna.genes = list(orders[k % len(orders)])
+            if k >= len(orders):
+                self._perturb(dna)
+            self.population[k] = dna
+        
+        return num_seeded
+    
+    def _perturb(self, dna):
+        # A few random swaps: close enough to keep the seed's structure
+        for _ in range(self.rng.randint(1, 3)):
+            i = self.rng.randint(0, len(dna.genes) - 1)
+            j = self.rng.randint(0, len(dna.genes) - 1)
+            dna.genes[i], dna.genes[j] = dna.genes[j], dna.genes[i]
     
     def calculate_fitness(self):
         for individual in self.population:
-            individual.calculate_fitness(self.cylinders, self.container, self.placer)
+            individual.calculate_fitness(self.cylinders, self.container, self.placer, self.cache, self.profiler)
     
     def normalize_fitness(self):
         # Convert raw fitness scores to percentages
@@ -32,7 +82,7 @@ class Population:
     def selection(self):
         # Relay race
         index = 0
-        start = random.random()
+        start = self.rng.random()
         
         while start > 0 and index < len(self.population):
             start -= self.population[index].fitness
@@ -44,20 +94,55 @@ class Population:
         return self.population[index]
     
     def reproduce(self):
+        if self.profiler is not None:
+            self._reproduce_profiled()
+            return
+        
         new_population = []
         
         for i in range(self.size):
             parent_a = self.selection()
             parent_b = self.selection()
             
-            child = parent_a.crossover(parent_b)
-            child.mutate(self.mutation_rate)
+            child = parent_a.crossover(parent_b, self.rng)
+            child.mutate(self.mutation_rate, self.rng)
             
             new_population.append(child)
         
         self.population = new_population
         self.generation += 1
     
+    def _reproduce_profiled(self):
+        # Same as reproduce, timing selection, crossover and mutation separately
+        profiler = self.profiler
+        clock = profiler.clock
+        selection = crossover = mutation = 0.0
+        new_population = []
+        
+        for i in range(self.size):
+            start = clock()
+            parent_a = self.selection()
+            parent_b = self.selection()
+            selected = clock()
+            
+            child = parent_a.crossover(parent_b, self.rng)
+            crossed = clock()
+            
+            child.mutate(self.mutation_rate, self.rng)
+            mutated = clock()
+            
+            selection += selected - start
+            crossover += crossed - selected
+            mutation += mutated - crossed
+            new_population.append(child)
+        
+        profiler.add('selection', selection, calls=2 * self.size)
+        profiler.add('crossover', crossover, calls=self.size)
+        profiler.add('mutation', mutation, calls=self.size)
+        
+        self.population = new_population
+        self.generation += 1
+    
     def evolve(self):
         self.calculate_fitness()
         self.normalize_fitness()
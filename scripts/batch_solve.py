@@ -0,0 +1,329 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+import csv
+import glob
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from utils import (
+    load_instance_from_file,
+    load_solution_from_file,
+    iter_instances_from_file,
+    SolutionStreamWriter,
+    SolutionStore
+)
+from scripts.solve_instances import solve_instance, solve_instance_from_file
+
+# Inputs with this extension hold many instances ("instance <name>" sections)
+MULTI_INSTANCE_EXTENSION = '.instances'
+
+SUMMARY_FIELDS = ['instance', 'output', 'status', 'fitness', 'seconds', 'message']
+
+
+def solution_path_for(instance_path, output_dir):
+    # data/<category>/<name>.txt -> <output_dir>/<category>/<name>_solution.txt
+    category = os.path.basename(os.path.dirname(os.path.abspath(instance_path)))
+    name = os.path.splitext(os.path.basename(instance_path))[0]
+    return os.path.join(output_dir, category, f'{name}_solution.txt')
+
+
+def skip_reason(instance_path, output_path, store, target_fitness, skip_existing):
+    """
+    Decide whether an instance needs solving at all
+
+    The existing solution is kept if it is at least as good as the target
+    fitness and as the best order in the solution store.
+    """
+    if not os.path.exists(output_path):
+        return None
+
+    existing = load_solution_from_file(output_path)['fitness']
+    if existing is None:
+        return None
+
+    bars = []
+    if target_fitness is not None:
+        bars.append(target_fitness)
+    if store is not None:
+        container, cylinders = load_instance_from_file(instance_path)
+        hit = store.lookup(container, cylinders)
+        if hit is not None:
+            # Saved files round fitness to 2 decimals
+            bars.append(round(hit['fitness'], 2))
+
+    if bars and existing >= max(bars):
+        return f"existing fitness {existing:.2f} is as good as the store/target"
+    if not bars and skip_existing:
+        return "solution exists"
+    return None
+
+
+def solve_one(instance_path, output_path, options):
+    # Runs in a worker process; only a small summary travels back
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        store = SolutionStore(options['store']) if options['store'] else None
+        solver = solve_instance_from_file(
+            instance_path,
+            output_path,
+            population_size=options['population_size'],
+            mutation_rate=options['mutation_rate'],
+            step_size=options['step_size'],
+            max_generations=options['max_generations'],
+            use_local_search=options['use_local_search'],
+            exact_threshold=options['exact_threshold'],
+            store=store,
+            profile=options['profile'],
+            verbose=False
+        )
+        status = 'solved' if solver is not None else 'failed'
+        fitness = solver.best_fitness if solver is not None else 0
+        profile = solver.profile_summary() if solver is not None else None
+        error = None
+    except Exception as e:
+        status = 'error'
+        fitness = 0
+        profile = None
+        error = str(e)
+
+    record = {
+        'instance': instance_path,
+        'output': output_path,
+        'status': status,
+        'fitness': fitness,
+        'seconds': time.perf_counter() - start,
+        'message': error
+    }
+    if profile is not None:
+        record['profile'] = profile
+    return record
+
+
+def solve_loaded(source, name, container, cylinders, options):
+    # Worker for one instance of a multi-instance file; the solution goes back
+    # to the parent, which appends it to the shared solutions file
+    start = time.perf_counter()
+    solution = None
+    details = None
+    profile = None
+    try:
+        store = SolutionStore(options['store']) if options['store'] else None
+        solver = solve_instance(
+            container,
+            cylinders,
+            population_size=options['population_size'],
+            mutation_rate=options['mutation_rate'],
+            step_size=options['step_size'],
+            max_generations=options['max_generations'],
+            use_local_search=options['use_local_search'],
+            exact_threshold=options['exact_threshold'],
+            store=store,
+            profile=options['profile'],
+            verbose=False
+        )
+        solution = solver.best_solution
+        profile = solver.profile_summary()
+        if solution is not None:
+            details = solver.get_solution_details(solution)
+        status = 'solved' if solution is not None else 'failed'
+        fitness = solver.best_fitness if solution is not None else 0
+        error = None
+    except Exception as e:
+        status = 'error'
+        fitness = 0
+        error = str(e)
+
+    record = {
+        'instance': f"{source}#{name}",
+        'output': None,
+        'status': status,
+        'fitness': fitness,
+        'seconds': time.perf_counter() - start,
+        'message': error
+    }
+    if profile is not None:
+        record['profile'] = profile
+    return record, (source, name, solution, details)
+
+
+def multi_output_path(instance_path, output_dir):
+    name = os.path.splitext(os.path.basename(instance_path))[0]
+    return os.path.join(output_dir, f'{name}_solutions.txt')
+
+
+class SummaryWriter:
+    # Appends one record per finished instance, flushed immediately (.csv or .jsonl)
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.csv = None
+        if path:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            self.file = open(path, 'w', newline='')
+            if path.endswith('.csv'):
+                # Nested fields such as 'profile' only go to .jsonl summaries
+                self.csv = csv.DictWriter(self.file, fieldnames=SUMMARY_FIELDS, extrasaction='ignore')
+                self.csv.writeheader()
+
+    def write(self, record):
+        if self.file is None:
+            return
+        if self.csv is not None:
+            self.csv.writerow(record)
+        else:
+            self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+
+def expand_inputs(patterns):
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches and os.path.isfile(pattern):
+            matches = [pattern]
+        paths.extend(matches)
+    # Keep the first occurrence of each file
+    return list(dict.fromkeys(paths))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many instance files in parallel")
+    parser.add_argument('inputs', nargs='+',
+                        help="Instance files or glob patterns (quote them); *.instances files hold many instances")
+    parser.add_argument('--output-dir', default='data/solutions', help="Where <category>/<name>_solution.txt files go")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument('--summary', help="Summary file, .csv or .jsonl, written as results arrive")
+    parser.add_argument('--store', help="SolutionStore file used for skipping and warm starts")
+    parser.add_argument('--target-fitness', type=float, help="Skip instances whose saved solution reaches this")
+    parser.add_argument('--skip-existing', action='store_true', help="Skip any instance that already has a solution")
+    parser.add_argument('--population-size', type=int, default=150)
+    parser.add_argument('--mutation-rate', type=float, default=0.05)
+    parser.add_argument('--step-size', type=float, default=0.3)
+    parser.add_argument('--max-generations', type=int, default=300)
+    parser.add_argument('--no-local-search', action='store_true')
+    parser.add_argument('--exact-threshold', type=int, default=10,
+                        help="Use branch and bound up to this many cylinders")
+    parser.add_argument('--profile', action='store_true',
+                        help="Record per-phase GA timings (printed, and kept in .jsonl summaries)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    instance_paths = expand_inputs(args.inputs)
+    if not instance_paths:
+        print("No instance files matched")
+        return 1
+
+    options = {
+        'population_size': args.population_size,
+        'mutation_rate': args.mutation_rate,
+        'step_size': args.step_size,
+        'max_generations': args.max_generations,
+        'use_local_search': not args.no_local_search,
+        'exact_threshold': args.exact_threshold,
+        'store': args.store,
+        'profile': args.profile
+    }
+    store = SolutionStore(args.store) if args.store else None
+    summary = SummaryWriter(args.summary)
+
+    print(f"Batch solving {len(instance_paths)} input files with {args.workers} workers")
+    print("-" * 60)
+
+    counts = {}
+    start = time.perf_counter()
+
+    writers = {}
+    pending = set()
+
+    def report(record):
+        counts[record['status']] = counts.get(record['status'], 0) + 1
+        summary.write(record)
+        detail = record['message'] or f"fitness {record['fitness']:.2f}"
+        print(f"{record['instance']}: {record['status']} in {record['seconds']:.2f}s ({detail})")
+        if record.get('profile'):
+            top = list(record['profile'].items())[:3]
+            print("    " + ", ".join(f"{phase} {p['percent']:.0f}%" for phase, p in top))
+
+    def collect(future):
+        pending.discard(future)
+        result = future.result()
+        if isinstance(result, tuple):
+            record, (source, name, solution, details) = result
+            writer = writers[source]
+            record['output'] = writer.filepath
+            if solution is not None:
+                writer.write(name, solution, solution.fitness, details)
+            report(record)
+        else:
+            report(result)
+
+    def submit(fn, *fn_args):
+        pending.add(pool.submit(fn, *fn_args))
+        # Report whatever has finished while the inputs are still being read
+        for future in [f for f in pending if f.done()]:
+            collect(future)
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for instance_path in instance_paths:
+                if instance_path.endswith(MULTI_INSTANCE_EXTENSION):
+                    # Instances are handed to the pool as they are parsed
+                    output_path = multi_output_path(instance_path, args.output_dir)
+                    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+                    writers[instance_path] = SolutionStreamWriter(output_path)
+                    for name, container, cylinders in iter_instances_from_file(instance_path, with_names=True):
+                        hit = store.lookup(container, cylinders) if store is not None else None
+                        if hit is not None and args.target_fitness is not None \
+                                and hit['fitness'] >= args.target_fitness:
+                            report({
+                                'instance': f"{instance_path}#{name}",
+                                'output': output_path,
+                                'status': 'skipped',
+                                'fitness': hit['fitness'],
+                                'seconds': 0.0,
+                                'message': "stored fitness reaches the target"
+                            })
+                            continue
+                        submit(solve_loaded, instance_path, name, container, cylinders, options)
+                    continue
+
+                output_path = solution_path_for(instance_path, args.output_dir)
+                reason = skip_reason(instance_path, output_path, store, args.target_fitness, args.skip_existing)
+                if reason:
+                    report({
+                        'instance': instance_path,
+                        'output': output_path,
+                        'status': 'skipped',
+                        'fitness': load_solution_from_file(output_path)['fitness'],
+                        'seconds': 0.0,
+                        'message': reason
+                    })
+                    continue
+                submit(solve_one, instance_path, output_path, options)
+
+            for future in as_completed(list(pending)):
+                collect(future)
+    finally:
+        summary.close()
+        for writer in writers.values():
+            writer.close()
+
+    print("-" * 60)
+    totals = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+    print(f"Done in {time.perf_counter() - start:.2f}s ({totals})")
+
+    return 0 if counts.get('error', 0) == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+from utils import text_to_binary, binary_to_text, is_binary_file
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Convert between the text and binary instance/solution formats"
+    )
+    parser.add_argument('input', help="Text instance file, or a binary file to convert back")
+    parser.add_argument('output', help="Binary file, or the text instance file when converting back")
+    parser.add_argument('--solution', help="Text solution to embed (text -> binary) "
+                                           "or where to write the solution (binary -> text)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if is_binary_file(args.input):
+        binary_to_text(args.input, args.output, solution_file=args.solution)
+        print(f"Wrote {args.output}" + (f" and {args.solution}" if args.solution else ""))
+    else:
+        text_to_binary(args.input, args.output, solution_file=args.solution)
+        print(f"Wrote {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+from utils import write_instances_to_file, save_binary
+from utils.generator import generate_suite, FAMILIES, TIGHTNESS
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic instance families")
+    parser.add_argument('output', help="Multi-instance file (*.instances), or a directory with --binary")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--families', nargs='+', default=list(FAMILIES), choices=FAMILIES)
+    parser.add_argument('--tightness', nargs='+', default=list(TIGHTNESS), choices=list(TIGHTNESS))
+    parser.add_argument('--feasible', action='store_true', help="Build every instance around a valid layout")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--binary', action='store_true', help="Write one binary file per instance")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    suite = generate_suite(args.sizes, args.families, args.tightness, feasible=args.feasible, seed=args.seed)
+
+    if args.binary:
+        os.makedirs(args.output, exist_ok=True)
+        count = 0
+        for name, container, cylinders in suite:
+            save_binary(os.path.join(args.output, f'{name}.bin'), container, cylinders)
+            count += 1
+        print(f"Wrote {count} binary instances to {args.output}/")
+    else:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        write_instances_to_file(args.output, suite)
+        print(f"Wrote {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,85 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from utils import load_instance_from_file, save_solution_to_file
+from utils import load_instance_from_file, save_solution_to_file, SolutionStore
 from solvers import CargoPackingSolver
+from algorithms import BranchAndBound
+
+STORE_PATH = "data/solutions/solutions.db"
+
+def solve_instance(container, cylinders,
+                   population_size=150, 
+                   mutation_rate=0.05, 
+                   step_size=0.3, 
+                   max_generations=500,
+                   use_local_search=True,
+                   exact_threshold=10,
+                   warm_start=True,
+                   previous_solution_files=None,
+                   store=None,
+                   checkpoint_path=None,
+                   checkpoint_interval=25,
+                   profile=False,
+                   verbose=True):
+    """
+    Solve one loaded instance with the right solver for its size
+    
+    With profile=True the GA records per-phase timings (see
+    CargoPackingSolver.profile_summary); the exact solver is not profiled.
+    
+    Returns:
+        CargoPackingSolver whose best_solution holds the answer (None if no
+        valid order was found)
+    """
+    # Branch and bound does not use the population, so it is not seeded
+    exact = len(cylinders) <= exact_threshold
+    solver = CargoPackingSolver(
+        container=container,
+        cylinders=cylinders,
+        population_size=population_size,
+        mutation_rate=mutation_rate,
+        step_size=step_size,
+        seed_greedy=warm_start and not exact,
+        solution_files=previous_solution_files if warm_start and not exact else None,
+        store=store,
+        profile=profile
+    )
+    if verbose:
+        for skipped in solver.skipped_seeds:
+            print(f"  Warning: skipped seed {skipped['source']}: {skipped['reason']}")
+    
+    if exact:
+        # Small manifests are searched exhaustively instead of running the GA
+        bnb = BranchAndBound(cylinders, container, solver.placer)
+        best_solution = bnb.solve(verbose=verbose)
+        solver.best_solution = best_solution
+        solver.best_fitness = bnb.best_fitness
+        if store is not None and best_solution:
+            store.put(container, cylinders, best_solution.genes, best_solution.fitness,
+                      params={'solver': 'branch_and_bound', 'step_size': step_size})
+    else:
+        # Long runs are checkpointed and resumed after a crash
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            if verbose:
+                print(f"Resuming from checkpoint: {checkpoint_path}")
+            solver, solve_args = CargoPackingSolver.load_checkpoint(checkpoint_path, profile=profile)
+            solver.store = store
+            solver.solve(verbose=verbose, checkpoint_path=checkpoint_path, **solve_args)
+        else:
+            solver.solve(
+                max_generations=max_generations, 
+                verbose=verbose,
+                use_local_search=use_local_search,
+                local_search_method='hill_climbing',
+                checkpoint_path=checkpoint_path,
+                checkpoint_interval=checkpoint_interval
+            )
+        
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+    
+    return solver
+
 
 def solve_instance_from_file(input_filepath, output_filepath, 
                              population_size=150, 
@@ -10,6 +87,11 @@ def solve_instance_from_file(input_filepath, output_filepath,
                              step_size=0.3, 
                              max_generations=500,
                              use_local_search=True,
+                             exact_threshold=10,
+                             warm_start=True,
+                             store=None,
+                             checkpoint_interval=25,
+                             profile=False,
                              verbose=True):
     if verbose:
         print(f"\nLoading instance: {input_filepath}")
@@ -20,20 +102,27 @@ def solve_instance_from_file(input_filepath, output_filepath,
         print(f"Container: {container}")
         print(f"Number of cylinders: {len(cylinders)}")
     
-    solver = CargoPackingSolver(
-        container=container,
-        cylinders=cylinders,
+    # Re-solving a manifest starts from the greedy orders and the previous solution
+    previous = [output_filepath] if os.path.exists(output_filepath) else None
+    
+    solver = solve_instance(
+        container,
+        cylinders,
         population_size=population_size,
         mutation_rate=mutation_rate,
-        step_size=step_size
-    )
-    
-    best_solution = solver.solve(
-        max_generations=max_generations, 
-        verbose=verbose,
+        step_size=step_size,
+        max_generations=max_generations,
         use_local_search=use_local_search,
-        local_search_method='hill_climbing'
+        exact_threshold=exact_threshold,
+        warm_start=warm_start,
+        previous_solution_files=previous,
+        store=store,
+        checkpoint_path=output_filepath + '.ckpt' if checkpoint_interval else None,
+        checkpoint_interval=checkpoint_interval,
+        profile=profile,
+        verbose=verbose
     )
+    best_solution = solver.best_solution
     
     if best_solution is None:
         print(f"FAILED: No valid solution found for {input_filepath}")
@@ -62,6 +151,7 @@ def solve_all_reference_instances():
     solutions_dir = "data/solutions/reference"
     
     os.makedirs(solutions_dir, exist_ok=True)
+    store = SolutionStore(STORE_PATH)
     
     instance_files = sorted([f for f in os.listdir(reference_dir) if f.endswith('.txt')])
     
@@ -78,6 +168,7 @@ def solve_all_reference_instances():
             mutation_rate=0.05,
             step_size=0.3,
             max_generations=300,
+            store=store,
             verbose=True
         )
         
@@ -108,6 +199,7 @@ def solve_all_challenging_instances():
     solutions_dir = "data/solutions/challenging"
     
     os.makedirs(solutions_dir, exist_ok=True)
+    store = SolutionStore(STORE_PATH)
     
     instance_files = sorted([f for f in os.listdir(challenging_dir) if f.endswith('.txt')])
     
@@ -124,6 +216,7 @@ def solve_all_challenging_instances():
             mutation_rate=0.1,
             step_size=0.2,
             max_generations=500,
+            store=store,
             verbose=True
         )
         
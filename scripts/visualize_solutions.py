@@ -1,17 +1,37 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
 from visualization import visualize_all_solutions, visualize_solution_from_files
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render every saved solution to a PNG")
+    parser.add_argument('--solutions-dir', default='data/solutions')
+    parser.add_argument('--output-dir', default='visualization/results')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument('--fast', action='store_true', help="Draw circles as one collection")
+    parser.add_argument('--label-threshold', type=int,
+                        help="Above this many cylinders, only label the ids of that many largest ones")
+    parser.add_argument('--force', action='store_true', help="Redraw images that are already up to date")
+    parser.add_argument('--show', action='store_true', help="Display each figure (renders serially)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    
     print("GENERATING SOLUTION VISUALIZATIONS")
     print("-" * 60)
     
     # Generate all visualizations
     visualize_all_solutions(
-        solutions_dir="data/solutions",
-        output_dir="visualization/results",
-        show=False  # Set to True to display each one
+        solutions_dir=args.solutions_dir,
+        output_dir=args.output_dir,
+        show=args.show,
+        workers=args.workers,
+        fast=args.fast,
+        label_threshold=args.label_threshold,
+        force=args.force
     )
     
     print("\n" + "-" * 60)
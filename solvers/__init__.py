@@ -1 +1,9 @@
-from .ga_solver import CargoPackingSolver
\ No newline at end of file
+from utils.lazy import lazy_exports
+
+from .ga_solver import CargoPackingSolver
+
+_LAZY = {
+    'PortfolioSolver': '.portfolio'
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -1,16 +1,28 @@
 import copy
-from models import Population
+import os
+import pickle
+import random
+import time
+import zlib
+from models import Population, DNA
 from algorithms import GreedyPlacer
-from utils import check_all_constraints, calculate_center_of_mass, calculate_packing_density
+from utils import check_all_constraints, calculate_center_of_mass, calculate_packing_density, load_solution_from_file
+from utils.profiler import PhaseProfiler
+from utils import metrics
 
 class CargoPackingSolver:
     # Genetic Algorithm for packing cylinders into a container
-    def __init__(self, container, cylinders, population_size=100, mutation_rate=0.01, step_size=0.5):
+    def __init__(self, container, cylinders, population_size=100, mutation_rate=0.01, step_size=0.5,
+                 initial_orders=None, seed_greedy=False, solution_files=None, seed_fraction=0.2,
+                 store=None, profile=False, rng=None):
         self.container = container
         self.cylinders = cylinders
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.placer = GreedyPlacer(step_size=step_size)
+        # A random.Random makes the run reproducible and independent of other
+        # threads; None uses the shared random module
+        self.rng = rng if rng is not None else random
         
         self.population = Population(
             size=population_size,
@@ -18,51 +30,227 @@ class CargoPackingSolver:
             mutation_rate=mutation_rate,
             cylinders=cylinders,
             container=container,
-            placer=self.placer
+            placer=self.placer,
+            rng=self.rng
         )
         
         self.best_solution = None
         self.best_fitness = 0
         self.generation_history = []
+        # Optional SolutionStore: exact hits are answered without running the GA
+        self.store = store
+        self.store_hit = None
+        # Generation the main loop starts from (non-zero after resuming a checkpoint)
+        self._start_generation = 0
+        self.checkpoint_stats = {'count': 0, 'total_seconds': 0.0, 'last_bytes': 0}
+        # With profile=True every generation records where its time went
+        self.profiler = PhaseProfiler() if profile else None
+        self.population.profiler = self.profiler
+        # Seed orders warm_start could not use, as {'source', 'reason'} dicts
+        self.skipped_seeds = []
+        
+        if initial_orders or seed_greedy or solution_files:
+            self.warm_start(
+                orders=initial_orders,
+                greedy=seed_greedy,
+                solution_files=solution_files,
+                fraction=seed_fraction
+            )
+    
+    def warm_start(self, orders=None, greedy=False, solution_files=None, fraction=0.2):
+        """
+        Seed part of the initial population instead of starting fully random
+
+        Orders that are not a permutation of the current cylinders (a stale
+        solution file of a manifest that changed since) are skipped and
+        recorded in skipped_seeds for the caller to report.
+
+        Args:
+            orders: Placement orders supplied by the caller
+            greedy: Add the orders of every GreedyAlgorithm strategy
+            solution_files: Saved solution files whose placement_order is reused
+            fraction: Share of the population to seed with these orders and mutated variants
+
+        Returns:
+            Number of individuals seeded
+        """
+        expected = list(range(len(self.cylinders)))
+        seeds = []
+        
+        for i, order in enumerate(orders or []):
+            if sorted(order) != expected:
+                self.skipped_seeds.append({
+                    'source': f"orders[{i}]",
+                    'reason': f"not a permutation of the {len(expected)} cylinders"
+                })
+                continue
+            seeds.append(list(order))
+        
+        for filepath in solution_files or []:
+            order = load_solution_from_file(filepath)['placement_order']
+            if order is None or sorted(order) != expected:
+                self.skipped_seeds.append({
+                    'source': filepath,
+                    'reason': f"placement order does not match the {len(expected)} cylinders"
+                })
+                continue
+            seeds.append(order)
+        
+        if greedy:
+            from algorithms import GreedyAlgorithm
+            results = GreedyAlgorithm(self.cylinders, self.container, self.placer).solve_all_strategies(verbose=False)
+            seeds.extend(result['solution'].genes for result in results.values())
+        
+        return self.population.seed(seeds, fraction)
     
-    def solve(self, max_generations=100, target_fitness=None, verbose=True,use_local_search=False, local_search_method='hill_climbing'):
+    def solve(self, max_generations=100, target_fitness=None, verbose=True,use_local_search=False, local_search_method='hill_climbing',
+              checkpoint_path=None, checkpoint_interval=10, time_limit=None, callback=None):
+        # Runs iter_solve to completion. callback(event) sees every event;
+        # verbose prints them. See iter_solve for the arguments and events.
+        events = self.iter_solve(
+            max_generations=max_generations,
+            target_fitness=target_fitness,
+            use_local_search=use_local_search,
+            local_search_method=local_search_method,
+            checkpoint_path=checkpoint_path,
+            checkpoint_interval=checkpoint_interval,
+            time_limit=time_limit
+        )
+        
+        for event in events:
+            if callback is not None:
+                callback(event)
+            if verbose:
+                self._print_event(event)
+        
+        return self.best_solution
+    
+    def iter_solve(self, max_generations=100, target_fitness=None, use_local_search=False,
+                   local_search_method='hill_climbing', checkpoint_path=None, checkpoint_interval=10,
+                   time_limit=None):
+        """
+        Run the GA as a generator of progress events
+
+        This is the only copy of the GA loop; solve(), the streaming API and
+        the benchmarks all consume it. Nothing is printed here. Closing the
+        generator early (or just not iterating further) stops the run
+        before the next generation.
+
+        Args:
+            max_generations: Last generation (exclusive) to run
+            target_fitness: Stop once the best fitness reaches this
+            use_local_search: Polish the best solution after the loop
+            local_search_method: 'hill_climbing' or 'simulated_annealing'
+            checkpoint_path: Save the full state here every checkpoint_interval
+                generations so resume() can continue the run
+            checkpoint_interval: Generations between checkpoints
+            time_limit: Stop after this many seconds (checked between generations)
+
+        Yields:
+            dicts with a 'type' key:
+            - start: generation, max_generations
+            - store_hit: fitness (an exact SolutionStore hit, the run ends)
+            - generation: generation, stats, improved, best_fitness, seconds
+            - checkpoint: generation, path, seconds, bytes
+            - local_search: method, before, after, seconds
+            - complete: reason ('max_generations', 'target', 'time_limit' or
+              'store'), best_fitness, generations
+        """
+        solve_args = {
+            'max_generations': max_generations,
+            'target_fitness': target_fitness,
+            'use_local_search': use_local_search,
+            'local_search_method': local_search_method,
+            'checkpoint_interval': checkpoint_interval,
+            'time_limit': time_limit
+        }
+        
+        if self.store is not None and self._answer_from_store():
+            yield {'type': 'store_hit', 'fitness': self.best_fitness}
+            yield {'type': 'complete', 'reason': 'store', 'best_fitness': self.best_fitness, 'generations': 0}
+            return
+        
+        profiler = self.profiler
+        clock = time.perf_counter
+        run_start = clock()
+        reason = 'max_generations'
+        
+        yield {'type': 'start', 'generation': self._start_generation, 'max_generations': max_generations}
+        
         # Main GA loop
-        for gen in range(max_generations):
+        for gen in range(self._start_generation, max_generations):
+            generation_start = clock()
+            cache = self.population.cache
+            hits, misses = cache.hits, cache.misses
+            
             self.population.calculate_fitness()
             
             stats = self.population.get_stats()
             self.generation_history.append(stats)
             
-            current_best = self.population.get_best()
+            # Every individual was just evaluated, no need to evaluate again
+            current_best = max(self.population.population, key=lambda ind: ind.fitness)
             
-            if current_best.fitness > 0 and (self.best_solution is None or current_best.fitness > self.best_fitness):
+            improved = current_best.fitness > 0 and (self.best_solution is None or current_best.fitness > self.best_fitness)
+            if improved:
                 self.best_solution = current_best.copy()
                 self.best_fitness = current_best.fitness
             
-            if verbose and gen % 10 == 0:
-                print(f"Generation {stats['generation']:3d}: best={stats['best']:8.2f}, avg={stats['avg']:8.2f}, worst={stats['worst']:8.2f}")
-            
             self.population.normalize_fitness()
             self.population.reproduce()
             
+            seconds = clock() - generation_start
+            placements = cache.misses - misses
+            metrics.record_generation(cache.hits - hits + placements, placements, seconds)
+            if profiler is not None:
+                stats['seconds'] = seconds
+                stats['phases'] = profiler.end_generation()
+            
+            yield {
+                'type': 'generation',
+                'generation': gen,
+                'stats': stats,
+                'improved': improved,
+                'best_fitness': self.best_fitness,
+                'seconds': seconds
+            }
+            
             if target_fitness and stats['best'] >= target_fitness:
-                if verbose:
-                    print(f"\nTarget fitness {target_fitness} reached at generation {gen}")
+                reason = 'target'
                 break
+            
+            if checkpoint_path and (gen + 1) % checkpoint_interval == 0:
+                start = clock()
+                self.save_checkpoint(checkpoint_path, gen + 1, solve_args)
+                elapsed = clock() - start
+                if profiler is not None:
+                    profiler.add('checkpoint', elapsed)
+                yield {
+                    'type': 'checkpoint',
+                    'generation': gen + 1,
+                    'path': checkpoint_path,
+                    'seconds': elapsed,
+                    'bytes': self.checkpoint_stats['last_bytes']
+                }
+            
+            if time_limit is not None and clock() - run_start >= time_limit:
+                reason = 'time_limit'
+                break
+        
         # Apply local search if specified
         if use_local_search and self.best_solution:
-            if verbose:
-                print(f"\nApplying local search ({local_search_method})...")
-        
             from algorithms import hill_climbing, simulated_annealing
-        
+            
+            before = self.best_fitness
+            start = clock()
+            
             if local_search_method == 'hill_climbing':
                 self.best_solution = hill_climbing(
                     self.best_solution, 
                     self.cylinders, 
                     self.container, 
                     self.placer, 
-                    verbose=verbose
+                    cache=self.population.cache
                 )
             elif local_search_method == 'simulated_annealing':
                 self.best_solution = simulated_annealing(
@@ -70,10 +258,194 @@ class CargoPackingSolver:
                     self.cylinders,
                     self.container,
                     self.placer,
-                    verbose=verbose
+                    cache=self.population.cache,
+                    rng=self.rng
                 )
             self.best_fitness = self.best_solution.fitness
-        return self.best_solution
+            
+            elapsed = clock() - start
+            if profiler is not None:
+                profiler.add('local_search', elapsed)
+            yield {
+                'type': 'local_search',
+                'method': local_search_method,
+                'before': before,
+                'after': self.best_fitness,
+                'seconds': elapsed
+            }
+        
+        if self.store is not None and self.best_solution:
+            self.store.put(self.container, self.cylinders, self.best_solution.genes, self.best_fitness, params={
+                'population_size': self.population_size,
+                'mutation_rate': self.mutation_rate,
+                'step_size': self.placer.step_size,
+                'max_generations': max_generations,
+                'use_local_search': use_local_search
+            })
+        
+        yield {
+            'type': 'complete',
+            'reason': reason,
+            'best_fitness': self.best_fitness,
+            'generations': len(self.generation_history)
+        }
+    
+    def _print_event(self, event):
+        # Console output for solve(verbose=True)
+        kind = event['type']
+        
+        if kind == 'store_hit':
+            print(f"Answered from solution store (fitness {event['fitness']:.2f})")
+        
+        elif kind == 'generation':
+            stats = event['stats']
+            if event['generation'] % 10 == 0:
+                print(f"Generation {stats['generation']:3d}: best={stats['best']:8.2f}, avg={stats['avg']:8.2f}, worst={stats['worst']:8.2f}")
+        
+        elif kind == 'local_search':
+            print(f"\nApplying local search ({event['method']})...")
+            improvement = event['after'] - event['before']
+            print(f"Local search complete: {event['before']:.2f} -> {event['after']:.2f} (improvement: {improvement:.2f})")
+        
+        elif kind == 'complete':
+            if event['reason'] == 'target':
+                print(f"\nTarget fitness reached at generation {event['generations'] - 1}")
+            elif event['reason'] == 'time_limit':
+                print(f"\nTime limit reached after {event['generations']} generations")
+            
+            if self.checkpoint_stats['count']:
+                cs = self.checkpoint_stats
+                print(f"Checkpoints: {cs['count']} written, {cs['total_seconds'] * 1000:.1f}ms total, "
+                      f"last one {cs['last_bytes']} bytes")
+            
+            if self.profiler is not None and event['reason'] != 'store':
+                print("\nProfile:")
+                print(self.profiler.format_summary())
+    
+    def save_checkpoint(self, path, next_generation, solve_args):
+        """
+        Write the complete solver state to a compressed file
+
+        The write goes to a temporary file first, so a crash mid-write
+        leaves the previous checkpoint intact.
+        """
+        start = time.perf_counter()
+        
+        state = {
+            'container': self.container,
+            'cylinders': self.cylinders,
+            'population_size': self.population_size,
+            'mutation_rate': self.mutation_rate,
+            'step_size': self.placer.step_size,
+            'genes': [ind.genes for ind in self.population.population],
+            'generation': self.population.generation,
+            'next_generation': next_generation,
+            'best_genes': self.best_solution.genes if self.best_solution else None,
+            'best_fitness': self.best_fitness,
+            'generation_history': self.generation_history,
+            'random_state': self.rng.getstate(),
+            'private_rng': self.rng is not random,
+            'profile': self.profiler is not None,
+            'solve_args': solve_args
+        }
+        data = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        
+        self.checkpoint_stats['count'] += 1
+        self.checkpoint_stats['total_seconds'] += time.perf_counter() - start
+        self.checkpoint_stats['last_bytes'] = len(data)
+    
+    @classmethod
+    def load_checkpoint(cls, path, profile=None):
+        # Rebuild a solver from a checkpoint; returns (solver, solve_args).
+        # profile=None profiles if the checkpointed run did.
+        with open(path, 'rb') as f:
+            state = pickle.loads(zlib.decompress(f.read()))
+        if profile is None:
+            profile = state.get('profile', False)
+        
+        solver = cls(
+            container=state['container'],
+            cylinders=state['cylinders'],
+            population_size=state['population_size'],
+            mutation_rate=state['mutation_rate'],
+            step_size=state['step_size'],
+            profile=profile,
+            rng=random.Random() if state.get('private_rng') else None
+        )
+        
+        for ind, genes in zip(solver.population.population, state['genes']):
+            ind.genes = genes
+        solver.population.generation = state['generation']
+        
+        if state['best_genes'] is not None:
+            solver.best_solution = DNA(len(solver.cylinders))
+            solver.best_solution.genes = state['best_genes']
+            solver.best_solution.fitness = state['best_fitness']
+        solver.best_fitness = state['best_fitness']
+        solver.generation_history = state['generation_history']
+        solver._start_generation = state['next_generation']
+        
+        # Restored last: building the population above consumed random numbers
+        solver.rng.setstate(state['random_state'])
+        
+        return solver, state['solve_args']
+    
+    @classmethod
+    def resume(cls, path, verbose=True, checkpoint=True):
+        """
+        Continue a run from its checkpoint exactly where it stopped
+
+        Args:
+            path: Checkpoint file written by solve(checkpoint_path=...)
+            verbose: Print progress
+            checkpoint: Keep writing checkpoints to the same file
+
+        Returns:
+            The resumed solver (best answer in solver.best_solution)
+        """
+        solver, solve_args = cls.load_checkpoint(path)
+        solver.solve(verbose=verbose, checkpoint_path=path if checkpoint else None, **solve_args)
+        return solver
+    
+    def _answer_from_store(self):
+        # An exact hit is reused if it is still valid with this placer. Otherwise
+        # (or on a near hit) the stored orders seed the population.
+        hit = self.store.lookup(self.container, self.cylinders)
+        
+        if hit is not None:
+            dna = DNA(len(self.cylinders))
+            dna.genes = hit['placement_order']
+            dna.calculate_fitness(self.cylinders, self.container, self.placer, self.population.cache)
+            if dna.fitness > 0:
+                self.best_solution = dna
+                self.best_fitness = dna.fitness
+                self.store_hit = 'exact'
+                return True
+            seeds = [hit['placement_order']]
+        else:
+            seeds = self.store.lookup_near(self.container, self.cylinders)
+        
+        if seeds:
+            self.warm_start(orders=seeds)
+            self.store_hit = 'near'
+        return False
+    
+    def profile_summary(self):
+        """
+        Per-phase totals for the run so far
+
+        Returns:
+            dict as returned by PhaseProfiler.summary, or None when the
+            solver was created without profile=True
+        """
+        if self.profiler is None:
+            return None
+        return self.profiler.summary()
     
     def get_solution_details(self, dna):
         # Get detailed info about a solution DNA 
@@ -0,0 +1,289 @@
+import multiprocessing
+import queue
+import random
+import sys
+import time
+from models import DNA
+from algorithms import (
+    GreedyPlacer,
+    GreedyAlgorithm,
+    RandomSearch,
+    BranchAndBound,
+    iterated_local_search
+)
+
+DEFAULT_MEMBERS = ('greedy', 'random_search', 'genetic', 'local_search', 'branch_and_bound')
+
+# Members poll the stop flag; they are only killed if they ignore it this long
+STOP_GRACE_SECONDS = 5.0
+
+# Lock wait when reading the incumbent after a member had to be killed
+LOCK_TIMEOUT_SECONDS = 1.0
+
+
+def portfolio_members(num_cylinders, members=DEFAULT_MEMBERS, exact_threshold=10):
+    # The members that actually run, one process each; branch and bound
+    # only joins for small instances
+    members = [m for m in members if m in MEMBER_FUNCTIONS]
+    if 'branch_and_bound' in members and num_cylinders > exact_threshold:
+        members.remove('branch_and_bound')
+    return members
+
+
+class PortfolioSolver:
+    # Races several algorithms in parallel processes and keeps the best answer
+    def __init__(self, container, cylinders, step_size=0.3, population_size=100,
+                 mutation_rate=0.05, exact_threshold=10):
+        self.container = container
+        self.cylinders = cylinders
+        self.step_size = step_size
+        self.population_size = population_size
+        self.mutation_rate = mutation_rate
+        self.exact_threshold = exact_threshold
+        self.placer = GreedyPlacer(step_size=step_size)
+
+        self.best_solution = None
+        self.best_fitness = 0
+        self.winner = None
+        self.proven_optimal = False
+        self.member_results = {}
+
+    def solve(self, time_limit=10.0, members=DEFAULT_MEMBERS, seed=None, verbose=True):
+        """
+        Run all members until the deadline or until one proves optimality
+
+        Args:
+            time_limit: Wall-clock budget in seconds
+            members: Names of the algorithms to race
+            seed: Base random seed (each member gets seed + its index)
+            verbose: Print improvements as they arrive
+
+        Returns:
+            Best DNA found by any member, or None
+        """
+        members = portfolio_members(len(self.cylinders), members, self.exact_threshold)
+
+        if verbose:
+            print(f"Running Portfolio ({', '.join(members)}) for {time_limit}s...")
+
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+
+        ctx = multiprocessing.get_context()
+        lock = ctx.Lock()
+        incumbent_fitness = ctx.Value('d', 0.0, lock=False)
+        incumbent_genes = ctx.Array('i', len(self.cylinders), lock=False)
+        incumbent_member = ctx.Value('i', -1, lock=False)
+        results = ctx.Queue()
+        stop = ctx.Event()
+
+        config = {
+            'step_size': self.step_size,
+            'population_size': self.population_size,
+            'mutation_rate': self.mutation_rate
+        }
+
+        self.member_results = {
+            name: {'best_fitness': 0, 'improvements': 0, 'finished': False, 'terminated': False}
+            for name in members
+        }
+
+        deadline = time.time() + time_limit
+        processes = []
+        for index, name in enumerate(members):
+            process = ctx.Process(
+                target=_run_member,
+                args=(name, self.container, self.cylinders, config, seed + index,
+                      (lock, incumbent_fitness, incumbent_genes, incumbent_member, index),
+                      results, stop),
+                daemon=True
+            )
+            process.start()
+            processes.append(process)
+
+        running = len(processes)
+        while running > 0 and not self.proven_optimal:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+
+            try:
+                message = results.get(timeout=min(remaining, 0.1))
+            except queue.Empty:
+                continue
+
+            if self._handle_message(message, verbose):
+                running -= 1
+
+        terminated = self._cancel(processes, stop, results, verbose)
+
+        if not terminated:
+            while True:
+                try:
+                    self._handle_message(results.get_nowait(), verbose)
+                except queue.Empty:
+                    break
+
+        # Messages may arrive out of order across processes; shared memory is
+        # authoritative. A killed member may have died holding the lock or
+        # halfway through a results.put(), so after a kill the queue is left
+        # alone and the lock is only waited on briefly; failing that, the
+        # best 'improved' message stands.
+        if lock.acquire(timeout=LOCK_TIMEOUT_SECONDS if terminated else None):
+            try:
+                if incumbent_fitness.value > self.best_fitness:
+                    self.best_solution = DNA(len(self.cylinders))
+                    self.best_solution.genes = list(incumbent_genes)
+                    self.best_solution.fitness = incumbent_fitness.value
+                    self.best_fitness = incumbent_fitness.value
+                    self.winner = members[incumbent_member.value]
+            finally:
+                lock.release()
+
+        if verbose:
+            reason = "proven optimum" if self.proven_optimal else "deadline"
+            print(f"  Stopped on {reason}")
+            if self.best_solution:
+                print(f"  Winner: {self.winner} (fitness {self.best_fitness:.2f})")
+            else:
+                print("  No valid solution found")
+
+        return self.best_solution
+
+    def _handle_message(self, message, verbose):
+        # Returns True when the message says a member has finished
+        kind, name = message[0], message[1]
+        if kind == 'improved':
+            genes, fitness = message[2], message[3]
+            member = self.member_results[name]
+            member['improvements'] += 1
+            member['best_fitness'] = max(member['best_fitness'], fitness)
+
+            if fitness > self.best_fitness:
+                self.best_solution = DNA(len(self.cylinders))
+                self.best_solution.genes = list(genes)
+                self.best_solution.fitness = fitness
+                self.best_fitness = fitness
+                self.winner = name
+                if verbose:
+                    print(f"  {name}: new best fitness {fitness:.2f}")
+            return False
+
+        self.member_results[name]['finished'] = True
+        if message[2]:
+            # An exact member finished, nothing can beat the incumbent now
+            self.proven_optimal = True
+        return True
+
+    def _cancel(self, processes, stop, results, verbose):
+        # Returns the names of the members that had to be killed
+        stop.set()
+        grace_deadline = time.time() + STOP_GRACE_SECONDS
+        # Keep reading while members wind down: a process does not exit
+        # before everything it put on the queue has been taken off
+        while any(p.is_alive() for p in processes) and time.time() < grace_deadline:
+            try:
+                self._handle_message(results.get(timeout=0.1), verbose)
+            except queue.Empty:
+                pass
+
+        terminated = []
+        for name, process in zip(self.member_results, processes):
+            if process.is_alive():
+                process.terminate()
+                process.join()
+                self.member_results[name]['terminated'] = True
+                terminated.append(name)
+        return terminated
+
+
+def _run_member(name, container, cylinders, config, seed, incumbent, results, stop):
+    random.seed(seed)
+    placer = GreedyPlacer(step_size=config['step_size'])
+    lock, incumbent_fitness, incumbent_genes, incumbent_member, index = incumbent
+
+    def report(dna):
+        if dna is None or dna.fitness <= 0:
+            return
+        with lock:
+            if dna.fitness <= incumbent_fitness.value:
+                return
+            incumbent_fitness.value = dna.fitness
+            incumbent_genes[:] = dna.genes
+            incumbent_member.value = index
+        results.put(('improved', name, list(dna.genes), dna.fitness))
+
+    def read_incumbent():
+        with lock:
+            if incumbent_fitness.value <= 0:
+                return None
+            dna = DNA(len(cylinders))
+            dna.genes = list(incumbent_genes)
+            dna.fitness = incumbent_fitness.value
+            return dna
+
+    proven = MEMBER_FUNCTIONS[name](cylinders, container, placer, config, report, read_incumbent, stop)
+    results.put(('done', name, bool(proven)))
+
+
+def _greedy_member(cylinders, container, placer, config, report, read_incumbent, stop):
+    greedy = GreedyAlgorithm(cylinders, container, placer)
+    for strategy in ('largest_first', 'heaviest_first', 'smallest_first'):
+        if stop.is_set():
+            break
+        report(greedy.solve(strategy, verbose=False))
+
+
+def _random_search_member(cylinders, container, placer, config, report, read_incumbent, stop):
+    search = RandomSearch(cylinders, container, placer)
+    while not stop.is_set():
+        search.solve(num_trials=50, verbose=False)
+        report(search.best_solution)
+        search.history = []
+
+
+def _genetic_member(cylinders, container, placer, config, report, read_incumbent, stop):
+    from solvers.ga_solver import CargoPackingSolver
+
+    solver = CargoPackingSolver(
+        container=container,
+        cylinders=cylinders,
+        population_size=config['population_size'],
+        mutation_rate=config['mutation_rate'],
+        step_size=config['step_size']
+    )
+    # One open-ended run; the stop flag is checked between generations
+    for event in solver.iter_solve(max_generations=sys.maxsize):
+        if stop.is_set():
+            break
+        if event['type'] == 'generation' and event['improved']:
+            report(solver.best_solution)
+
+
+def _local_search_member(cylinders, container, placer, config, report, read_incumbent, stop):
+    # Keeps polishing whatever the portfolio currently considers best
+    current = DNA(len(cylinders))
+    current.calculate_fitness(cylinders, container, placer)
+    while not stop.is_set():
+        incumbent = read_incumbent()
+        if incumbent is not None and incumbent.fitness > current.fitness:
+            current = incumbent
+        current = iterated_local_search(current, cylinders, container, placer, num_restarts=2,
+                                        should_stop=stop.is_set)
+        report(current)
+
+
+def _branch_and_bound_member(cylinders, container, placer, config, report, read_incumbent, stop):
+    exact = BranchAndBound(cylinders, container, placer)
+    solution = exact.solve(verbose=False, should_stop=stop.is_set)
+    report(solution)
+    return exact.proven_optimal
+
+
+MEMBER_FUNCTIONS = {
+    'greedy': _greedy_member,
+    'random_search': _random_search_member,
+    'genetic': _genetic_member,
+    'local_search': _local_search_member,
+    'branch_and_bound': _branch_and_bound_member
+}
@@ -0,0 +1,198 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+import time
+
+from api.admission import AdmissionController, Rejected
+
+def test_priority_order():
+    print("Testing that short requests are served first...")
+
+    controller = AdmissionController(max_concurrent=1, max_waiting=10, max_wait=10)
+    order = []
+    release = threading.Event()
+
+    def request(name, priority):
+        with controller.admit(priority):
+            order.append(name)
+            if name == 'first':
+                release.wait()
+
+    threads = [threading.Thread(target=request, args=('first', 2))]
+    threads[0].start()
+    while controller.stats()['running'] == 0:
+        time.sleep(0.001)
+
+    for name, priority in [('ga-1', 2), ('ga-2', 2), ('greedy', 0)]:
+        thread = threading.Thread(target=request, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        while controller.stats()['waiting'] < len(threads) - 1:
+            time.sleep(0.001)
+
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    print(f"  Order: {order}")
+    assert order == ['first', 'greedy', 'ga-1', 'ga-2']
+    assert controller.stats()['running'] == 0
+
+    print("  Priority test passed")
+
+
+def test_rejections():
+    print("\nTesting 429 and 503 rejections...")
+
+    controller = AdmissionController(max_concurrent=1, max_waiting=1, max_wait=0.05)
+    with controller.admit() as ticket:
+        # The waiting request gives up after max_wait
+        waiter = {}
+
+        def wait():
+            try:
+                with controller.admit():
+                    pass
+            except Rejected as e:
+                waiter['status'] = e.status
+
+        thread = threading.Thread(target=wait)
+        thread.start()
+        while controller.stats()['waiting'] == 0 and thread.is_alive():
+            time.sleep(0.001)
+
+        # ...and while it waits, the queue is full
+        try:
+            with controller.admit():
+                pass
+            assert False, "should have been rejected"
+        except Rejected as e:
+            assert e.status == 429
+
+        thread.join(timeout=5)
+        assert waiter['status'] == 503
+
+    assert ticket.wait_seconds < 0.05
+    assert controller.stats()['rejected'] == {429: 1, 503: 1}
+
+    print("  Rejection test passed")
+
+
+def test_solve_timing_headers():
+    print("\nTesting queue headers on /api/solve...")
+
+    from api.app import create_app
+    client = create_app().test_client()
+    response = client.post('/api/solve', json={
+        'algorithm': 'greedy',
+        'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+        'cylinders': [{'diameter': 3, 'weight': 200}, {'diameter': 2, 'weight': 100}],
+        'params': {'use_cache': False}
+    })
+
+    assert response.status_code == 200
+    assert float(response.headers['X-Queue-Wait']) >= 0
+    assert float(response.headers['X-Service-Time']) >= 0
+
+    print("  Header test passed")
+
+
+def test_slots():
+    print("\nTesting multi-slot requests...")
+
+    controller = AdmissionController(max_concurrent=3, max_waiting=10, max_wait=10)
+    one = controller.try_admit()
+    assert one is not None and controller.stats()['running'] == 1
+
+    # A portfolio-sized request needs three free slots
+    admitted = threading.Event()
+
+    def portfolio():
+        with controller.admit(2, slots=3):
+            admitted.set()
+
+    thread = threading.Thread(target=portfolio)
+    thread.start()
+    while controller.stats()['waiting'] == 0:
+        time.sleep(0.001)
+    assert not admitted.is_set()
+    # Nobody jumps the queue, not even a request that would fit
+    assert controller.try_admit() is None
+
+    one.release()
+    thread.join(timeout=5)
+    assert admitted.is_set()
+    assert controller.stats()['running'] == 0
+
+    # More slots than exist are capped instead of waiting forever
+    with controller.admit(slots=10) as ticket:
+        assert ticket.slots == 3
+
+    from models import Cylinder
+    from api.routes import admission_for
+    small = [Cylinder(i, 1.0, 10) for i in range(5)]
+    large = [Cylinder(i, 1.0, 10) for i in range(20)]
+    assert admission_for('portfolio', small)[1] == 5
+    # No branch and bound member for large instances
+    assert admission_for('portfolio', large)[1] == 4
+    assert admission_for('genetic', large) == (2, 1)
+
+    print("  Slot test passed")
+
+
+def test_jobs_and_streams_take_slots():
+    print("\nTesting that jobs and streams share the controller...")
+
+    import api.routes
+    from api.app import create_app
+    from api.routes import parse_problem, stream_frames
+
+    controller = AdmissionController(max_concurrent=1, max_waiting=10, max_wait=10)
+    api.routes._admission_controller = controller
+    try:
+        client = create_app().test_client()
+        body = {
+            'algorithm': 'greedy',
+            'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+            'cylinders': [{'diameter': 3, 'weight': 200}, {'diameter': 2, 'weight': 100}]
+        }
+
+        held = controller.try_admit()
+        job_id = client.post('/api/jobs', json=body).get_json()['job']['id']
+        while controller.stats()['waiting'] == 0:
+            time.sleep(0.001)
+        assert client.get(f'/api/jobs/{job_id}').get_json()['job']['status'] != 'done'
+        held.release()
+        while client.get(f'/api/jobs/{job_id}').get_json()['job']['status'] != 'done':
+            time.sleep(0.01)
+
+        held = controller.try_admit()
+        container, cylinders = parse_problem(body)
+        frames = stream_frames(container, cylinders, {'population_size': 6, 'max_generations': 2},
+                               admission=controller)
+        first = {}
+        thread = threading.Thread(target=lambda: first.setdefault('event', next(frames)))
+        thread.start()
+        while controller.stats()['waiting'] == 0:
+            time.sleep(0.001)
+        assert 'event' not in first
+        held.release()
+        thread.join(timeout=5)
+        assert first['event']['type'] == 'start'
+        assert controller.stats()['running'] == 1
+        list(frames)
+        assert controller.stats()['running'] == 0
+    finally:
+        api.routes._admission_controller = None
+
+    print("  Jobs and streams wait for a slot")
+
+
+if __name__ == "__main__":
+    test_priority_order()
+    test_rejections()
+    test_solve_timing_headers()
+    test_slots()
+    test_jobs_and_streams_take_slots()
+    print("\nAll admission tests passed!")
@@ -0,0 +1,101 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import random
+import shutil
+import tempfile
+
+import numpy as np
+
+from models import Container, Cylinder
+from solvers import CargoPackingSolver
+from visualization.animation import GAAnimator, FFmpegWriter, export_animation
+
+def make_instance():
+    container = Container(20, 15, 5000)
+    cylinders = [Cylinder(i, d, w) for i, (d, w) in enumerate([(3, 300), (2.5, 250), (2, 200), (2, 150), (1.5, 100)] * 2)]
+    return container, cylinders
+
+
+def test_frames_reuse_one_figure():
+    print("Testing blitted frames...")
+
+    container, cylinders = make_instance()
+    animator = GAAnimator(container, cylinders, label_threshold=3)
+    width, height = animator.size
+    figure = animator.fig
+
+    empty = animator.frame([])
+    one = animator.frame([(0, 5.0, 5.0)], generation=0, fitness=100.0)
+    assert one.shape == (height, width, 4) and one.dtype == np.uint8
+    assert not np.array_equal(empty, one)
+
+    # Moving the circle back to no placement restores the empty picture
+    assert np.array_equal(animator.frame([]), empty)
+    assert animator.fig is figure
+
+    # Only the 3 largest cylinders get labels
+    assert set(animator.labels) == {0, 5, 1}
+    animator.frame([(cyl.id, 2.0 + 2 * i, 3.0) for i, cyl in enumerate(cylinders[:5])])
+    assert sum(label.get_visible() for label in animator.labels.values()) == 2
+    x, y = animator.center.get_data()
+    weights = [cyl.weight for cyl in cylinders[:5]]
+    assert abs(x[0] - sum(w * (2.0 + 2 * i) for i, w in enumerate(weights)) / sum(weights)) < 1e-9
+
+    print("  Frame test passed")
+
+
+def test_export_gif_and_frames():
+    print("\nTesting GIF and frame export...")
+
+    from PIL import Image
+
+    tmp = tempfile.mkdtemp()
+    try:
+        container, cylinders = make_instance()
+        random.seed(7)
+        solver = CargoPackingSolver(container, cylinders, population_size=20)
+        path = os.path.join(tmp, 'run.gif')
+        summary = export_animation(solver, path, max_generations=15, fps=5)
+        print(f"  {summary['frames']} frames for {summary['generations']} generations")
+
+        assert summary['generations'] == 15
+        assert 1 <= summary['frames'] <= 15
+        assert summary['best_fitness'] == solver.best_fitness
+        with Image.open(path) as gif:
+            assert gif.n_frames == summary['frames']
+
+        random.seed(7)
+        solver = CargoPackingSolver(container, cylinders, population_size=20)
+        frames_dir = os.path.join(tmp, 'frames')
+        again = export_animation(solver, frames_dir, max_generations=15)
+        # Same seed, same improvements
+        assert again['frames'] == summary['frames']
+        assert sorted(os.listdir(frames_dir))[0] == 'frame_00000.png'
+        assert len(os.listdir(frames_dir)) == summary['frames']
+    finally:
+        shutil.rmtree(tmp)
+
+    print("  Export test passed")
+
+
+def test_ffmpeg_writer_needs_ffmpeg():
+    print("\nTesting the MP4 writer...")
+
+    if shutil.which('ffmpeg') is not None:
+        print("  ffmpeg is installed, nothing to check")
+        return
+    try:
+        FFmpegWriter('run.mp4')
+        assert False, "expected RuntimeError"
+    except RuntimeError as e:
+        assert 'ffmpeg' in str(e)
+
+    print("  Missing ffmpeg is reported")
+
+
+if __name__ == "__main__":
+    test_frames_reuse_one_figure()
+    test_export_gif_and_frames()
+    test_ffmpeg_writer_needs_ffmpeg()
+    print("\nAll animation tests passed!")
@@ -0,0 +1,172 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import signal
+import threading
+import time
+
+from api.batch import solve_item
+
+def make_item(item_id, specs, **params):
+    return {
+        'id': item_id,
+        'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+        'cylinders': [{'diameter': d, 'weight': w} for d, w in specs],
+        'params': params
+    }
+
+
+def test_solve_item_statuses():
+    print("Testing single batch items...")
+
+    solved = solve_item(0, dict(make_item('a', [(3, 200), (2, 100)]), algorithm='greedy'))
+    assert solved['status'] == 'solved'
+    assert sorted(solved['result']['solution']) == [0, 1]
+
+    # Broken input only fails its own item
+    broken = solve_item(1, {'id': 'b', 'cylinders': []})
+    assert broken['status'] == 'error'
+    assert broken['error'].startswith('TypeError')
+
+    # A GA item stops at its time budget
+    budget = solve_item(2, dict(make_item('c', [(2, 100)] * 6, population_size=10, max_generations=100000,
+                                          time_limit=0.2, use_local_search=False), algorithm='genetic'))
+    print(f"  Budgeted item took {budget['seconds']:.2f}s")
+    assert budget['status'] == 'solved'
+    assert budget['seconds'] < 5
+
+    print("  Item status test passed")
+
+
+def test_batch_endpoint_streams_ndjson():
+    print("\nTesting /api/solve-batch...")
+
+    from api.app import create_app
+    app = create_app()
+    app.config['BATCH_WORKERS'] = 2
+    client = app.test_client()
+
+    body = {
+        'algorithm': 'greedy',
+        'params': {'use_store': False},
+        'items': [
+            make_item('small', [(3, 200), (2, 100)]),
+            {'id': 'bad', 'container': {'width': 'wide'}},
+            dict(make_item('ga', [(2, 100), (2, 100), (1.5, 80)], population_size=10, max_generations=5,
+                           use_local_search=False), algorithm='genetic')
+        ]
+    }
+    response = client.post('/api/solve-batch', json=body)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    by_id = {record['id']: record for record in records}
+    print(f"  Statuses: {[(r['id'], r['status']) for r in records]}")
+
+    assert sorted(record['index'] for record in records) == [0, 1, 2]
+    assert by_id['small']['status'] == 'solved'
+    assert by_id['small']['result']['algorithm'] == 'Greedy Algorithm'
+    assert by_id['ga']['result']['algorithm'] == 'Genetic Algorithm'
+    assert by_id['bad']['status'] == 'error'
+
+    assert client.post('/api/solve-batch', json={'items': 'nope'}).status_code == 400
+
+    print("  Batch endpoint test passed")
+
+
+def test_batch_budget_and_admission():
+    print("\nTesting batch time caps and admission...")
+
+    from api.admission import AdmissionController
+    from api.batch import BatchPool, run_batch
+
+    controller = AdmissionController(max_concurrent=1, max_waiting=10, max_wait=10)
+    pool = BatchPool(max_workers=2)
+    # No time_limit of their own and far too many generations: the cap ends them
+    items = [
+        make_item(name, [(2, 100)] * 6, population_size=10, max_generations=100000, use_local_search=False)
+        for name in ('a', 'b', 'c')
+    ]
+    try:
+        running = []
+        records = []
+        for record in run_batch(pool, items, {'algorithm': 'genetic'}, admission=controller, time_cap=0.2):
+            running.append(controller.stats()['running'])
+            records.append(record)
+    finally:
+        pool.reset()
+
+    print(f"  Seconds: {[round(r['seconds'], 2) for r in records]}")
+    assert [r['status'] for r in records] == ['solved'] * 3
+    assert all(r['seconds'] < 5 for r in records)
+    # One slot: the items ran one after another
+    assert max(running) <= 1
+    assert controller.stats()['running'] == 0
+    assert controller.stats()['admitted'] == 3
+
+    print("  Budget and admission test passed")
+
+
+def test_worker_crash_with_two_batches():
+    print("\nTesting a worker crash under two concurrent batches...")
+
+    from api.batch import BatchPool, run_batch
+
+    pool = BatchPool(max_workers=2)
+    # Long enough to still be running when the worker is killed
+    slow = {'algorithm': 'genetic', 'params': {'population_size': 10, 'max_generations': 100000,
+                                               'use_local_search': False, 'time_limit': 30}}
+    batches = {
+        name: [make_item(f"{name}{i}", [(2, 100)] * 6) for i in range(2)]
+        for name in ('a', 'b')
+    }
+    records = {}
+
+    def consume(name):
+        records[name] = list(run_batch(pool, batches[name], slow, time_cap=30))
+
+    try:
+        threads = [threading.Thread(target=consume, args=(name,)) for name in batches]
+        for thread in threads:
+            thread.start()
+
+        deadline = time.time() + 10
+        while not (pool.executor and pool.executor._processes) and time.time() < deadline:
+            time.sleep(0.05)
+        broken = pool.executor
+        time.sleep(0.5)
+        os.kill(next(iter(broken._processes)), signal.SIGKILL)
+
+        for thread in threads:
+            thread.join(timeout=30)
+        assert not any(thread.is_alive() for thread in threads)
+
+        for name in batches:
+            assert [r['status'] for r in records[name]] == ['error', 'error']
+            assert all(r['error'] == 'Worker process died' for r in records[name])
+
+        # Four futures saw the crash; a late reset for it must not shut down
+        # the replacement while it runs another batch's item
+        replacement = pool.get()
+        assert replacement is not broken
+        quick = [make_item('c', [(3, 200), (2, 100)])]
+        running = replacement.submit(solve_item, 0, dict(quick[0], algorithm='greedy'))
+        pool.reset(expected=broken)
+        assert running.result(timeout=30)['status'] == 'solved'
+        after = list(run_batch(pool, quick, {'algorithm': 'greedy'}, time_cap=30))
+        assert [r['status'] for r in after] == ['solved']
+        assert pool.executor is replacement
+    finally:
+        pool.reset()
+
+    print("  Worker crash test passed")
+
+
+if __name__ == "__main__":
+    test_solve_item_statuses()
+    test_batch_endpoint_streams_ndjson()
+    test_batch_budget_and_admission()
+    test_worker_crash_with_two_batches()
+    print("\nAll batch tests passed!")
@@ -0,0 +1,139 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import csv
+import json
+import tempfile
+
+from scripts.batch_solve import expand_inputs, skip_reason, SummaryWriter, main
+from utils import SolutionStore, load_instance_from_file
+
+def write_instance(path, specs):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write("container 20 15 1000\n")
+        for diameter, weight in specs:
+            f.write(f"cylinder {diameter} {weight}\n")
+
+
+def write_solution(path, order, fitness):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(f"placement_order {' '.join(map(str, order))}\nfitness {fitness:.2f}\n")
+
+
+def test_expand_inputs():
+    print("Testing input expansion...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        a = os.path.join(tmp, 'small', 'a.txt')
+        b = os.path.join(tmp, 'small', 'b.txt')
+        write_instance(a, [(2, 100)])
+        write_instance(b, [(2, 100)])
+
+        pattern = os.path.join(tmp, 'small', '*.txt')
+        assert expand_inputs([pattern]) == [a, b]
+        # Files named twice, directly or through a pattern, are kept once
+        assert expand_inputs([b, pattern]) == [b, a]
+        assert expand_inputs([os.path.join(tmp, 'missing', '*.txt')]) == []
+
+    print("  Expansion test passed")
+
+
+def test_skip_reason():
+    print("\nTesting skip decisions...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        instance = os.path.join(tmp, 'small', 'a.txt')
+        output = os.path.join(tmp, 'solutions', 'small', 'a_solution.txt')
+        write_instance(instance, [(3, 200), (2, 100)])
+
+        # Nothing solved yet
+        assert skip_reason(instance, output, None, None, True) is None
+
+        write_solution(output, [0, 1], 500.0)
+        assert skip_reason(instance, output, None, None, False) is None
+        assert skip_reason(instance, output, None, None, True) == "solution exists"
+        assert skip_reason(instance, output, None, 400.0, False) is not None
+        assert skip_reason(instance, output, None, 600.0, True) is None
+
+        # A better order in the store means the file should be solved again
+        store = SolutionStore(os.path.join(tmp, 'store.db'))
+        container, cylinders = load_instance_from_file(instance)
+        store.put(container, cylinders, [1, 0], 700.0)
+        assert skip_reason(instance, output, store, None, True) is None
+        write_solution(output, [1, 0], 700.0)
+        assert skip_reason(instance, output, store, None, False) is not None
+
+    print("  Skip test passed")
+
+
+def test_summary_writer():
+    print("\nTesting summary files...")
+
+    record = {'instance': 'a.txt', 'output': 'a_solution.txt', 'status': 'solved',
+              'fitness': 12.5, 'seconds': 0.1, 'message': None, 'profile': {'evaluate': {'percent': 90.0}}}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'out', 'summary.csv')
+        writer = SummaryWriter(csv_path)
+        writer.write(record)
+        writer.close()
+        with open(csv_path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 1
+        assert rows[0]['status'] == 'solved' and 'profile' not in rows[0]
+
+        jsonl_path = os.path.join(tmp, 'summary.jsonl')
+        writer = SummaryWriter(jsonl_path)
+        writer.write(record)
+        writer.close()
+        with open(jsonl_path) as f:
+            assert json.loads(f.readline()) == record
+
+    # No path: records are dropped
+    writer = SummaryWriter(None)
+    writer.write(record)
+    writer.close()
+
+    print("  Summary test passed")
+
+
+def test_batch_run_and_rerun():
+    print("\nTesting a batch run over two instances...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_instance(os.path.join(tmp, 'small', 'a.txt'), [(3, 200), (2, 100), (2.5, 150)])
+        write_instance(os.path.join(tmp, 'small', 'b.txt'), [(2, 100), (2, 100)])
+        output_dir = os.path.join(tmp, 'solutions')
+        summary = os.path.join(tmp, 'summary.csv')
+        argv = [os.path.join(tmp, 'small', '*.txt'), '--output-dir', output_dir, '--summary', summary,
+                '--workers', '1', '--skip-existing']
+
+        def rows():
+            with open(summary, newline='') as f:
+                return sorted(csv.DictReader(f), key=lambda row: row['instance'])
+
+        assert main(argv) == 0
+        first = rows()
+        assert [os.path.basename(row['instance']) for row in first] == ['a.txt', 'b.txt']
+        assert all(row['status'] == 'solved' for row in first)
+        for name in ('a', 'b'):
+            assert os.path.exists(os.path.join(output_dir, 'small', f'{name}_solution.txt'))
+
+        # Both solutions exist now
+        assert main(argv) == 0
+        second = rows()
+        assert [row['status'] for row in second] == ['skipped', 'skipped']
+        # Saved files round fitness to 2 decimals
+        assert [float(row['fitness']) for row in second] == [round(float(row['fitness']), 2) for row in first]
+
+    print("  Batch run test passed")
+
+
+if __name__ == "__main__":
+    test_expand_inputs()
+    test_skip_reason()
+    test_summary_writer()
+    test_batch_run_and_rerun()
+    print("\nAll batch solve tests passed!")
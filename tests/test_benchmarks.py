@@ -0,0 +1,85 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import random
+
+from benchmarks.harness import Benchmark, mann_whitney_greater, compare_results
+
+def make_results(samples_by_name):
+    return {'meta': {}, 'results': {name: {'samples': samples} for name, samples in samples_by_name.items()}}
+
+
+def test_benchmark_repeats_are_seeded():
+    print("Testing warmup, repeats and seeding...")
+
+    draws = []
+    benchmark = Benchmark('draw', lambda state: draws.append((state, random.random())),
+                          setup=lambda: random.randint(0, 1000), warmup=2, repeats=5, seed=42)
+    result = benchmark.measure()
+
+    assert result['stats']['count'] == 5
+    assert len(draws) == 7
+    # Every call sees the same setup and the same random stream
+    assert len(set(draws)) == 1
+
+    print("  Seeded repeats test passed")
+
+
+def test_mann_whitney():
+    print("\nTesting the Mann-Whitney U test...")
+
+    fast = [1.00, 1.01, 0.99, 1.02, 1.00, 0.98, 1.01, 1.00]
+    slow = [1.20, 1.22, 1.19, 1.21, 1.23, 1.18, 1.20, 1.22]
+
+    p_slower = mann_whitney_greater(fast, slow)
+    p_same = mann_whitney_greater(fast, fast)
+    print(f"  p(slow > fast) = {p_slower:.5f}, p(fast > fast) = {p_same:.3f}")
+
+    assert p_slower < 0.001
+    assert p_same > 0.3
+    assert mann_whitney_greater(slow, fast) > 0.99
+    assert mann_whitney_greater([1.0] * 5, [1.0] * 5) == 1.0
+
+    print("  Mann-Whitney test passed")
+
+
+def test_compare_flags_significant_changes_only():
+    print("\nTesting result comparison...")
+
+    base = [1.00, 1.01, 0.99, 1.02, 1.00, 0.98, 1.01, 1.00]
+    baseline = make_results({
+        'slower': base,
+        'faster': base,
+        'noise': base,
+        'small': base,
+        'removed': base
+    })
+    current = make_results({
+        'slower': [v * 1.3 for v in base],
+        'faster': [v * 0.7 for v in base],
+        'noise': [1.05, 0.95, 1.10, 0.92, 1.01, 0.99, 1.08, 0.94],
+        # Significant but below the threshold
+        'small': [v * 1.03 for v in base],
+        'added': base
+    })
+
+    statuses = {row['name']: row['status'] for row in compare_results(baseline, current, threshold=0.1)}
+    print(f"  Statuses: {statuses}")
+
+    assert statuses == {
+        'slower': 'slower',
+        'faster': 'faster',
+        'noise': 'unchanged',
+        'small': 'unchanged',
+        'removed': 'missing',
+        'added': 'new'
+    }
+
+    print("  Comparison test passed")
+
+
+if __name__ == "__main__":
+    test_benchmark_repeats_are_seeded()
+    test_mann_whitney()
+    test_compare_flags_significant_changes_only()
+    print("\nAll benchmark harness tests passed!")
@@ -0,0 +1,114 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import itertools
+
+from models import Container, Cylinder, DNA
+from algorithms import GreedyPlacer, BranchAndBound
+
+def brute_force_best(cylinders, container, placer):
+    best = 0
+    for order in itertools.permutations(range(len(cylinders))):
+        dna = DNA(len(cylinders))
+        dna.genes = list(order)
+        dna.calculate_fitness(cylinders, container, placer)
+        best = max(best, dna.fitness)
+    return best
+
+
+def test_matches_brute_force():
+    print("Testing branch and bound against brute force...")
+    
+    container = Container(12, 10, 1000)
+    cylinders = [
+        Cylinder(0, 2.0, 100),
+        Cylinder(1, 1.5, 80),
+        Cylinder(2, 2.0, 100),
+        Cylinder(3, 1.0, 40),
+        Cylinder(4, 1.5, 150)
+    ]
+    placer = GreedyPlacer(step_size=0.5)
+    
+    solver = BranchAndBound(cylinders, container, placer)
+    solution = solver.solve(verbose=False)
+    expected = brute_force_best(cylinders, container, placer)
+    
+    print(f"  Branch and bound: {solution.fitness:.4f} ({solver.nodes_explored} nodes)")
+    print(f"  Brute force:      {expected:.4f}")
+    
+    assert solver.proven_optimal
+    assert abs(solution.fitness - expected) < 1e-9
+    assert sorted(solution.genes) == list(range(len(cylinders)))
+    
+    print("  Brute force test passed")
+
+
+def test_infeasible_weight():
+    print("\nTesting weight bound...")
+    
+    container = Container(20, 15, 150)
+    cylinders = [
+        Cylinder(0, 2.0, 100),
+        Cylinder(1, 2.0, 100)
+    ]
+    
+    solver = BranchAndBound(cylinders, container, GreedyPlacer(step_size=0.5))
+    solution = solver.solve(verbose=False)
+    
+    assert solution is None
+    assert solver.proven_optimal
+    assert solver.nodes_explored == 0
+    
+    print("  Weight bound test passed")
+
+
+def test_node_limit():
+    print("\nTesting node limit...")
+    
+    container = Container(12, 10, 1000)
+    cylinders = [Cylinder(i, 1.0 + 0.1 * i, 50 + i) for i in range(6)]
+    
+    solver = BranchAndBound(cylinders, container, GreedyPlacer(step_size=0.5))
+    solver.solve(max_nodes=10, verbose=False)
+    
+    assert not solver.proven_optimal
+    assert solver.nodes_explored <= 10
+    
+    print("  Node limit test passed")
+
+
+def test_should_stop():
+    print("\nTesting cooperative stop...")
+    
+    container = Container(20, 15, 5000)
+    cylinders = [Cylinder(i, 1.0 + 0.15 * i, 50 + 7 * i) for i in range(12)]
+    checks = []
+    
+    def should_stop():
+        checks.append(1)
+        return len(checks) > 20
+    
+    solver = BranchAndBound(cylinders, container, GreedyPlacer(step_size=0.5))
+    solution = solver.solve(verbose=False, should_stop=should_stop)
+    
+    assert not solver.proven_optimal
+    assert solver.nodes_explored == 20
+    # The greedy incumbent is still returned
+    assert solution is not None and solution.fitness > 0
+    
+    print("  Stop test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RUNNING BRANCH AND BOUND TESTS")
+    print("=" * 50)
+    
+    test_matches_brute_force()
+    test_infeasible_weight()
+    test_node_limit()
+    test_should_stop()
+    
+    print("\n" + "=" * 50)
+    print("ALL BRANCH AND BOUND TESTS PASSED")
+    print("=" * 50)
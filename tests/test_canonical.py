@@ -0,0 +1,114 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import Container, Cylinder, DNA
+from algorithms import GreedyPlacer, RandomSearch
+from utils import cylinder_type_ids, canonicalize_genes, FitnessCache
+
+def make_instance():
+    container = Container(20, 15, 1000)
+    cylinders = [
+        Cylinder(0, 2.0, 100),
+        Cylinder(1, 1.5, 80),
+        Cylinder(2, 2.0, 100),
+        Cylinder(3, 1.5, 80)
+    ]
+    return container, cylinders
+
+
+def test_type_ids():
+    print("Testing cylinder type grouping...")
+    
+    container, cylinders = make_instance()
+    type_ids = cylinder_type_ids(cylinders)
+    
+    print(f"  Type ids: {type_ids}")
+    
+    assert type_ids == [0, 1, 0, 1]
+    assert canonicalize_genes([2, 3, 0, 1], type_ids) == [0, 1, 2, 3]
+    assert canonicalize_genes([3, 0, 1, 2], type_ids) == [1, 0, 3, 2]
+    
+    print("  Type grouping test passed")
+
+
+def test_equivalent_orders_share_cache():
+    print("\nTesting fitness cache on equivalent orders...")
+    
+    container, cylinders = make_instance()
+    placer = GreedyPlacer(step_size=0.5)
+    cache = FitnessCache(cylinders)
+    
+    first = DNA(4)
+    first.genes = [0, 1, 2, 3]
+    first.calculate_fitness(cylinders, container, placer, cache)
+    
+    swapped = DNA(4)
+    swapped.genes = [2, 3, 0, 1]
+    swapped.calculate_fitness(cylinders, container, placer, cache)
+    
+    uncached = DNA(4)
+    uncached.genes = [2, 3, 0, 1]
+    uncached.calculate_fitness(cylinders, container, placer)
+    
+    print(f"  Hits: {cache.hits}, misses: {cache.misses}")
+    
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert swapped.fitness == first.fitness == uncached.fitness
+    
+    print("  Fitness cache test passed")
+
+
+def test_cache_bound_scales_with_size():
+    print("\nTesting fitness cache bound on large instances...")
+    
+    small = [Cylinder(i, 1.0 + i % 3, 50) for i in range(10)]
+    large = [Cylinder(i, 1.0 + i * 0.001, 50) for i in range(2000)]
+    
+    # Short keys keep the entry limit; long keys share the same key budget
+    assert FitnessCache(small).max_entries == 100000
+    cache = FitnessCache(large)
+    assert cache.max_entries == 1000
+    assert FitnessCache(large, max_key_items=100).max_entries == 1
+    
+    genes = list(range(2000))
+    for i in range(1500):
+        genes[i], genes[i + 1] = genes[i + 1], genes[i]
+        cache.put(genes, float(i))
+    
+    assert len(cache) == 1000
+    assert sum(len(key) for key in cache.entries) <= 2000000
+    
+    print("  Cache bound test passed")
+
+
+def test_random_search_uses_cache():
+    print("\nTesting random search with duplicate cylinders...")
+    
+    container, cylinders = make_instance()
+    search = RandomSearch(cylinders, container, GreedyPlacer(step_size=0.5))
+    search.solve(num_trials=50, verbose=False)
+    
+    # Only 4!/(2!*2!) = 6 distinct type sequences exist
+    print(f"  Distinct orders evaluated: {search.cache.misses}")
+    
+    assert search.cache.misses <= 6
+    assert search.cache.hits + search.cache.misses == 50
+    
+    print("  Random search cache test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RUNNING CANONICALIZATION TESTS")
+    print("=" * 50)
+    
+    test_type_ids()
+    test_equivalent_orders_share_cache()
+    test_cache_bound_scales_with_size()
+    test_random_search_uses_cache()
+    
+    print("\n" + "=" * 50)
+    print("ALL CANONICALIZATION TESTS PASSED")
+    print("=" * 50)
@@ -0,0 +1,88 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import random
+import tempfile
+
+from models import Container, Cylinder
+from solvers import CargoPackingSolver
+
+def make_solver(**options):
+    container = Container(15, 12, 2000)
+    cylinders = [
+        Cylinder(0, 2.5, 150),
+        Cylinder(1, 2.0, 100),
+        Cylinder(2, 2.0, 120),
+        Cylinder(3, 1.5, 80),
+        Cylinder(4, 1.2, 60)
+    ]
+    return CargoPackingSolver(container, cylinders, population_size=20, mutation_rate=0.1, step_size=0.5, **options)
+
+
+def test_resume_is_exact():
+    print("Testing checkpoint and resume...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'run.ckpt')
+        
+        random.seed(42)
+        full = make_solver()
+        full.solve(max_generations=12, verbose=False, checkpoint_path=path, checkpoint_interval=5)
+        
+        print(f"  Checkpoints written: {full.checkpoint_stats['count']}")
+        print(f"  Checkpoint size: {full.checkpoint_stats['last_bytes']} bytes")
+        
+        assert full.checkpoint_stats['count'] == 2
+        
+        # The file holds the state after generation 10, as if the run crashed there
+        random.seed(0)
+        resumed = CargoPackingSolver.resume(path, verbose=False, checkpoint=False)
+        
+        assert len(resumed.generation_history) == 12
+        assert resumed.generation_history == full.generation_history
+        assert resumed.best_solution.genes == full.best_solution.genes
+        assert resumed.best_fitness == full.best_fitness
+        assert [ind.genes for ind in resumed.population.population] == \
+               [ind.genes for ind in full.population.population]
+    
+    print("  Checkpoint test passed")
+
+
+def test_resume_keeps_profile():
+    print("\nTesting profiling across a resume...")
+    
+    from scripts.solve_instances import solve_instance
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'run.ckpt')
+        
+        profiled = make_solver(profile=True)
+        profiled.solve(max_generations=6, verbose=False, checkpoint_path=path, checkpoint_interval=5)
+        
+        # The checkpoint remembers that the run was profiled
+        resumed, _ = CargoPackingSolver.load_checkpoint(path)
+        assert resumed.profiler is not None
+        assert CargoPackingSolver.load_checkpoint(path, profile=False)[0].profiler is None
+        
+        # An unprofiled checkpoint resumed by a profile=True run is profiled
+        plain = make_solver()
+        plain.solve(max_generations=12, verbose=False, checkpoint_path=path, checkpoint_interval=5)
+        solver = solve_instance(plain.container, plain.cylinders, exact_threshold=2, checkpoint_path=path,
+                                profile=True, verbose=False)
+        assert len(solver.generation_history) == 12
+        assert solver.profile_summary()
+    
+    print("  Profile resume test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RUNNING CHECKPOINT TESTS")
+    print("=" * 50)
+    
+    test_resume_is_exact()
+    test_resume_keeps_profile()
+    
+    print("\n" + "=" * 50)
+    print("ALL CHECKPOINT TESTS PASSED")
+    print("=" * 50)
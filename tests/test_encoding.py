@@ -0,0 +1,92 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+
+from api.encoding import downsample_indices, columnar_result
+
+def make_result(n, generations):
+    return {
+        'algorithm': 'Genetic Algorithm',
+        'solution': list(range(n)),
+        'fitness': 10500.0,
+        'details': {
+            'valid': True,
+            'center_of_mass': (10.0, 7.5),
+            'packing_density': 0.6,
+            'cylinders': [
+                {'id': i, 'x': i * 0.123456789, 'y': i * 0.987654321, 'diameter': 1.5, 'radius': 0.75, 'weight': 80.0}
+                for i in range(n)
+            ]
+        },
+        'generation_history': [{'generation': g, 'best': 10000.0 + g, 'avg': 9000.0 + g} for g in range(generations)]
+    }
+
+
+def test_downsample_indices():
+    print("Testing history downsampling...")
+
+    assert downsample_indices(5, 10) == [0, 1, 2, 3, 4]
+    indices = downsample_indices(500, 100)
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 499
+    assert indices == sorted(set(indices))
+
+    print("  Downsampling test passed")
+
+
+def test_columnar_result():
+    print("\nTesting the columnar encoding...")
+
+    result = make_result(1000, 500)
+    encoded = columnar_result(result, {'history_points': 50})
+
+    columns = encoded['details']['columns']
+    assert columns['id'] == list(range(1000))
+    assert columns['x'][7] == result['details']['cylinders'][7]['x']
+    assert 'cylinders' not in encoded['details']
+    assert len(encoded['history']['generation']) == 50
+    assert encoded['history']['total'] == 500
+    assert encoded['history']['best'][-1] == 10499.0
+    # The full result is left as it was (it may be cached)
+    assert 'cylinders' in result['details']
+
+    full_size = len(json.dumps(result))
+    compact_size = len(json.dumps(encoded))
+    print(f"  1000 cylinders, 500 generations: {full_size} -> {compact_size} bytes")
+    assert compact_size < full_size / 2
+
+    print("  Columnar encoding test passed")
+
+
+def test_solve_endpoint_formats():
+    print("\nTesting response_format on /api/solve...")
+
+    from api.app import create_app
+    client = create_app().test_client()
+    body = {
+        'algorithm': 'genetic',
+        'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+        'cylinders': [{'diameter': 3, 'weight': 200}, {'diameter': 2, 'weight': 100}, {'diameter': 2, 'weight': 100}],
+        'params': {'population_size': 10, 'max_generations': 12, 'seed': 77, 'use_store': False}
+    }
+
+    full = client.post('/api/solve', json=body).get_json()['result']
+    body['params'].update(response_format='columnar', history_points=4)
+    response = client.post('/api/solve', json=body)
+    compact = response.get_json()['result']
+
+    # Both formats share one cache entry
+    assert response.headers['X-Cache'] == 'HIT'
+    assert compact['format'] == 'columnar'
+    assert compact['details']['columns']['id'] == [c['id'] for c in full['details']['cylinders']]
+    assert compact['history']['generation'] == [0, 4, 7, 11]
+
+    print("  Endpoint format test passed")
+
+
+if __name__ == "__main__":
+    test_downsample_indices()
+    test_columnar_result()
+    test_solve_endpoint_formats()
+    print("\nAll encoding tests passed!")
@@ -0,0 +1,143 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import tempfile
+import numpy as np
+
+from models import Container, Cylinder, DNA
+from utils import (
+    load_instance_from_file,
+    iter_instances_from_file,
+    write_instances_to_file,
+    SolutionStreamWriter,
+    iter_solutions_from_file,
+    load_solution_from_file,
+    write_binary_arrays,
+    load_binary,
+    text_to_binary,
+    binary_to_text
+)
+
+def make_instances(count):
+    for n in range(count):
+        container = Container(20 + n, 15, 1000)
+        cylinders = [Cylinder(i, 2.0 - 0.5 * i, 100 - 10 * i) for i in range(3)]
+        yield f"case_{n}", container, cylinders
+
+
+def test_multi_instance_round_trip():
+    print("Testing multi-instance file round trip...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'all.instances')
+        write_instances_to_file(path, make_instances(3))
+
+        loaded = list(iter_instances_from_file(path, with_names=True))
+        print(f"  Loaded {len(loaded)} instances")
+
+        assert [name for name, _, _ in loaded] == ['case_0', 'case_1', 'case_2']
+        assert [container.width for _, container, _ in loaded] == [20, 21, 22]
+        assert [cyl.diameter for cyl in loaded[2][2]] == [2.0, 1.5, 1.0]
+
+    print("  Multi-instance round trip test passed")
+
+
+def test_plain_file_is_one_instance():
+    print("\nTesting that a plain instance file reads as one instance...")
+
+    path = os.path.join(os.path.dirname(__file__), '..', 'data', 'reference', 'instance_01.txt')
+    container, cylinders = load_instance_from_file(path)
+
+    loaded = list(iter_instances_from_file(path, with_names=True))
+    assert len(loaded) == 1
+
+    name, container2, cylinders2 = loaded[0]
+    assert name == 'instance_01'
+    assert container2.width == container.width
+    assert len(cylinders2) == len(cylinders)
+
+    print("  Plain file test passed")
+
+
+def test_solution_stream_writer():
+    print("\nTesting streamed solutions...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'solutions.txt')
+
+        with SolutionStreamWriter(path) as writer:
+            for n in range(2):
+                dna = DNA(3)
+                dna.genes = [n, 2, 1 - n]
+                writer.write(f"case_{n}", dna, 10000.0 + n)
+
+                # Every record is complete on disk as soon as it is written
+                solutions = list(iter_solutions_from_file(path))
+                assert len(solutions) == n + 1
+
+        solutions = dict(iter_solutions_from_file(path))
+        print(f"  Read back: {sorted(solutions)}")
+
+        assert solutions['case_1']['placement_order'] == [1, 2, 0]
+        assert solutions['case_1']['fitness'] == 10001.0
+
+    print("  Stream writer test passed")
+
+
+def test_binary_round_trip():
+    print("\nTesting binary format round trip...")
+
+    data = os.path.join(os.path.dirname(__file__), '..', 'data')
+    instance_file = os.path.join(data, 'challenging', 'instance_02.txt')
+    solution_file = os.path.join(data, 'solutions', 'challenging', 'instance_02_solution.txt')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        binary_file = os.path.join(tmp, 'instance_02.bin')
+        text_to_binary(instance_file, binary_file, solution_file=solution_file)
+
+        packing = load_binary(binary_file)
+        container, cylinders = load_instance_from_file(instance_file)
+        assert isinstance(packing.weight, np.memmap)
+        assert packing.count == len(cylinders)
+        assert packing.container.width == container.width
+        assert packing.diameter.tolist() == [c.diameter for c in cylinders]
+        assert packing.solution() == load_solution_from_file(solution_file)
+
+        instance_copy = os.path.join(tmp, 'instance.txt')
+        solution_copy = os.path.join(tmp, 'solution.txt')
+        binary_to_text(binary_file, instance_copy, solution_file=solution_copy)
+
+        container2, cylinders2 = load_instance_from_file(instance_copy)
+        assert [(c.diameter, c.weight) for c in cylinders2] == [(c.diameter, c.weight) for c in cylinders]
+        with open(solution_file) as a, open(solution_copy) as b:
+            assert a.read() == b.read()
+
+    print("  Binary round trip test passed")
+
+
+def test_binary_instance_without_solution():
+    print("\nTesting a large binary instance without a solution...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'large.bin')
+        count = 20000
+        write_binary_arrays(path, Container(500, 500, 1e7), np.full(count, 1.5), np.arange(count))
+
+        packing = load_binary(path)
+        assert packing.solution() is None
+        assert packing.weight[-1] == count - 1
+
+        cylinders = packing.cylinders()
+        assert len(cylinders) == count
+        assert not any(c.placed for c in cylinders)
+
+    print("  Large binary instance test passed")
+
+
+if __name__ == "__main__":
+    test_multi_instance_round_trip()
+    test_plain_file_is_one_instance()
+    test_solution_stream_writer()
+    test_binary_round_trip()
+    test_binary_instance_without_solution()
+    print("\nAll file I/O tests passed!")
@@ -0,0 +1,82 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import random
+
+from models import Container, Cylinder
+from solvers import CargoPackingSolver
+
+def make_solver():
+    container = Container(20, 15, 2000)
+    specs = [(3.0, 200), (2.5, 150), (2.0, 100), (2.0, 100), (1.5, 80), (1.5, 80), (1.2, 60)]
+    cylinders = [Cylinder(i, d, w) for i, (d, w) in enumerate(specs)]
+    return CargoPackingSolver(container, cylinders, population_size=20, mutation_rate=0.05, step_size=0.5)
+
+
+def test_event_sequence():
+    print("Testing the GA event stream...")
+
+    random.seed(3)
+    solver = make_solver()
+    events = list(solver.iter_solve(max_generations=6, use_local_search=True))
+    types = [event['type'] for event in events]
+    print(f"  Events: {types}")
+
+    assert types == ['start'] + ['generation'] * 6 + ['local_search', 'complete']
+    assert [e['generation'] for e in events if e['type'] == 'generation'] == list(range(6))
+    assert events[-1]['reason'] == 'max_generations'
+    assert events[-1]['best_fitness'] == solver.best_fitness
+
+    # best_fitness never drops and 'improved' marks every rise
+    best = 0
+    for event in events[1:7]:
+        assert event['best_fitness'] >= best
+        assert event['improved'] == (event['best_fitness'] > best)
+        best = event['best_fitness']
+
+    print("  Event sequence test passed")
+
+
+def test_callback_matches_iterator():
+    print("\nTesting solve() callbacks against iter_solve()...")
+
+    random.seed(8)
+    iterated = make_solver()
+    expected = list(iterated.iter_solve(max_generations=5))
+
+    random.seed(8)
+    received = []
+    solver = make_solver()
+    best = solver.solve(max_generations=5, verbose=False, callback=received.append)
+
+    strip = lambda events: [{k: v for k, v in e.items() if k != 'seconds'} for e in events]
+    assert strip(received) == strip(expected)
+    assert best.genes == iterated.best_solution.genes
+
+    print("  Callback test passed")
+
+
+def test_early_stops():
+    print("\nTesting time limits and closing the stream early...")
+
+    solver = make_solver()
+    events = list(solver.iter_solve(max_generations=1000, time_limit=0))
+    assert events[-1]['reason'] == 'time_limit'
+    assert len(solver.generation_history) == 1
+
+    solver = make_solver()
+    stream = solver.iter_solve(max_generations=1000)
+    for event in stream:
+        if event['type'] == 'generation' and event['generation'] == 2:
+            break
+    stream.close()
+    assert len(solver.generation_history) == 3
+
+    print("  Early stop test passed")
+
+
+if __name__ == "__main__":
+    test_event_sequence()
+    test_callback_matches_iterator()
+    test_early_stops()
+    print("\nAll GA event tests passed!")
@@ -0,0 +1,84 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import check_all_constraints
+from utils.generator import (
+    generate_instance,
+    generate_feasible_instance,
+    generate_suite,
+    FAMILIES,
+    TIGHTNESS
+)
+from benchmarks.scaling import run_curve
+
+def describe(container, cylinders):
+    return (container.width, container.depth, container.max_weight,
+            [(c.diameter, c.weight) for c in cylinders])
+
+
+def test_generator_is_seeded():
+    print("Testing that generated instances depend only on the seed...")
+
+    for family in FAMILIES:
+        a = generate_instance(50, family, 'tight', seed=7)
+        b = generate_instance(50, family, 'tight', seed=7)
+        c = generate_instance(50, family, 'tight', seed=8)
+        assert describe(*a) == describe(*b)
+        assert describe(*a) != describe(*c)
+
+    names = [name for name, _, _ in generate_suite([10, 20], seed=1)]
+    assert len(names) == len(FAMILIES) * len(TIGHTNESS) * 2
+    assert len(set(names)) == len(names)
+
+    print("  Seeded generator test passed")
+
+
+def test_identical_family_has_few_types():
+    print("\nTesting the many-identical family...")
+
+    _, cylinders = generate_instance(200, 'identical', seed=3)
+    types = {(c.diameter, c.weight) for c in cylinders}
+    print(f"  {len(types)} types among {len(cylinders)} cylinders")
+
+    assert len(types) <= 5
+
+    print("  Identical family test passed")
+
+
+def test_feasible_witness_is_valid():
+    print("\nTesting feasible-by-construction instances...")
+
+    for family in FAMILIES:
+        for tightness in TIGHTNESS:
+            container, cylinders, witness = generate_feasible_instance(150, family, tightness, seed=11)
+            for cylinder, (x, y) in zip(cylinders, witness):
+                cylinder.set_position(x, y)
+
+            valid, message = check_all_constraints(cylinders, container)
+            assert valid, f"{family}/{tightness}: {message}"
+
+    print("  Feasible witness test passed")
+
+
+def test_scaling_curve_smoke():
+    print("\nTesting a small scaling curve...")
+
+    rows = run_curve('uniform', 'loose', [5, 10, 100000], seed=0, step_size=0.5,
+                     budget=1.0, repeats=2, verbose=False)
+    print(f"  Statuses: {[row['status'] for row in rows]}")
+
+    assert rows[0]['status'] == 'ok'
+    assert rows[1]['evaluations_per_second'] > 0
+    # Far beyond the budget, so it is predicted and skipped rather than run
+    assert rows[2]['status'] == 'skipped'
+
+    print("  Scaling curve smoke test passed")
+
+
+if __name__ == "__main__":
+    test_generator_is_seeded()
+    test_identical_family_has_few_types()
+    test_feasible_witness_is_valid()
+    test_scaling_curve_smoke()
+    print("\nAll generator tests passed!")
@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.import_time import check_imports, parse_importtime, BUDGETS_MS
+
+def test_parse_importtime():
+    print("Testing the -X importtime parser...")
+
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   zlib",
+        "import time:       800 |       2500 | solvers",
+        "some warning"
+    ])
+    assert parse_importtime(stderr) == {'zlib': 120, 'solvers': 2500}
+
+    print("  Parser test passed")
+
+
+def test_entry_points_stay_light():
+    print("\nTesting that entry points do not load heavy modules...")
+
+    # Timing budgets are left to the benchmark; only what gets loaded is checked here
+    rows = check_imports(BUDGETS_MS, repeats=1, scale=1000.0)
+    for row in rows:
+        print(f"  {row['module']}: {row['ms']:.1f}ms {row['heavy'] or ''}")
+        assert row['heavy'] == [], f"{row['module']} loads {row['heavy']}"
+
+    print("  Entry point test passed")
+
+
+def test_lazy_names_resolve():
+    print("\nTesting lazily imported names...")
+
+    import algorithms
+    import solvers
+    import utils
+    import visualization
+    from algorithms import hill_climbing, BranchAndBound
+    from solvers import PortfolioSolver
+    from utils import load_binary
+
+    assert callable(hill_climbing) and callable(load_binary)
+    assert BranchAndBound.__name__ == 'BranchAndBound'
+    assert PortfolioSolver.__module__ == 'solvers.portfolio'
+    assert 'MatplotlibDrawer' in dir(visualization)
+    assert 'text_to_binary' in dir(utils)
+
+    try:
+        algorithms.no_such_algorithm
+        assert False, "unknown names should still raise"
+    except AttributeError:
+        pass
+
+    print("  Lazy name test passed")
+
+
+if __name__ == "__main__":
+    test_parse_importtime()
+    test_entry_points_stay_light()
+    test_lazy_names_resolve()
+    print("\nAll import tests passed!")
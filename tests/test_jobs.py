@@ -0,0 +1,114 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+import time
+
+from api.jobs import JobManager, QueueFull
+
+def wait_for(job, timeout=10):
+    deadline = time.time() + timeout
+    while not job.finished and time.time() < deadline:
+        time.sleep(0.01)
+    return job
+
+
+def test_queue_limit_and_cancel():
+    print("Testing queue limits and cancellation...")
+
+    manager = JobManager(max_workers=1, max_queued=2)
+    release = threading.Event()
+
+    def blocked(job):
+        # Stops early when cancelled, like the GA between generations
+        while not release.is_set() and not job.cancel_requested:
+            time.sleep(0.01)
+        return 'partial' if job.cancel_requested else 'full'
+
+    running = manager.submit(blocked)
+    while running.status != 'running':
+        time.sleep(0.01)
+    queued = [manager.submit(blocked), manager.submit(blocked)]
+
+    try:
+        manager.submit(blocked)
+        assert False, "third waiting job should be refused"
+    except QueueFull:
+        pass
+
+    # A waiting job never starts, a running one is asked to stop
+    assert manager.cancel(queued[0].id).status == 'cancelled'
+    manager.cancel(running.id)
+    assert wait_for(running).status == 'cancelled'
+    assert running.result == 'partial'
+
+    release.set()
+    assert wait_for(queued[1]).status == 'done'
+    assert queued[1].result == 'full'
+    print(f"  Stats: {manager.stats()}")
+
+    manager.shutdown()
+    print("  Queue and cancel test passed")
+
+
+def test_failures_and_retention():
+    print("\nTesting failed jobs and bounded retention...")
+
+    manager = JobManager(max_workers=1, max_queued=10, max_finished=3)
+
+    def fail(job):
+        raise ValueError("bad instance")
+
+    failed = wait_for(manager.submit(fail))
+    assert failed.status == 'failed'
+    assert failed.error == "bad instance"
+
+    jobs = [wait_for(manager.submit(lambda job, i=i: i)) for i in range(4)]
+    assert [job.result for job in jobs] == [0, 1, 2, 3]
+    # Only the newest finished jobs are kept
+    assert manager.get(failed.id) is None
+    assert manager.get(jobs[0].id) is None
+    assert manager.get(jobs[-1].id) is jobs[-1]
+
+    manager.shutdown()
+    print("  Failure and retention test passed")
+
+
+def test_job_endpoints():
+    print("\nTesting the /api/jobs endpoints...")
+
+    from api.app import create_app
+    client = create_app().test_client()
+    body = {
+        'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+        'cylinders': [{'diameter': 3, 'weight': 200}, {'diameter': 2, 'weight': 100},
+                      {'diameter': 2, 'weight': 100}],
+        'params': {'population_size': 10, 'max_generations': 5, 'use_local_search': False}
+    }
+
+    response = client.post('/api/jobs', json=body)
+    assert response.status_code == 202
+    job_id = response.get_json()['job']['id']
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        response = client.get(f'/api/jobs/{job_id}/result')
+        if response.status_code != 202:
+            break
+        time.sleep(0.05)
+
+    data = response.get_json()
+    assert response.status_code == 200
+    assert data['job']['status'] == 'done'
+    assert data['job']['progress']['generation'] == 5
+    assert sorted(data['result']['solution']) == [0, 1, 2]
+
+    assert client.get('/api/jobs/missing').status_code == 404
+    print("  Endpoint test passed")
+
+
+if __name__ == "__main__":
+    test_queue_limit_and_cancel()
+    test_failures_and_retention()
+    test_job_endpoints()
+    print("\nAll job queue tests passed!")
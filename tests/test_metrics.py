@@ -0,0 +1,93 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models import Container, Cylinder
+from solvers import CargoPackingSolver
+from utils import metrics
+from utils.metrics import Registry
+
+def test_text_format():
+    print("Testing the Prometheus text format...")
+
+    registry = Registry()
+    requests = registry.counter('requests_total', 'Requests', ('path',))
+    latency = registry.histogram('latency_seconds', 'Latency', buckets=(0.1, 1.0))
+    registry.gauge('temperature', 'Computed at scrape time', function=lambda: 21.5)
+
+    requests.inc(path='/a')
+    requests.inc(2, path='say "hi"')
+    for value in (0.05, 0.5, 0.5, 3.0):
+        latency.observe(value)
+
+    text = registry.render()
+    print(text)
+
+    assert '# TYPE requests_total counter' in text
+    assert 'requests_total{path="/a"} 1' in text
+    assert 'requests_total{path="say \\"hi\\""} 2' in text
+    # Buckets are cumulative and end with +Inf
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+    assert 'latency_seconds_count 4' in text
+    assert 'latency_seconds_sum 4.05' in text
+    assert 'temperature 21.5' in text
+
+    print("  Text format test passed")
+
+
+def test_solver_feeds_counters():
+    print("\nTesting solver throughput counters...")
+
+    container = Container(20, 15, 2000)
+    cylinders = [Cylinder(i, d, w) for i, (d, w) in enumerate([(3.0, 200), (2.0, 100), (2.0, 100), (1.5, 80)])]
+
+    generations = metrics.GA_GENERATIONS.get()
+    evaluations = metrics.FITNESS_EVALUATIONS.get()
+    placements = metrics.PLACEMENTS.get()
+
+    solver = CargoPackingSolver(container, cylinders, population_size=12, mutation_rate=0.05, step_size=0.5)
+    solver.solve(max_generations=4, verbose=False)
+    cache = solver.population.cache
+
+    assert metrics.GA_GENERATIONS.get() - generations == 4
+    assert metrics.FITNESS_EVALUATIONS.get() - evaluations == 4 * 12
+    assert metrics.PLACEMENTS.get() - placements == cache.misses
+
+    print("  Throughput counter test passed")
+
+
+def test_metrics_endpoint():
+    print("\nTesting /api/metrics...")
+
+    from api.app import create_app
+    client = create_app().test_client()
+    client.post('/api/solve', json={
+        'algorithm': 'greedy',
+        'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+        'cylinders': [{'diameter': 3, 'weight': 200}],
+        'params': {'use_cache': False}
+    })
+
+    response = client.get('/api/metrics')
+    text = response.get_data(as_text=True)
+    assert response.mimetype == 'text/plain'
+
+    for name in ('cargo_http_request_duration_seconds_bucket{endpoint="/api/solve",method="POST",status="200"',
+                 'cargo_solve_duration_seconds_count{algorithm="greedy",outcome="solved"}',
+                 'cargo_solves_in_flight{source="solve"} 0',
+                 'cargo_queue_depth{queue="solve"} 0',
+                 'cargo_fitness_evaluations_per_second',
+                 'cargo_fitness_cache_hit_ratio',
+                 'process_resident_memory_bytes'):
+        assert name in text, name
+
+    print("  Metrics endpoint test passed")
+
+
+if __name__ == "__main__":
+    test_text_format()
+    test_solver_feeds_counters()
+    test_metrics_endpoint()
+    print("\nAll metrics tests passed!")
@@ -133,6 +133,40 @@ def test_best_individual():
     print("  Best individual test passed")
 
 
+def test_seeded_population():
+    print("\nTesting population seeding...")
+    
+    container = Container(20, 15, 1000)
+    cylinders = [Cylinder(i, 2.0, 100) for i in range(4)]
+    placer = GreedyPlacer(step_size=0.5)
+    
+    population = Population(
+        size=10,
+        num_cylinders=4,
+        mutation_rate=0.01,
+        cylinders=cylinders,
+        container=container,
+        placer=placer
+    )
+    
+    seeded = population.seed([[3, 2, 1, 0], [3, 2, 1, 0], [0, 1, 2, 3]], fraction=0.5)
+    
+    print(f"  Seeded individuals: {seeded}")
+    
+    assert seeded == 5
+    assert population.population[0].genes == [3, 2, 1, 0]
+    assert population.population[1].genes == [0, 1, 2, 3]
+    assert all(sorted(ind.genes) == [0, 1, 2, 3] for ind in population.population)
+    
+    try:
+        population.seed([[0, 1, 1, 2]])
+        assert False, "invalid order accepted"
+    except ValueError:
+        pass
+    
+    print("  Population seeding test passed")
+
+
 if __name__ == "__main__":
     print("=" * 50)
     print("RUNNING POPULATION TESTS")
@@ -142,6 +176,7 @@ if __name__ == "__main__":
     test_fitness_calculation()
     test_evolution()
     test_best_individual()
+    test_seeded_population()
     
     print("\n" + "=" * 50)
     print("ALL POPULATION TESTS PASSED")
@@ -0,0 +1,83 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+
+from models import Container, Cylinder
+from solvers import PortfolioSolver
+from solvers.portfolio import STOP_GRACE_SECONDS
+
+def test_portfolio_proves_small_instance():
+    print("Testing portfolio on a small instance...")
+    
+    container = Container(20, 15, 1000)
+    cylinders = [
+        Cylinder(0, 2.0, 100),
+        Cylinder(1, 1.5, 80),
+        Cylinder(2, 2.0, 100),
+        Cylinder(3, 1.0, 50)
+    ]
+    
+    solver = PortfolioSolver(container, cylinders, step_size=0.5)
+    solution = solver.solve(time_limit=30, seed=1, verbose=False)
+    
+    print(f"  Winner: {solver.winner}, fitness: {solver.best_fitness:.2f}")
+    print(f"  Proven optimal: {solver.proven_optimal}")
+    
+    assert solution is not None
+    assert solver.proven_optimal
+    assert solver.winner in solver.member_results
+    assert solution.fitness == max(r['best_fitness'] for r in solver.member_results.values())
+    
+    print("  Portfolio test passed")
+
+
+def test_portfolio_deadline():
+    print("\nTesting portfolio deadline...")
+    
+    container = Container(20, 15, 1000)
+    cylinders = [Cylinder(i, 2.0, 50) for i in range(4)]
+    
+    solver = PortfolioSolver(container, cylinders, step_size=0.5)
+    solver.solve(time_limit=1, members=('greedy', 'random_search'), seed=1, verbose=False)
+    
+    assert not solver.proven_optimal
+    assert solver.best_fitness > 0
+    
+    print("  Deadline test passed")
+
+
+def test_members_stop_on_deadline():
+    print("\nTesting that every member stops by itself...")
+    
+    container = Container(20, 15, 5000)
+    cylinders = [Cylinder(i, 1.0 + 0.15 * i, 50 + 7 * i) for i in range(12)]
+    
+    # Branch and bound cannot finish 12 distinct cylinders in a second
+    solver = PortfolioSolver(container, cylinders, step_size=0.5, exact_threshold=12)
+    start = time.time()
+    solution = solver.solve(time_limit=1, seed=1, verbose=False)
+    elapsed = time.time() - start
+    
+    print(f"  Stopped after {elapsed:.2f}s")
+    assert solution is not None
+    assert not solver.proven_optimal
+    assert elapsed < 1 + STOP_GRACE_SECONDS
+    assert not any(r['terminated'] for r in solver.member_results.values())
+    assert all(r['finished'] for r in solver.member_results.values())
+    
+    print("  Stop test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RUNNING PORTFOLIO TESTS")
+    print("=" * 50)
+    
+    test_portfolio_proves_small_instance()
+    test_portfolio_deadline()
+    test_members_stop_on_deadline()
+    
+    print("\n" + "=" * 50)
+    print("ALL PORTFOLIO TESTS PASSED")
+    print("=" * 50)
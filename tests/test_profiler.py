@@ -0,0 +1,87 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import random
+
+from models import Container, Cylinder
+from solvers import CargoPackingSolver
+from utils.profiler import PhaseProfiler
+
+def make_solver(profile):
+    container = Container(20, 15, 2000)
+    specs = [(3.0, 200), (2.5, 150), (2.0, 100), (2.0, 100), (1.5, 80), (1.5, 80), (1.2, 60)]
+    cylinders = [Cylinder(i, d, w) for i, (d, w) in enumerate(specs)]
+    return CargoPackingSolver(container, cylinders, population_size=20, mutation_rate=0.05,
+                              step_size=0.5, profile=profile)
+
+
+def test_profiling_does_not_change_results():
+    print("Testing that profiling leaves the search unchanged...")
+
+    random.seed(5)
+    plain = make_solver(profile=False)
+    plain.solve(max_generations=8, verbose=False, use_local_search=True)
+
+    random.seed(5)
+    profiled = make_solver(profile=True)
+    profiled.solve(max_generations=8, verbose=False, use_local_search=True)
+
+    assert plain.best_solution.genes == profiled.best_solution.genes
+    assert plain.best_fitness == profiled.best_fitness
+    assert [h['best'] for h in plain.generation_history] == [h['best'] for h in profiled.generation_history]
+
+    assert plain.profile_summary() is None
+    assert 'phases' not in plain.generation_history[0]
+
+    print("  Same results with and without profiling")
+
+
+def test_generation_phases_and_summary():
+    print("\nTesting per-generation phases and the run summary...")
+
+    random.seed(1)
+    solver = make_solver(profile=True)
+    solver.solve(max_generations=5, verbose=False, use_local_search=True)
+
+    for stats in solver.generation_history:
+        phases = stats['phases']
+        assert phases['selection']['calls'] == 2 * 20
+        assert phases['crossover']['calls'] == 20
+        # Phases are disjoint parts of the generation
+        assert sum(p['seconds'] for p in phases.values()) <= stats['seconds']
+
+    summary = solver.profile_summary()
+    print(f"  Phases: {list(summary)}")
+
+    for phase in ('placement', 'deepcopy', 'cache', 'selection', 'local_search'):
+        assert phase in summary
+    assert abs(sum(p['percent'] for p in summary.values()) - 100.0) < 1e-6
+    # Every fitness request is a cache lookup; only misses are placed
+    assert summary['placement']['calls'] <= summary['cache']['calls']
+
+    print("  Phase accounting test passed")
+
+
+def test_profiler_totals():
+    print("\nTesting PhaseProfiler bookkeeping...")
+
+    profiler = PhaseProfiler()
+    profiler.add('a', 1.0)
+    profiler.add('a', 0.5)
+    first = profiler.end_generation()
+    profiler.add('b', 3.0, calls=4)
+
+    assert first == {'a': {'seconds': 1.5, 'calls': 2}}
+    summary = profiler.summary()
+    assert list(summary) == ['b', 'a']
+    assert summary['b']['calls'] == 4
+    assert summary['b']['percent'] == 100.0 * 3.0 / 4.5
+
+    print("  Bookkeeping test passed")
+
+
+if __name__ == "__main__":
+    test_profiling_does_not_change_results()
+    test_generation_phases_and_summary()
+    test_profiler_totals()
+    print("\nAll profiler tests passed!")
@@ -0,0 +1,133 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import shutil
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
+
+from models import Container, Cylinder
+from visualization.matplotlib_drawer import MatplotlibDrawer, is_up_to_date, visualize_all_solutions
+
+def make_layout(n):
+    container = Container(20.0, 15.0, 100000.0)
+    cylinders = []
+    for i in range(n):
+        cyl = Cylinder(i, 0.5 + (i % 5) * 0.1, 10.0)
+        cyl.set_position(1.0 + (i % 18), 1.0 + (i // 18) % 13)
+        cylinders.append(cyl)
+    return container, cylinders
+
+
+def test_fast_mode_uses_one_collection():
+    print("Testing collection rendering...")
+
+    container, cylinders = make_layout(50)
+    fig, ax = MatplotlibDrawer(container, cylinders, fast=True).draw(show=False)
+
+    collections = [c for c in ax.collections if isinstance(c, PatchCollection)]
+    assert len(collections) == 1
+    assert len(collections[0].get_paths()) == 50
+    # Only the container and safe zone are separate patches
+    assert len(ax.patches) == 2
+    # Three labels per cylinder plus the info box
+    assert len(ax.texts) == 50 * 3 + 1
+
+    fig, ax = MatplotlibDrawer(container, cylinders).draw(show=False)
+    assert len(ax.patches) == 52
+    plt.close('all')
+
+    print("  ✓ One collection instead of 50 patches")
+
+
+def test_label_threshold():
+    print("Testing label decimation...")
+
+    container, cylinders = make_layout(100)
+    fig, ax = MatplotlibDrawer(container, cylinders, fast=True, label_threshold=10).draw(show=False)
+    labels = [t for t in ax.texts if t.get_text().isdigit()]
+    assert len(ax.texts) == 10 + 1
+    # The largest cylinders keep their ids
+    largest = max(c.radius for c in cylinders)
+    labelled = {int(t.get_text()) for t in labels}
+    assert all(cylinders[i].radius == largest for i in labelled)
+
+    # Below the threshold everything is labelled as usual
+    fig, ax = MatplotlibDrawer(container, cylinders[:5], label_threshold=10).draw(show=False)
+    assert len(ax.texts) == 5 * 3 + 1
+    plt.close('all')
+
+    print("  ✓ Only the 10 largest ids are drawn")
+
+
+def test_is_up_to_date():
+    print("Testing image freshness check...")
+
+    tmp = tempfile.mkdtemp()
+    try:
+        source = os.path.join(tmp, 'solution.txt')
+        image = os.path.join(tmp, 'image.png')
+        open(source, 'w').close()
+        assert not is_up_to_date(image, source)
+
+        open(image, 'w').close()
+        os.utime(source, (time.time() - 10, time.time() - 10))
+        assert is_up_to_date(image, source)
+
+        os.utime(source, (time.time() + 10, time.time() + 10))
+        assert not is_up_to_date(image, source)
+    finally:
+        shutil.rmtree(tmp)
+
+    print("  ✓ Stale images are detected")
+
+
+def test_visualize_all_solutions_parallel_and_skip():
+    print("Testing parallel batch rendering...")
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    tmp = tempfile.mkdtemp()
+    try:
+        data_dir = os.path.join(tmp, 'data')
+        solutions_dir = os.path.join(data_dir, 'solutions')
+        output_dir = os.path.join(tmp, 'images')
+        for name in ('instance_01', 'instance_02'):
+            os.makedirs(os.path.join(data_dir, 'reference'), exist_ok=True)
+            os.makedirs(os.path.join(solutions_dir, 'reference'), exist_ok=True)
+            shutil.copy(os.path.join(root, 'data', 'reference', f'{name}.txt'),
+                        os.path.join(data_dir, 'reference', f'{name}.txt'))
+            shutil.copy(os.path.join(root, 'data', 'solutions', 'reference', f'{name}_solution.txt'),
+                        os.path.join(solutions_dir, 'reference', f'{name}_solution.txt'))
+
+        counts = visualize_all_solutions(solutions_dir, output_dir, workers=2, fast=True, data_dir=data_dir)
+        assert counts == {'rendered': 2, 'skipped': 0, 'failed': 0}
+        assert os.path.exists(os.path.join(output_dir, 'reference', 'instance_01.png'))
+
+        # Nothing changed, nothing to draw
+        counts = visualize_all_solutions(solutions_dir, output_dir, workers=2, data_dir=data_dir)
+        assert counts == {'rendered': 0, 'skipped': 2, 'failed': 0}
+
+        # A newer solution is redrawn
+        later = time.time() + 10
+        os.utime(os.path.join(solutions_dir, 'reference', 'instance_02_solution.txt'), (later, later))
+        counts = visualize_all_solutions(solutions_dir, output_dir, workers=1, data_dir=data_dir)
+        assert counts == {'rendered': 1, 'skipped': 1, 'failed': 0}
+
+        counts = visualize_all_solutions(solutions_dir, output_dir, force=True, data_dir=data_dir)
+        assert counts['rendered'] == 2
+    finally:
+        shutil.rmtree(tmp)
+
+    print("  ✓ Up-to-date images are skipped")
+
+
+if __name__ == "__main__":
+    test_fast_mode_uses_one_collection()
+    test_label_threshold()
+    test_is_up_to_date()
+    test_visualize_all_solutions_parallel_and_skip()
+    print("\nAll rendering tests passed")
@@ -0,0 +1,136 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import tempfile
+
+from models import Container, Cylinder
+from api.result_cache import ResultCache, request_fingerprint
+
+def make_instance(specs):
+    return Container(20, 15, 1000), [Cylinder(i, d, w) for i, (d, w) in enumerate(specs)]
+
+
+def test_fingerprint():
+    print("Testing request fingerprints...")
+
+    container, cylinders = make_instance([(2.0, 100), (1.5, 80)])
+    _, swapped = make_instance([(1.5, 80), (2.0, 100)])
+    key = request_fingerprint(container, cylinders, 'genetic', {'seed': 1, 'max_generations': 50})
+
+    # Param order does not matter, everything else does
+    assert key == request_fingerprint(container, cylinders, 'genetic', {'max_generations': 50, 'seed': 1})
+    assert key != request_fingerprint(container, cylinders, 'genetic', {'seed': 2, 'max_generations': 50})
+    assert key != request_fingerprint(container, cylinders, 'greedy', {'seed': 1, 'max_generations': 50})
+    # Results refer to cylinders by index, so the order is part of the key
+    assert key != request_fingerprint(container, swapped, 'genetic', {'seed': 1, 'max_generations': 50})
+
+    print("  Fingerprint test passed")
+
+
+def test_lru_and_file_backing():
+    print("\nTesting LRU eviction and the file-backed cache...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.db')
+        cache = ResultCache(max_entries=2, path=path)
+        cache.put('a', {'fitness': 1})
+        cache.put('b', {'fitness': 2})
+        cache.get('a')
+        cache.put('c', {'fitness': 3})
+
+        # 'b' was least recently used in memory, but the file still has it
+        assert list(cache.entries) == ['a', 'c']
+        assert cache.get('b')[0] == {'fitness': 2}
+
+        restarted = ResultCache(max_entries=2, path=path)
+        result, created = restarted.get('c')
+        assert result == {'fitness': 3}
+        assert restarted.get('missing') is None
+        assert (restarted.hits, restarted.misses) == (1, 1)
+
+    memory_only = ResultCache(max_entries=1)
+    memory_only.put('a', 1)
+    memory_only.put('b', 2)
+    assert memory_only.get('a') is None
+
+    print("  LRU and file test passed")
+
+
+def test_solve_endpoint_headers():
+    print("\nTesting cache headers on /api/solve...")
+
+    from api.app import create_app
+    client = create_app().test_client()
+    body = {
+        'algorithm': 'genetic',
+        'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+        'cylinders': [{'diameter': 3, 'weight': 200}, {'diameter': 2, 'weight': 100}],
+        'params': {'population_size': 10, 'max_generations': 3, 'seed': 1234, 'use_store': False}
+    }
+
+    first = client.post('/api/solve', json=body)
+    second = client.post('/api/solve', json=body)
+    print(f"  X-Cache: {first.headers['X-Cache']} then {second.headers['X-Cache']}")
+
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert int(second.headers['Age']) >= 0
+    assert first.get_json() == second.get_json()
+
+    body['params']['use_cache'] = False
+    bypass = client.post('/api/solve', json=body)
+    assert bypass.headers['X-Cache'] == 'BYPASS'
+    # The same seed reproduces the cached run
+    assert bypass.get_json() == first.get_json()
+
+    print("  Endpoint cache test passed")
+
+
+def test_seeded_solves_on_threads():
+    print("\nTesting seeded solves running concurrently...")
+
+    import random
+    import threading
+    from api.routes import solve_problem
+
+    def run(seed):
+        container, cylinders = make_instance([(3, 100), (2, 50), (2.5, 80), (1.5, 40), (2, 60), (1, 30)] * 2)
+        params = {'population_size': 20, 'max_generations': 15, 'use_local_search': False, 'seed': seed}
+        result = solve_problem(container, cylinders, 'genetic', params)
+        return result['solution'], result['fitness'], result['generation_history']
+
+    serial = {seed: run(seed) for seed in (1, 2)}
+
+    results = {}
+    stop = threading.Event()
+
+    def worker(seed):
+        results[seed] = run(seed)
+
+    def noise():
+        # An unseeded neighbour that keeps drawing from the shared generator
+        while not stop.is_set():
+            random.random()
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in (1, 2)]
+    noisy = threading.Thread(target=noise)
+    noisy.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stop.set()
+    noisy.join()
+
+    assert results == serial
+    assert serial[1] != serial[2]
+
+    print("  Concurrent seeded solves match their serial runs")
+
+
+if __name__ == "__main__":
+    test_fingerprint()
+    test_lru_and_file_backing()
+    test_solve_endpoint_headers()
+    test_seeded_solves_on_threads()
+    print("\nAll result cache tests passed!")
@@ -0,0 +1,98 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import tempfile
+
+from models import Container, Cylinder
+from solvers import CargoPackingSolver
+from utils import SolutionStore, instance_hash
+
+def make_instance(order):
+    specs = [(2.0, 100), (1.5, 80), (1.0, 50)]
+    container = Container(20, 15, 1000)
+    cylinders = [Cylinder(i, specs[k][0], specs[k][1]) for i, k in enumerate(order)]
+    return container, cylinders
+
+
+def test_permuted_manifest_hits():
+    print("Testing solution store with a permuted manifest...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SolutionStore(os.path.join(tmp, 'store.db'))
+        
+        container, cylinders = make_instance([0, 1, 2])
+        assert store.put(container, cylinders, [2, 0, 1], 10500.0)
+        
+        # Same cylinders listed in a different order
+        container2, cylinders2 = make_instance([2, 0, 1])
+        assert instance_hash(container, cylinders) == instance_hash(container2, cylinders2)
+        
+        hit = store.lookup(container2, cylinders2)
+        print(f"  Hit: {hit}")
+        
+        assert hit['fitness'] == 10500.0
+        # Cylinder 2 of the first manifest is cylinder 0 of the second, and so on
+        assert hit['placement_order'] == [0, 1, 2]
+    
+    print("  Permuted manifest test passed")
+
+
+def test_best_only_and_eviction():
+    print("\nTesting best-only upserts and eviction...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SolutionStore(os.path.join(tmp, 'store.db'), max_entries=2)
+        container, cylinders = make_instance([0, 1, 2])
+        
+        assert store.put(container, cylinders, [0, 1, 2], 10400.0)
+        assert not store.put(container, cylinders, [1, 0, 2], 10300.0)
+        assert store.lookup(container, cylinders)['fitness'] == 10400.0
+        
+        for width in (21, 22):
+            store.put(Container(width, 15, 1000), cylinders, [0, 1, 2], 10000.0)
+        
+        print(f"  Entries after eviction: {len(store)}")
+        
+        assert len(store) == 2
+        assert store.lookup(container, cylinders) is None
+        
+        near = store.lookup_near(container, cylinders)
+        assert near == [[0, 1, 2], [0, 1, 2]]
+    
+    print("  Best-only and eviction test passed")
+
+
+def test_solver_exact_hit():
+    print("\nTesting solver answering from the store...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SolutionStore(os.path.join(tmp, 'store.db'))
+        container, cylinders = make_instance([0, 1, 2])
+        
+        first = CargoPackingSolver(container, cylinders, population_size=10, step_size=0.5, store=store)
+        first.solve(max_generations=3, verbose=False)
+        
+        second = CargoPackingSolver(container, cylinders, population_size=10, step_size=0.5, store=store)
+        solution = second.solve(max_generations=3, verbose=False)
+        
+        print(f"  Store hit: {second.store_hit}, fitness: {solution.fitness:.2f}")
+        
+        assert second.store_hit == 'exact'
+        assert second.generation_history == []
+        assert abs(solution.fitness - first.best_fitness) < 1e-9
+    
+    print("  Solver store test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RUNNING SOLUTION STORE TESTS")
+    print("=" * 50)
+    
+    test_permuted_manifest_hits()
+    test_best_only_and_eviction()
+    test_solver_exact_hit()
+    
+    print("\n" + "=" * 50)
+    print("ALL SOLUTION STORE TESTS PASSED")
+    print("=" * 50)
@@ -0,0 +1,152 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import random
+import time
+
+from api.app import create_app
+
+def stream_body(frame_interval, max_generations=30):
+    return {
+        'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+        'cylinders': [{'diameter': d, 'weight': w} for d, w in [(3, 200), (2.5, 150), (2, 100), (2, 100), (1.5, 80)]],
+        'params': {'population_size': 10, 'max_generations': max_generations, 'frame_interval': frame_interval}
+    }
+
+
+def parse_sse(text):
+    # (id, event) pairs; keepalive comments are skipped
+    events = []
+    for chunk in text.split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in chunk.split('\n') if line and not line.startswith(':'))
+        if 'data' in fields:
+            events.append((fields.get('id'), json.loads(fields['data'])))
+    return events
+
+
+def read_events(frame_interval, max_generations=30):
+    client = create_app().test_client()
+    response = client.post('/api/solve-stream', json=stream_body(frame_interval, max_generations))
+    return [event for _, event in parse_sse(response.get_data(as_text=True))]
+
+
+def test_frames_are_throttled():
+    print("Testing frame throttling...")
+
+    random.seed(2)
+    events = read_events(frame_interval=60)
+    types = [event['type'] for event in events]
+    print(f"  Events: {types}")
+
+    # Only the first and the last generation fit in one long interval
+    assert types == ['start', 'progress', 'progress', 'complete']
+    assert [e['generation'] for e in events[1:3]] == [0, 29]
+    assert len(events[0]['cylinders']) == 5
+
+    print("  Throttling test passed")
+
+
+def test_time_limit_cap():
+    print("\nTesting the solve time cap on streams...")
+
+    app = create_app()
+    app.config['SOLVE_TIME_LIMIT'] = 0.5
+    client = app.test_client()
+
+    start = time.perf_counter()
+    response = client.post('/api/solve-stream', json=stream_body(0.1, max_generations=10 ** 9))
+    events = [event for _, event in parse_sse(response.get_data(as_text=True))]
+    elapsed = time.perf_counter() - start
+    print(f"  Stream ended after {elapsed:.2f}s")
+
+    assert events[-1]['type'] == 'complete'
+    assert elapsed < 10
+
+    print("  Time cap test passed")
+
+
+def test_positions_only_on_improvement():
+    print("\nTesting that layouts are only sent when the best improves...")
+
+    random.seed(4)
+    events = read_events(frame_interval=0)
+    progress = [e for e in events if e['type'] == 'progress']
+    assert len(progress) == 30
+
+    best = 0
+    for frame in progress:
+        if frame['solution'] is not None:
+            assert frame['solution']['fitness'] > best
+            best = frame['solution']['fitness']
+    sent = sum(1 for frame in progress if frame['solution'] is not None)
+    print(f"  {sent} of {len(progress)} frames carried a layout")
+
+    # The last layout sent is the final solution
+    final = events[-1]['solution']
+    assert best == final['fitness']
+    last = [frame['solution'] for frame in progress if frame['solution']][-1]
+    assert last['positions'] == [[c['id'], c['x'], c['y']] for c in final['cylinders']]
+
+    print("  Improvement-only layout test passed")
+
+
+def test_resume_with_last_event_id():
+    print("\nTesting resuming a stream from Last-Event-ID...")
+
+    client = create_app().test_client()
+    response = client.post('/api/solve-stream', json=stream_body(0, max_generations=10))
+    session_id = response.headers['X-Stream-Session']
+    events = parse_sse(response.get_data(as_text=True))
+    assert events[-1][1]['type'] == 'complete'
+
+    # Reconnecting after the 4th event replays the rest of the same run
+    last_id = events[3][0]
+    response = client.post('/api/solve-stream', headers={'Last-Event-ID': last_id}, json={})
+    assert response.headers['X-Stream-Session'] == session_id
+    resumed = parse_sse(response.get_data(as_text=True))
+    assert resumed == events[4:]
+
+    response = client.get(f'/api/solve-stream/{session_id}?last_event_id={events[-2][0]}')
+    assert parse_sse(response.get_data(as_text=True)) == events[-1:]
+
+    print(f"  Resumed {len(resumed)} events of session {session_id[:8]}")
+    print("  Resume test passed")
+
+
+def test_cancel_without_client():
+    print("\nTesting that abandoned streams stop solving...")
+
+    from api.streams import StreamSessions
+
+    def endless():
+        generation = 0
+        while True:
+            generation += 1
+            yield {'type': 'progress', 'generation': generation}
+            time.sleep(0.001)
+
+    sessions = StreamSessions(resume_grace=0.05)
+    session = sessions.start(endless())
+    session.attach()
+    session.detach()
+    session.thread.join(timeout=5)
+
+    assert session.finished
+    events, done = session.read(-1, timeout=0)
+    assert done
+    assert events[-1][1] == {'type': 'cancelled'}
+
+    # The buffer is bounded
+    assert len(events) <= sessions.buffer_size
+
+    print("  Abandoned stream test passed")
+
+
+if __name__ == "__main__":
+    test_frames_are_throttled()
+    test_time_limit_cap()
+    test_positions_only_on_improvement()
+    test_resume_with_last_event_id()
+    test_cancel_without_client()
+    print("\nAll stream tests passed!")
@@ -0,0 +1,120 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import xml.etree.ElementTree as ET
+
+from models import Container, Cylinder
+from visualization.svg_renderer import SvgRenderer, render_svg
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+def make_layout(n):
+    container = Container(20.0, 15.0, 100000.0)
+    cylinders = []
+    for i in range(n):
+        cyl = Cylinder(i, 0.5 + (i % 5) * 0.1, 10.0)
+        cyl.set_position(1.0 + (i % 18), 1.0 + (i // 18) % 13)
+        cylinders.append(cyl)
+    return container, cylinders
+
+
+def test_svg_document():
+    print("Testing SVG rendering...")
+
+    container, cylinders = make_layout(30)
+    cylinders.append(Cylinder(30, 1.0, 10.0))  # never placed
+    root = ET.fromstring(render_svg(container, cylinders, width_px=420, title='Plan <1>'))
+
+    assert root.tag == f'{SVG}svg'
+    assert root.get('width') == '420'
+    # 21m x 16m with the margin
+    assert root.get('viewBox') == '-0.5 -0.5 21 16'
+    assert root.get('height') == '320'
+    assert root.find(f'{SVG}title').text == 'Plan <1>'
+
+    groups = root.findall(f'{SVG}g')
+    circles = groups[0].findall(f'{SVG}circle')
+    assert len(circles) == 30
+    # y points up in solutions and down in SVG
+    assert circles[0].get('cx') == '1' and circles[0].get('cy') == '14'
+    assert circles[0].get('r') == '0.25'
+
+    labels = groups[1].findall(f'{SVG}text')
+    assert [t.text for t in labels] == [str(i) for i in range(30)]
+
+    # Center of mass marker
+    assert groups[2].get('stroke') == 'red'
+
+    print("  Document test passed")
+
+
+def test_labels_and_streaming():
+    print("\nTesting label decimation and chunked output...")
+
+    container, cylinders = make_layout(2000)
+    renderer = SvgRenderer(container, cylinders, label_threshold=50)
+    chunks = list(renderer.iter_svg(chunk_size=100))
+    assert len(chunks) > 10
+    root = ET.fromstring(''.join(chunks))
+    labels = root.findall(f'{SVG}g')[1].findall(f'{SVG}text')
+    assert len(labels) == 50
+    largest = max(c.radius for c in cylinders)
+    assert all(cylinders[int(t.text)].radius == largest for t in labels)
+
+    root = ET.fromstring(render_svg(container, cylinders[:3], labels=False))
+    assert not root.findall(f'.//{SVG}text')
+
+    print("  Labels and streaming test passed")
+
+
+def test_render_endpoint():
+    print("\nTesting /api/render...")
+
+    import api.routes
+    from api.app import create_app
+    app = create_app()
+    client = app.test_client()
+    api.routes._render_cache = None
+
+    body = {
+        'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+        'cylinders': [{'diameter': 3, 'weight': 200, 'x': 5, 'y': 5}, {'diameter': 2, 'weight': 100}],
+        'options': {'width': 300}
+    }
+    first = client.post('/api/render', json=body)
+    assert first.status_code == 200
+    assert first.mimetype == 'image/svg+xml'
+    assert first.headers['X-Cache'] == 'MISS'
+    root = ET.fromstring(first.get_data(as_text=True))
+    assert len(root.findall(f'{SVG}g')[0]) == 1
+
+    etag = first.headers['ETag']
+    second = client.post('/api/render', json=body)
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.headers['ETag'] == etag
+    assert second.get_data() == first.get_data()
+
+    # Stream-frame positions draw the same picture
+    moved = dict(body, cylinders=[{'diameter': 3, 'weight': 200}, {'diameter': 2, 'weight': 100}],
+                 positions=[[0, 5, 5]])
+    assert client.post('/api/render', json=moved).headers['ETag'] == etag
+
+    cached = client.get(first.headers['Location'])
+    assert cached.status_code == 200
+    assert cached.get_data() == first.get_data()
+    assert 'immutable' in cached.headers['Cache-Control']
+    assert client.get(first.headers['Location'], headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/api/render/unknown').status_code == 404
+
+    body['options']['width'] = 100000
+    assert client.post('/api/render', json=body).status_code == 400
+    assert client.post('/api/render', json={'cylinders': []}).status_code == 400
+
+    print("  Endpoint test passed")
+
+
+if __name__ == "__main__":
+    test_svg_document()
+    test_labels_and_streaming()
+    test_render_endpoint()
+    print("\nAll SVG render tests passed!")
@@ -0,0 +1,89 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import tempfile
+
+from models import Container, Cylinder
+from solvers import CargoPackingSolver
+from scripts.solve_instances import solve_instance_from_file
+from utils import load_solution_from_file
+
+def write_instance(path, count):
+    with open(path, 'w') as f:
+        f.write("container 20 15 2000\n")
+        for i in range(count):
+            f.write(f"cylinder {1.5 + (i % 3) * 0.5} {50 + i * 5}\n")
+
+
+def test_invalid_seed_orders_are_skipped():
+    print("Testing that bad seed orders are skipped...")
+
+    container = Container(20, 15, 1000)
+    cylinders = [Cylinder(i, 2.0, 100) for i in range(4)]
+    solver = CargoPackingSolver(container, cylinders, population_size=10)
+
+    seeded = solver.warm_start(orders=[[0, 1, 2], [0, 1, 1, 2], [3, 2, 1, 0]], fraction=0.5)
+    assert seeded == 5
+    assert solver.population.population[0].genes == [3, 2, 1, 0]
+    assert [s['source'] for s in solver.skipped_seeds] == ['orders[0]', 'orders[1]']
+    # Nothing usable left: nothing is seeded
+    assert solver.warm_start(orders=[[0, 1, 2, 3, 4]]) == 0
+    assert len(solver.skipped_seeds) == 3
+
+    print("  Bad seed test passed")
+
+
+def test_stale_previous_solution():
+    print("\nTesting a re-solve over a stale solution file...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        instance = os.path.join(tmp, 'instance.txt')
+        output = os.path.join(tmp, 'instance_solution.txt')
+
+        # The manifest had 5 cylinders when it was solved last, now it has 12
+        with open(output, 'w') as f:
+            f.write("placement_order 4 3 2 1 0\nfitness 10400.00\n")
+        write_instance(instance, 12)
+
+        solver = solve_instance_from_file(instance, output, population_size=10, max_generations=3,
+                                          use_local_search=False, checkpoint_interval=0, verbose=False)
+        assert solver is not None
+        assert [s['source'] for s in solver.skipped_seeds] == [output]
+        assert sorted(load_solution_from_file(output)['placement_order']) == list(range(12))
+
+        # Branch and bound instances are not seeded at all; the 12-cylinder
+        # solution just written would not fit these 4
+        write_instance(instance, 4)
+        solver = solve_instance_from_file(instance, output, checkpoint_interval=0, verbose=False)
+        assert solver is not None
+        assert sorted(load_solution_from_file(output)['placement_order']) == [0, 1, 2, 3]
+
+    print("  Stale solution test passed")
+
+
+def test_api_reports_skipped_seeds():
+    print("\nTesting skipped seeds in the /solve result...")
+
+    from api.app import create_app
+
+    client = create_app().test_client()
+    response = client.post('/api/solve', json={
+        'algorithm': 'genetic',
+        'container': {'width': 20, 'depth': 15, 'max_weight': 2000},
+        'cylinders': [{'diameter': 2, 'weight': 100}] * 4,
+        'params': {'population_size': 10, 'max_generations': 3, 'use_local_search': False,
+                   'initial_orders': [[0, 1, 2], [3, 2, 1, 0]]}
+    })
+    result = response.get_json()['result']
+    assert result['skipped_seeds'] == [
+        {'source': 'orders[0]', 'reason': 'not a permutation of the 4 cylinders'}
+    ]
+
+    print("  API test passed")
+
+
+if __name__ == "__main__":
+    test_invalid_seed_orders_are_skipped()
+    test_stale_previous_solution()
+    test_api_reports_skipped_seeds()
+    print("\nAll warm start tests passed!")
@@ -1,3 +1,5 @@
+from .lazy import lazy_exports
+
 from .helpers import (
     calculate_center_of_mass,
     calculate_total_weight,
@@ -8,5 +10,33 @@ from .helpers import (
 from .file_io import ( 
     load_instance_from_file,
     save_solution_to_file,
-    load_solution_from_file
-)   
\ No newline at end of file
+    load_solution_from_file,
+    iter_instances_from_file,
+    write_instances_to_file,
+    iter_solutions_from_file,
+    SolutionStreamWriter
+)
+
+from .canonical import (
+    group_cylinder_types,
+    cylinder_type_ids,
+    canonicalize_genes,
+    instance_hash,
+    cylinders_hash,
+    FitnessCache
+)
+
+from .solution_store import SolutionStore
+
+# binary_io needs numpy, which costs more to import than the rest together
+_LAZY = {
+    'BinaryPacking': '.binary_io',
+    'load_binary': '.binary_io',
+    'save_binary': '.binary_io',
+    'write_binary_arrays': '.binary_io',
+    'text_to_binary': '.binary_io',
+    'binary_to_text': '.binary_io',
+    'is_binary_file': '.binary_io'
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -0,0 +1,298 @@
+"""
+Binary instance/solution format - for very large (synthetic) instances
+
+Layout (little endian):
+    header      80 bytes, see HEADER_DTYPE
+    diameter    float64[count]
+    weight      float64[count]
+    x           float64[count]   NaN where the cylinder is not placed
+    y           float64[count]   NaN where the cylinder is not placed
+    order       int32[count]     placement order, only if FLAG_SOLUTION is set
+
+One file holds an instance and, optionally, a solution for it. Loading maps
+the arrays straight from the file, so opening a 100k cylinder instance costs
+no parsing, and worker processes that open the same file share its pages
+through the OS cache instead of each holding a parsed copy.
+"""
+import os
+import numpy as np
+from models import Container, Cylinder, DNA
+from utils.file_io import save_solution_to_file
+
+MAGIC = b'CPKB'
+VERSION = 1
+BINARY_EXTENSION = '.bin'
+
+FLAG_SOLUTION = 1
+FLAG_VALID = 2
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('version', '<u2'),
+    ('flags', '<u2'),
+    ('count', '<u8'),
+    ('width', '<f8'),
+    ('depth', '<f8'),
+    ('max_weight', '<f8'),
+    ('fitness', '<f8'),
+    ('center_x', '<f8'),
+    ('center_y', '<f8'),
+    ('packing_density', '<f8'),
+    ('reserved', '<u8')
+])
+
+FLOAT_DTYPE = np.dtype('<f8')
+ORDER_DTYPE = np.dtype('<i4')
+
+
+class BinaryPacking:
+    """
+    Read-only, memory-mapped view of a binary file
+
+    diameter, weight, x, y and order are numpy arrays backed by the file;
+    nothing is copied until cylinders() or solution() is called.
+    """
+    def __init__(self, filepath):
+        self.filepath = filepath
+
+        header = np.memmap(filepath, dtype=HEADER_DTYPE, mode='r', shape=(1,))[0]
+        if header['magic'] != MAGIC:
+            raise ValueError(f"{filepath} is not a binary packing file")
+        if header['version'] != VERSION:
+            raise ValueError(f"Unsupported binary format version {header['version']} in {filepath}")
+
+        self.count = int(header['count'])
+        flags = int(header['flags'])
+        self.has_solution = bool(flags & FLAG_SOLUTION)
+        self.valid = bool(flags & FLAG_VALID) if self.has_solution else None
+        self.container = Container(float(header['width']), float(header['depth']), float(header['max_weight']))
+
+        self.fitness = float(header['fitness']) if self.has_solution else None
+        self.center_of_mass = None
+        self.packing_density = None
+        if self.has_solution and not np.isnan(header['center_x']):
+            self.center_of_mass = (float(header['center_x']), float(header['center_y']))
+            self.packing_density = float(header['packing_density'])
+
+        offset = HEADER_DTYPE.itemsize
+        self.diameter, offset = self._map(FLOAT_DTYPE, offset)
+        self.weight, offset = self._map(FLOAT_DTYPE, offset)
+        self.x, offset = self._map(FLOAT_DTYPE, offset)
+        self.y, offset = self._map(FLOAT_DTYPE, offset)
+        self.order = None
+        if self.has_solution:
+            self.order, offset = self._map(ORDER_DTYPE, offset)
+
+    def _map(self, dtype, offset):
+        array = np.memmap(self.filepath, dtype=dtype, mode='r', offset=offset, shape=(self.count,))
+        return array, offset + dtype.itemsize * self.count
+
+    def cylinders(self, with_positions=True):
+        # Build Cylinder objects (this is the copy)
+        cylinders = []
+        for i, (diameter, weight) in enumerate(zip(self.diameter.tolist(), self.weight.tolist())):
+            cylinders.append(Cylinder(i, diameter, weight))
+
+        if with_positions:
+            for i, (x, y) in enumerate(zip(self.x.tolist(), self.y.tolist())):
+                if not (np.isnan(x) or np.isnan(y)):
+                    cylinders[i].set_position(x, y)
+
+        return cylinders
+
+    def solution(self):
+        """
+        The stored solution in the same shape load_solution_from_file returns
+
+        Returns:
+            dict, or None if the file holds only an instance
+        """
+        if not self.has_solution:
+            return None
+
+        placed = np.flatnonzero(~(np.isnan(self.x) | np.isnan(self.y)))
+        return {
+            'placement_order': self.order.tolist(),
+            'fitness': self.fitness,
+            'valid': self.valid,
+            'center_of_mass': self.center_of_mass,
+            'packing_density': self.packing_density,
+            'cylinders': [
+                {
+                    'id': int(i),
+                    'x': float(self.x[i]),
+                    'y': float(self.y[i]),
+                    'diameter': float(self.diameter[i]),
+                    'weight': float(self.weight[i])
+                }
+                for i in placed
+            ]
+        }
+
+
+def load_binary(filepath):
+    """Open a binary packing file (memory mapped, no parsing)"""
+    return BinaryPacking(filepath)
+
+
+def is_binary_file(filepath):
+    with open(filepath, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_binary_arrays(filepath, container, diameter, weight, x=None, y=None,
+                        order=None, fitness=None, details=None):
+    """
+    Write a binary packing file straight from arrays
+
+    Generators of large synthetic instances can use this without creating
+    a Cylinder object per item.
+
+    Args:
+        container: Container
+        diameter, weight: Sequences of length count
+        x, y: Optional positions (NaN for unplaced cylinders)
+        order: Optional placement order; marks the file as holding a solution
+        fitness: Fitness of the solution
+        details: Optional solution details (valid, center_of_mass, packing_density)
+    """
+    diameter = np.asarray(diameter, dtype=FLOAT_DTYPE)
+    weight = np.asarray(weight, dtype=FLOAT_DTYPE)
+    count = len(diameter)
+    if count == 0:
+        raise ValueError("No cylinders to write")
+    if len(weight) != count:
+        raise ValueError("diameter and weight must have the same length")
+
+    x = np.full(count, np.nan) if x is None else np.asarray(x, dtype=FLOAT_DTYPE)
+    y = np.full(count, np.nan) if y is None else np.asarray(y, dtype=FLOAT_DTYPE)
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header['magic'] = MAGIC
+    header['version'] = VERSION
+    header['count'] = count
+    header['width'] = container.width
+    header['depth'] = container.depth
+    header['max_weight'] = container.max_weight
+    header['center_x'] = np.nan
+    header['center_y'] = np.nan
+    header['packing_density'] = np.nan
+
+    flags = 0
+    if order is not None:
+        flags |= FLAG_SOLUTION
+        header['fitness'] = fitness if fitness is not None else 0.0
+        if details:
+            if details['valid']:
+                flags |= FLAG_VALID
+            header['center_x'] = details['center_of_mass'][0]
+            header['center_y'] = details['center_of_mass'][1]
+            header['packing_density'] = details['packing_density']
+        elif fitness:
+            flags |= FLAG_VALID
+    header['flags'] = flags
+
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        header.tofile(f)
+        for array in (diameter, weight, x, y):
+            array.astype(FLOAT_DTYPE, copy=False).tofile(f)
+        if order is not None:
+            np.asarray(order, dtype=ORDER_DTYPE).tofile(f)
+    os.replace(tmp_path, filepath)
+
+
+def save_binary(filepath, container, cylinders, dna=None, fitness=None, details=None):
+    """
+    Save an instance, and optionally a solution for it, in binary form
+
+    Positions are taken from the cylinders (details['cylinders'] if given),
+    so pass placed cylinders to store a solution.
+    """
+    placed = details['cylinders'] if details else cylinders
+    write_binary_arrays(
+        filepath,
+        container,
+        [c.diameter for c in cylinders],
+        [c.weight for c in cylinders],
+        x=[c.x if c.placed else np.nan for c in placed],
+        y=[c.y if c.placed else np.nan for c in placed],
+        order=dna.genes if dna is not None else None,
+        fitness=fitness,
+        details=details
+    )
+
+
+def text_to_binary(instance_file, binary_file, solution_file=None):
+    """Convert a text instance (plus an optional text solution) to one binary file"""
+    from utils.file_io import load_instance_from_file, load_solution_from_file
+
+    container, cylinders = load_instance_from_file(instance_file)
+    count = len(cylinders)
+    x = np.full(count, np.nan)
+    y = np.full(count, np.nan)
+    order = None
+    fitness = None
+    details = None
+
+    if solution_file is not None:
+        solution = load_solution_from_file(solution_file)
+        for cyl in solution['cylinders']:
+            x[cyl['id']] = cyl['x']
+            y[cyl['id']] = cyl['y']
+        order = solution['placement_order']
+        fitness = solution['fitness']
+        if solution['center_of_mass'] is not None:
+            details = {
+                'valid': solution['valid'],
+                'center_of_mass': solution['center_of_mass'],
+                'packing_density': solution['packing_density']
+            }
+
+    write_binary_arrays(
+        binary_file,
+        container,
+        [c.diameter for c in cylinders],
+        [c.weight for c in cylinders],
+        x=x, y=y, order=order, fitness=fitness, details=details
+    )
+
+
+def binary_to_text(binary_file, instance_file, solution_file=None):
+    """
+    Convert a binary file back to the text formats
+
+    The solution file is only written if solution_file is given and the
+    binary file holds a solution.
+    """
+    packing = load_binary(binary_file)
+    container = packing.container
+
+    tmp_path = instance_file + '.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(f"container {container.width} {container.depth} {container.max_weight}\n")
+        for diameter, weight in zip(packing.diameter.tolist(), packing.weight.tolist()):
+            f.write(f"cylinder {diameter} {weight}\n")
+    os.replace(tmp_path, instance_file)
+
+    solution = packing.solution()
+    if solution_file is None or solution is None:
+        return
+
+    # Same writer as every other solution file, so the formats cannot drift
+    dna = DNA(len(solution['placement_order']))
+    dna.genes = solution['placement_order']
+    placed = []
+    details = None
+    if solution['center_of_mass'] is not None:
+        for cyl in solution['cylinders']:
+            cylinder = Cylinder(cyl['id'], cyl['diameter'], cyl['weight'])
+            cylinder.set_position(cyl['x'], cyl['y'])
+            placed.append(cylinder)
+        details = {
+            'valid': solution['valid'],
+            'center_of_mass': solution['center_of_mass'],
+            'packing_density': solution['packing_density'],
+            'cylinders': placed
+        }
+    save_solution_to_file(solution_file, dna, container, placed, solution['fitness'], details)
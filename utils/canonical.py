@@ -0,0 +1,131 @@
+"""
+Instance canonicalization - groups identical cylinders into types
+
+Two cylinders with the same diameter and weight are interchangeable: swapping
+them in a placement order produces exactly the same placement. Keys built
+from the type sequence of an order are therefore shared by every equivalent
+order, which lets the solvers skip re-evaluating them.
+"""
+import hashlib
+import json
+
+def cylinder_type_key(cylinder):
+    return (cylinder.diameter, cylinder.weight)
+
+
+def group_cylinder_types(cylinders):
+    """
+    Group cylinder indices by type
+
+    Returns:
+        dict mapping (diameter, weight) to the list of indices of that type,
+        in index order
+    """
+    types = {}
+    for i, cyl in enumerate(cylinders):
+        types.setdefault(cylinder_type_key(cyl), []).append(i)
+    return types
+
+
+def cylinder_type_ids(cylinders):
+    """Return a small integer type id for every cylinder index"""
+    ids = {}
+    return [ids.setdefault(cylinder_type_key(cyl), len(ids)) for cyl in cylinders]
+
+
+def canonical_key(genes, type_ids):
+    """Hashable key shared by all orders that only swap identical cylinders"""
+    return tuple(type_ids[g] for g in genes)
+
+
+def canonicalize_genes(genes, type_ids):
+    """
+    Rewrite an order so identical cylinders appear in ascending index order
+
+    The result places exactly like the input order.
+    """
+    pools = {}
+    for g in sorted(genes):
+        pools.setdefault(type_ids[g], []).append(g)
+
+    taken = {t: 0 for t in pools}
+    canonical = []
+    for g in genes:
+        t = type_ids[g]
+        canonical.append(pools[t][taken[t]])
+        taken[t] += 1
+    return canonical
+
+
+def canonical_cylinder_order(cylinders):
+    """Cylinder indices sorted by type - the same for every permutation of a manifest"""
+    return sorted(range(len(cylinders)), key=lambda i: (cylinder_type_key(cylinders[i]), i))
+
+
+def to_canonical_order(genes, cylinders):
+    # Express an order in terms of positions in canonical_cylinder_order
+    rank = {index: position for position, index in enumerate(canonical_cylinder_order(cylinders))}
+    return [rank[g] for g in genes]
+
+
+def from_canonical_order(canonical, cylinders):
+    # Inverse of to_canonical_order for (a possibly permuted copy of) the same manifest
+    order = canonical_cylinder_order(cylinders)
+    return [order[position] for position in canonical]
+
+
+def cylinders_hash(cylinders):
+    """Hash of the multiset of cylinders, independent of their order"""
+    types = sorted(cylinder_type_key(cyl) for cyl in cylinders)
+    return _hash({'cylinders': [[float(d), float(w)] for d, w in types]})
+
+
+def instance_hash(container, cylinders):
+    """Hash of the container plus the multiset of cylinders"""
+    types = sorted(cylinder_type_key(cyl) for cyl in cylinders)
+    return _hash({
+        'container': [float(container.width), float(container.depth), float(container.max_weight)],
+        'cylinders': [[float(d), float(w)] for d, w in types]
+    })
+
+
+def _hash(data):
+    encoded = json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class FitnessCache:
+    # Fitness values keyed by canonical order, valid for one instance and placer.
+    # Every key holds one type id per cylinder, so the number of entries is
+    # also bounded by max_key_items, the total length of all keys.
+    def __init__(self, cylinders, max_entries=100000, max_key_items=2000000):
+        self.type_ids = cylinder_type_ids(cylinders)
+        self.num_types = len(set(self.type_ids))
+        self.max_entries = max(1, min(max_entries, max_key_items // max(1, len(cylinders))))
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, genes):
+        return canonical_key(genes, self.type_ids)
+
+    def get(self, genes):
+        fitness = self.entries.get(self.key(genes))
+        if fitness is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return fitness
+
+    def put(self, genes, fitness):
+        if len(self.entries) >= self.max_entries:
+            # Drop the oldest entry (dicts keep insertion order)
+            del self.entries[next(iter(self.entries))]
+        self.entries[self.key(genes)] = fitness
+
+    def same_type(self, i, j):
+        # True if cylinders i and j are interchangeable
+        return self.type_ids[i] == self.type_ids[j]
+
+    def __len__(self):
+        return len(self.entries)
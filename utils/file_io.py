@@ -1,3 +1,4 @@
+import os
 from models import Container, Cylinder
 
 def load_instance_from_file(filepath):
@@ -11,8 +12,72 @@ def load_instance_from_file(filepath):
     
     """
     with open(filepath, 'r') as f:
-        lines = f.readlines()
+        container, cylinders = _parse_instance_lines(f)
     
+    _check_instance(container, cylinders, filepath)
+    
+    return container, cylinders
+
+
+def iter_instances_from_file(filepath, with_names=False):
+    """
+    Lazily read a multi-instance file, one instance at a time
+    
+    Format: the single-instance grammar, with each instance opened by an
+    "instance <name>" line:
+    instance <name>
+    container <width> <depth> <max_weight>
+    cylinder <diameter> <weight>
+    ...
+    instance <name>
+    ...
+    
+    A file without "instance" lines is read as one instance, so plain
+    instance files work too.
+    
+    Yields:
+        (container, cylinders), or (name, container, cylinders) if with_names
+    """
+    default_name = os.path.splitext(os.path.basename(filepath))[0]
+    
+    with open(filepath, 'r') as f:
+        name = None
+        section = []
+        count = 0
+        
+        for line in f:
+            parts = line.split()
+            if parts and parts[0] == 'instance':
+                if name is not None or _has_content(section):
+                    yield _finish_section(name, section, filepath, default_name, count, with_names)
+                    count += 1
+                name = ' '.join(parts[1:]) or None
+                section = []
+            else:
+                section.append(line)
+        
+        if name is not None or _has_content(section):
+            yield _finish_section(name, section, filepath, default_name, count, with_names)
+
+
+def write_instances_to_file(filepath, instances):
+    """
+    Write (name, container, cylinders) tuples as a multi-instance file
+    
+    instances may be any iterable, including a generator; each instance is
+    written as soon as it is produced.
+    """
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'w') as f:
+        for name, container, cylinders in instances:
+            f.write(f"instance {name}\n")
+            f.write(f"container {container.width} {container.depth} {container.max_weight}\n")
+            for cyl in cylinders:
+                f.write(f"cylinder {cyl.diameter} {cyl.weight}\n")
+    os.replace(tmp_path, filepath)
+
+
+def _parse_instance_lines(lines):
     container = None
     cylinders = []
     
@@ -36,12 +101,31 @@ def load_instance_from_file(filepath):
             cylinder_id = len(cylinders)
             cylinders.append(Cylinder(cylinder_id, diameter, weight))
     
+    return container, cylinders
+
+
+def _check_instance(container, cylinders, source):
     if container is None:
-        raise ValueError(f"No container definition found in {filepath}")
+        raise ValueError(f"No container definition found in {source}")
     
     if len(cylinders) == 0:
-        raise ValueError(f"No cylinders found in {filepath}")
+        raise ValueError(f"No cylinders found in {source}")
+
+
+def _has_content(lines):
+    # Comment and blank lines before the first "instance" line don't form an instance
+    return any(line.strip() and not line.strip().startswith('#') for line in lines)
+
+
+def _finish_section(name, lines, filepath, default_name, index, with_names):
+    if name is None:
+        name = default_name if index == 0 else f"{default_name}_{index}"
+    
+    container, cylinders = _parse_instance_lines(lines)
+    _check_instance(container, cylinders, f"{filepath} (instance {name})")
     
+    if with_names:
+        return name, container, cylinders
     return container, cylinders
 
 
@@ -54,20 +138,64 @@ def save_solution_to_file(filepath, dna, container, cylinders, fitness, details=
     fitness <value>
     cylinder <id> <x> <y> <diameter> <weight>
     ...
+    
+    The file is written under a temporary name and renamed into place, so
+    readers never see a half-written solution.
+    """
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'w') as f:
+        _write_solution(f, dna, fitness, details)
+    os.replace(tmp_path, filepath)
+
+
+class SolutionStreamWriter:
     """
-    with open(filepath, 'w') as f:
-        f.write(f"placement_order {' '.join(map(str, dna.genes))}\n")
-        f.write(f"fitness {fitness:.2f}\n")
+    Append solutions to one multi-solution file as they become available
+    
+    Each solution is opened by a "solution <name>" line followed by the
+    same lines save_solution_to_file writes. Every record is flushed, so a
+    reader (or a crash) sees only complete solutions plus at most one
+    partial trailing record.
+    
+    Usage:
+        with SolutionStreamWriter(path) as writer:
+            writer.write(name, dna, fitness, details)
+    """
+    def __init__(self, filepath, append=False):
+        self.filepath = filepath
+        self.file = open(filepath, 'a' if append else 'w')
+        self.count = 0
+    
+    def write(self, name, dna, fitness, details=None):
+        self.file.write(f"solution {name}\n")
+        _write_solution(self.file, dna, fitness, details)
+        self.file.write("\n")
+        self.file.flush()
+        self.count += 1
+    
+    def close(self):
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _write_solution(f, dna, fitness, details):
+    f.write(f"placement_order {' '.join(map(str, dna.genes))}\n")
+    f.write(f"fitness {fitness:.2f}\n")
+    
+    if details:
+        f.write(f"valid {details['valid']}\n")
+        f.write(f"center_of_mass {details['center_of_mass'][0]:.2f} {details['center_of_mass'][1]:.2f}\n")
+        f.write(f"packing_density {details['packing_density']:.4f}\n")
+        f.write("\n")
         
-        if details:
-            f.write(f"valid {details['valid']}\n")
-            f.write(f"center_of_mass {details['center_of_mass'][0]:.2f} {details['center_of_mass'][1]:.2f}\n")
-            f.write(f"packing_density {details['packing_density']:.4f}\n")
-            f.write("\n")
-            
-            for cyl in details['cylinders']:
-                if cyl.placed:
-                    f.write(f"cylinder {cyl.id} {cyl.x:.2f} {cyl.y:.2f} {cyl.diameter:.2f} {cyl.weight:.2f}\n")
+        for cyl in details['cylinders']:
+            if cyl.placed:
+                f.write(f"cylinder {cyl.id} {cyl.x:.2f} {cyl.y:.2f} {cyl.diameter:.2f} {cyl.weight:.2f}\n")
 
 
 def load_solution_from_file(filepath):
@@ -77,10 +205,42 @@ def load_solution_from_file(filepath):
     Returns:
         dict with keys: placement_order, fitness, cylinders
     """
+    solution = _empty_solution()
+    
     with open(filepath, 'r') as f:
-        lines = f.readlines()
+        for line in f:
+            _parse_solution_line(solution, line)
+    
+    return solution
+
+
+def iter_solutions_from_file(filepath):
+    """
+    Lazily read a file written by SolutionStreamWriter
     
-    solution = {
+    Yields:
+        (name, solution) with solution as returned by load_solution_from_file
+    """
+    with open(filepath, 'r') as f:
+        name = None
+        solution = None
+        
+        for line in f:
+            parts = line.split()
+            if parts and parts[0] == 'solution':
+                if solution is not None:
+                    yield name, solution
+                name = ' '.join(parts[1:])
+                solution = _empty_solution()
+            elif solution is not None:
+                _parse_solution_line(solution, line)
+        
+        if solution is not None:
+            yield name, solution
+
+
+def _empty_solution():
+    return {
         'placement_order': None,
         'fitness': None,
         'valid': None,
@@ -88,38 +248,37 @@ def load_solution_from_file(filepath):
         'packing_density': None,
         'cylinders': []
     }
+
+
+def _parse_solution_line(solution, line):
+    line = line.strip()
     
-    for line in lines:
-        line = line.strip()
-        
-        if not line or line.startswith('#'):
-            continue
-        
-        parts = line.split()
-        
-        if parts[0] == 'placement_order':
-            solution['placement_order'] = list(map(int, parts[1:]))
-        
-        elif parts[0] == 'fitness':
-            solution['fitness'] = float(parts[1])
-        
-        elif parts[0] == 'valid':
-            solution['valid'] = parts[1] == 'True'
-        
-        elif parts[0] == 'center_of_mass':
-            solution['center_of_mass'] = (float(parts[1]), float(parts[2]))
-        
-        elif parts[0] == 'packing_density':
-            solution['packing_density'] = float(parts[1])
-        
-        elif parts[0] == 'cylinder':
-            cyl_data = {
-                'id': int(parts[1]),
-                'x': float(parts[2]),
-                'y': float(parts[3]),
-                'diameter': float(parts[4]),
-                'weight': float(parts[5])
-            }
-            solution['cylinders'].append(cyl_data)
-    
-    return solution
\ No newline at end of file
+    if not line or line.startswith('#'):
+        return
+    
+    parts = line.split()
+    
+    if parts[0] == 'placement_order':
+        solution['placement_order'] = list(map(int, parts[1:]))
+    
+    elif parts[0] == 'fitness':
+        solution['fitness'] = float(parts[1])
+    
+    elif parts[0] == 'valid':
+        solution['valid'] = parts[1] == 'True'
+    
+    elif parts[0] == 'center_of_mass':
+        solution['center_of_mass'] = (float(parts[1]), float(parts[2]))
+    
+    elif parts[0] == 'packing_density':
+        solution['packing_density'] = float(parts[1])
+    
+    elif parts[0] == 'cylinder':
+        cyl_data = {
+            'id': int(parts[1]),
+            'x': float(parts[2]),
+            'y': float(parts[3]),
+            'diameter': float(parts[4]),
+            'weight': float(parts[5])
+        }
+        solution['cylinders'].append(cyl_data)
\ No newline at end of file
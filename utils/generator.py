@@ -0,0 +1,190 @@
+"""
+Seeded generator of synthetic instance families
+
+Families describe the diameter distribution:
+    uniform     diameters spread evenly over a range
+    bimodal     a mix of small and large drums
+    identical   a handful of cylinder types repeated many times
+
+Tightness describes the container:
+    loose       cylinders fill about 30% of the safe zone, generous weight limit
+    tight       cylinders fill about 60% of the safe zone, weight limit just
+                above the total weight
+
+Feasible-by-construction instances are built around an explicit valid
+layout (the witness), so a valid solution is known to exist.
+"""
+import math
+import random
+from models import Container, Cylinder
+
+FAMILIES = ('uniform', 'bimodal', 'identical')
+
+TIGHTNESS = {
+    'loose': {'fill': 0.3, 'weight_margin': 1.5, 'slack': 1.4},
+    'tight': {'fill': 0.6, 'weight_margin': 1.02, 'slack': 1.0}
+}
+
+# Width : depth of generated containers (the bundled instances are about 4:3)
+ASPECT = 4 / 3
+
+# The safe zone spans 20%-80% of each side
+SAFE_FRACTION = 0.6
+
+# Gap between neighbours in a constructed layout, so rounding never turns
+# touching cylinders into overlapping ones
+LAYOUT_GAP = 0.001
+
+
+def generate_diameters(family, n, rng):
+    """
+    Diameters and weights for n cylinders of a family
+
+    Returns:
+        (diameters, weights) lists
+    """
+    if family == 'uniform':
+        diameters = [round(rng.uniform(0.8, 3.0), 2) for _ in range(n)]
+    elif family == 'bimodal':
+        diameters = [
+            round(max(0.5, rng.gauss(1.0, 0.1) if rng.random() < 0.5 else rng.gauss(2.6, 0.2)), 2)
+            for _ in range(n)
+        ]
+    elif family == 'identical':
+        # A few types, each shared by many cylinders
+        num_types = max(1, min(5, n // 10 + 1))
+        types = [(round(rng.uniform(1.0, 3.0), 1), None) for _ in range(num_types)]
+        types = [(d, _weight_for(d, rng)) for d, _ in types]
+        picks = [rng.choice(types) for _ in range(n)]
+        return [d for d, _ in picks], [w for _, w in picks]
+    else:
+        raise ValueError(f"Unknown family: {family}")
+
+    return diameters, [_weight_for(d, rng) for d in diameters]
+
+
+def _weight_for(diameter, rng):
+    # Roughly proportional to the footprint, like the bundled instances
+    return float(round(28 * diameter * diameter * rng.uniform(0.85, 1.15)))
+
+
+def generate_instance(n, family='uniform', tightness='loose', feasible=False, seed=None):
+    """
+    Generate one synthetic instance
+
+    Args:
+        n: Number of cylinders
+        family: One of FAMILIES
+        tightness: 'loose' or 'tight'
+        feasible: Build the container around a known valid layout
+        seed: Random seed (same seed, same instance)
+
+    Returns:
+        (container, cylinders)
+    """
+    if feasible:
+        container, cylinders, _ = generate_feasible_instance(n, family, tightness, seed)
+        return container, cylinders
+
+    if tightness not in TIGHTNESS:
+        raise ValueError(f"Unknown tightness: {tightness}")
+    settings = TIGHTNESS[tightness]
+
+    rng = random.Random(seed)
+    diameters, weights = generate_diameters(family, n, rng)
+    cylinders = [Cylinder(i, d, w) for i, (d, w) in enumerate(zip(diameters, weights))]
+
+    # Size the container so the cylinders cover the requested share of the safe zone
+    total_area = sum(c.get_area() for c in cylinders)
+    safe_area = total_area / settings['fill']
+    depth = math.sqrt(safe_area / ASPECT) / SAFE_FRACTION
+    width = depth * ASPECT
+
+    # Even a single cylinder has to fit inside the safe zone
+    largest = max(diameters)
+    width = max(width, largest / SAFE_FRACTION)
+    depth = max(depth, largest / SAFE_FRACTION)
+
+    max_weight = float(math.ceil(sum(weights) * settings['weight_margin']))
+    container = Container(round(width, 2), round(depth, 2), max_weight)
+
+    return container, cylinders
+
+
+def generate_feasible_instance(n, family='uniform', tightness='tight', seed=None):
+    """
+    Generate an instance together with a valid layout for it
+
+    Cylinders are shelf-packed (largest first) into a box and the container
+    is sized so the box sits inside the safe zone. Every cylinder then lies
+    in the safe zone, so the center of mass does too, whatever the weights.
+
+    Returns:
+        (container, cylinders, witness) where witness[i] is the (x, y) of
+        cylinder i in the valid layout
+    """
+    if tightness not in TIGHTNESS:
+        raise ValueError(f"Unknown tightness: {tightness}")
+    settings = TIGHTNESS[tightness]
+
+    rng = random.Random(seed)
+    diameters, weights = generate_diameters(family, n, rng)
+
+    # Shelf packing into a box of roughly the container's aspect ratio
+    box_width = max(max(diameters), math.sqrt(sum(d * d for d in diameters) * ASPECT)) + LAYOUT_GAP
+    offsets = {}
+    shelf_y = 0.0
+    shelf_height = 0.0
+    cursor_x = 0.0
+    for i in sorted(range(n), key=lambda i: -diameters[i]):
+        d = diameters[i]
+        if cursor_x + d + LAYOUT_GAP > box_width:
+            shelf_y += shelf_height
+            cursor_x = 0.0
+            shelf_height = 0.0
+        offsets[i] = (cursor_x + LAYOUT_GAP + d / 2, shelf_y + LAYOUT_GAP + d / 2)
+        cursor_x += d + LAYOUT_GAP
+        shelf_height = max(shelf_height, d + LAYOUT_GAP)
+    box_depth = shelf_y + shelf_height + LAYOUT_GAP
+
+    width = round(box_width * settings['slack'] / SAFE_FRACTION + 0.01, 2)
+    depth = round(box_depth * settings['slack'] / SAFE_FRACTION + 0.01, 2)
+    max_weight = float(math.ceil(sum(weights) * settings['weight_margin']))
+    container = Container(width, depth, max_weight)
+
+    # Present the cylinders in random order so the layout is not given away
+    order = list(range(n))
+    rng.shuffle(order)
+    cylinders = []
+    witness = []
+    for new_id, old_id in enumerate(order):
+        cylinders.append(Cylinder(new_id, diameters[old_id], weights[old_id]))
+        dx, dy = offsets[old_id]
+        witness.append((container.safe_x_min + dx, container.safe_y_min + dy))
+
+    return container, cylinders, witness
+
+
+def generate_suite(sizes, families=FAMILIES, tightness_levels=('loose', 'tight'),
+                   feasible=False, seed=0):
+    """
+    Yield (name, container, cylinders) for every combination
+
+    The output can be passed straight to write_instances_to_file.
+    """
+    for family in families:
+        for tightness in tightness_levels:
+            for n in sizes:
+                name = f"{family}_{tightness}{'_feasible' if feasible else ''}_{n}"
+                container, cylinders = generate_instance(
+                    n, family, tightness, feasible=feasible, seed=_derived_seed(seed, name)
+                )
+                yield name, container, cylinders
+
+
+def _derived_seed(seed, name):
+    # Stable across runs and Python versions (unlike hash())
+    value = seed
+    for char in name:
+        value = (value * 31 + ord(char)) % (2 ** 32)
+    return value
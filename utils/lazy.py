@@ -0,0 +1,32 @@
+"""
+Lazy package attributes (PEP 562)
+
+A package lists the names it does not want to import up front as
+{name: relative module} and gets a module __getattr__ and __dir__ back.
+"""
+import importlib
+import sys
+
+
+def lazy_exports(module_name, mapping):
+    """
+    Build __getattr__ and __dir__ for a package
+
+    Usage, in a package __init__:
+        __getattr__, __dir__ = lazy_exports(__name__, _LAZY)
+
+    A name is imported from its module on first use and then stored on the
+    package, so later lookups do not go through __getattr__ again.
+    """
+    def __getattr__(name):
+        module = mapping.get(name)
+        if module is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, module_name), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(mapping))
+
+    return __getattr__, __dir__
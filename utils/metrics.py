@@ -0,0 +1,215 @@
+"""
+Process-wide metrics in the Prometheus text format
+
+A small dependency-free registry of counters, gauges and histograms.
+Updates take one lock and a dict lookup, so subsystems can report from
+their loops; the solver reports once per generation, not per evaluation.
+"""
+import bisect
+import os
+import sys
+import threading
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _label_key(labelnames, labels):
+    if set(labels) != set(labelnames):
+        raise ValueError(f"expected labels {labelnames}, got {sorted(labels)}")
+    return tuple(str(labels[name]) for name in labelnames)
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ''
+    escaped = [(name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for name, value in pairs]
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self):
+        with self.lock:
+            items = sorted(self.values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels):
+        with self.lock:
+            return self.values.get(_label_key(self.labelnames, labels), 0)
+
+
+class Gauge(Metric):
+    """
+    A value that goes up and down
+
+    Either set() it, or give it a function that is called at scrape time
+    and returns the value (or a dict mapping label tuples to values).
+    """
+    kind = 'gauge'
+
+    def __init__(self, name, help_text, labelnames=(), function=None):
+        super().__init__(name, help_text, labelnames)
+        self.function = function
+
+    def set(self, value, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self.lock:
+            self.values[key] = value
+
+    def _samples(self):
+        if self.function is None:
+            return super()._samples()
+        value = self.function()
+        if value is None:
+            return []
+        items = sorted(value.items()) if isinstance(value, dict) else [((), value)]
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = _label_key(self.labelnames, labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            entry = self.values.get(key)
+            if entry is None:
+                entry = self.values[key] = {'counts': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+            entry['counts'][index] += 1
+            entry['sum'] += value
+            entry['count'] += 1
+
+    def _samples(self):
+        with self.lock:
+            items = sorted((key, {'counts': list(e['counts']), 'sum': e['sum'], 'count': e['count']})
+                           for key, e in self.values.items())
+        lines = []
+        for key, entry in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), entry['counts']):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [('le', _format_value(float(bound)))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(entry['sum'])}")
+            lines.append(f"{self.name}_count{labels} {entry['count']}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+
+    def register(self, metric):
+        # Registering a name twice returns the first metric, so modules that
+        # get imported again (tests, reloads) share their metrics
+        with self.lock:
+            return self.metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, help_text, labelnames=()):
+        return self.register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name, help_text, labelnames=(), function=None):
+        return self.register(Gauge(name, help_text, labelnames, function))
+
+    def histogram(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self):
+        with self.lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+# Fed by CargoPackingSolver.iter_solve once per generation
+GA_GENERATIONS = REGISTRY.counter('cargo_ga_generations_total', 'GA generations run')
+GA_SECONDS = REGISTRY.counter('cargo_ga_generation_seconds_total', 'Wall time spent in GA generations')
+FITNESS_EVALUATIONS = REGISTRY.counter('cargo_fitness_evaluations_total',
+                                       'Fitness evaluations requested by the GA (cache hits included)')
+PLACEMENTS = REGISTRY.counter('cargo_placements_total', 'Fitness evaluations that had to run the placer')
+
+
+def record_generation(evaluations, placements, seconds):
+    GA_GENERATIONS.inc()
+    GA_SECONDS.inc(seconds)
+    FITNESS_EVALUATIONS.inc(evaluations)
+    PLACEMENTS.inc(placements)
+
+
+def _evaluations_per_second():
+    seconds = GA_SECONDS.get()
+    return FITNESS_EVALUATIONS.get() / seconds if seconds > 0 else 0.0
+
+
+def _cache_hit_ratio():
+    evaluations = FITNESS_EVALUATIONS.get()
+    return 1.0 - PLACEMENTS.get() / evaluations if evaluations else 0.0
+
+
+REGISTRY.gauge('cargo_fitness_evaluations_per_second',
+               'Fitness evaluations per second of GA generation time, since start', function=_evaluations_per_second)
+REGISTRY.gauge('cargo_fitness_cache_hit_ratio',
+               'Share of GA fitness evaluations answered by the fitness cache, since start', function=_cache_hit_ratio)
+
+
+def _resident_memory():
+    # Linux only; other platforms skip the sample
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _peak_resident_memory():
+    if sys.platform == 'win32':
+        return None
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+REGISTRY.gauge('process_resident_memory_bytes', 'Resident memory of this process', function=_resident_memory)
+REGISTRY.gauge('process_peak_resident_memory_bytes', 'Peak resident memory of this process',
+               function=_peak_resident_memory)
@@ -0,0 +1,159 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from utils.canonical import (
+    instance_hash,
+    cylinders_hash,
+    to_canonical_order,
+    from_canonical_order
+)
+
+class SolutionStore:
+    """
+    On-disk store of the best known order per instance (SQLite file)
+
+    Entries are keyed by instance_hash, so the same manifest submitted with
+    its cylinders in a different order maps to the same entry. Orders are
+    stored in canonical form and translated back to the caller's indices.
+    Only improvements overwrite an entry, and the least recently used
+    entries are evicted once the store holds more than max_entries.
+    """
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS solutions (
+                    instance_key TEXT PRIMARY KEY,
+                    cylinders_key TEXT NOT NULL,
+                    placement_order TEXT NOT NULL,
+                    fitness REAL NOT NULL,
+                    params TEXT,
+                    updated REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cylinders ON solutions(cylinders_key)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON solutions(last_used)")
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per call keeps the store safe to share
+        # between request threads and worker processes
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def lookup(self, container, cylinders):
+        """
+        Exact lookup for this container and cylinder multiset
+
+        Returns:
+            dict with placement_order (in this manifest's indices), fitness
+            and params, or None
+        """
+        key = instance_hash(container, cylinders)
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT placement_order, fitness, params FROM solutions WHERE instance_key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            conn.execute(
+                "UPDATE solutions SET last_used = ?, hits = hits + 1 WHERE instance_key = ?",
+                (time.time(), key)
+            )
+
+        return {
+            'placement_order': from_canonical_order(json.loads(row[0]), cylinders),
+            'fitness': row[1],
+            'params': json.loads(row[2]) if row[2] else {}
+        }
+
+    def lookup_near(self, container, cylinders, limit=5):
+        """
+        Orders stored for the same cylinders in a different container
+
+        They are not guaranteed to be good (or valid) here, but make better
+        starting points for the GA than random orders.
+
+        Returns:
+            List of placement orders, best stored fitness first
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT placement_order FROM solutions "
+                "WHERE cylinders_key = ? AND instance_key != ? "
+                "ORDER BY fitness DESC LIMIT ?",
+                (cylinders_hash(cylinders), instance_hash(container, cylinders), limit)
+            ).fetchall()
+
+        return [from_canonical_order(json.loads(row[0]), cylinders) for row in rows]
+
+    def put(self, container, cylinders, genes, fitness, params=None):
+        """
+        Record an order if it beats what the store already holds
+
+        Returns:
+            True if the entry was inserted or improved
+        """
+        if fitness <= 0:
+            return False
+
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO solutions
+                    (instance_key, cylinders_key, placement_order, fitness, params, updated, last_used)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(instance_key) DO UPDATE SET
+                    placement_order = excluded.placement_order,
+                    fitness = excluded.fitness,
+                    params = excluded.params,
+                    updated = excluded.updated,
+                    last_used = excluded.last_used
+                WHERE excluded.fitness > solutions.fitness
+                """,
+                (
+                    instance_hash(container, cylinders),
+                    cylinders_hash(cylinders),
+                    json.dumps(to_canonical_order(genes, cylinders)),
+                    fitness,
+                    json.dumps(params or {}),
+                    now,
+                    now
+                )
+            )
+            stored = cursor.rowcount > 0
+
+            if stored:
+                self._evict(conn)
+
+        return stored
+
+    def _evict(self, conn):
+        conn.execute(
+            "DELETE FROM solutions WHERE instance_key IN ("
+            "SELECT instance_key FROM solutions ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
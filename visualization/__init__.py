@@ -1,5 +1,14 @@
-from .matplotlib_drawer import (
-    MatplotlibDrawer,
-    visualize_solution_from_files,
-    visualize_all_solutions
-)
\ No newline at end of file
+from utils.lazy import lazy_exports
+
+# matplotlib is only imported when something is drawn
+_LAZY = {
+    'MatplotlibDrawer': '.matplotlib_drawer',
+    'visualize_solution_from_files': '.matplotlib_drawer',
+    'visualize_all_solutions': '.matplotlib_drawer',
+    'SvgRenderer': '.svg_renderer',
+    'render_svg': '.svg_renderer',
+    'GAAnimator': '.animation',
+    'export_animation': '.animation'
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -0,0 +1,279 @@
+"""
+Replay videos of a GA run
+
+GAAnimator builds one figure with the container drawn once and every
+cylinder in a single EllipseCollection. A frame only moves the circle
+centers, labels and center of mass marker and blits them onto the saved
+background, instead of drawing a whole new figure like
+MatplotlibDrawer.draw. export_animation feeds it the best layout from
+CargoPackingSolver.iter_solve each time the best solution improves.
+
+Frames go to a directory of PNGs, a GIF (Pillow) or an MP4 (a local
+ffmpeg binary), picked by the output path.
+"""
+import os
+import shutil
+import subprocess
+import time
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import EllipseCollection
+import matplotlib.patches as patches
+from matplotlib import cm
+
+
+class GAAnimator:
+    """
+    Renders successive layouts of one instance
+
+    Args:
+        container, cylinders: The instance; positions come with each frame
+        label_threshold: Write the ids of at most this many of the largest
+            cylinders (0 for none)
+        figsize, dpi: Frame size; the defaults give 800x600 pixels
+    """
+    def __init__(self, container, cylinders, title="GA convergence", label_threshold=50,
+                 figsize=(8, 6), dpi=100):
+        self.container = container
+        self.cylinders = cylinders
+        self.index = {cyl.id: i for i, cyl in enumerate(cylinders)}
+
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.fig)
+        ax = self.ax = self.fig.add_subplot()
+
+        # Static part, drawn once into the background
+        ax.add_patch(patches.Rectangle(
+            (0, 0), container.width, container.depth,
+            fill=False, edgecolor='black', linewidth=2.5
+        ))
+        ax.add_patch(patches.Rectangle(
+            (container.safe_x_min, container.safe_y_min),
+            container.safe_x_max - container.safe_x_min,
+            container.safe_y_max - container.safe_y_min,
+            facecolor='lightgreen', edgecolor='green', linewidth=1.5, linestyle='--', alpha=0.2
+        ))
+        ax.set_xlim(-0.5, container.width + 0.5)
+        ax.set_ylim(-0.5, container.depth + 0.5)
+        ax.set_aspect('equal')
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.set_xlabel('Width (m)')
+        ax.set_ylabel('Depth (m)')
+        ax.set_title(title, fontweight='bold')
+        self.fig.tight_layout()
+
+        # Animated part: all circles in one collection, moved by offsets.
+        # Unplaced cylinders sit at NaN and are not drawn.
+        colors = cm.Set3.colors
+        diameters = np.array([cyl.diameter for cyl in cylinders], dtype=float)
+        self.weights = np.array([cyl.weight for cyl in cylinders], dtype=float)
+        self.offsets = np.full((len(cylinders), 2), np.nan)
+        self.circles = EllipseCollection(
+            diameters, diameters, np.zeros(len(cylinders)),
+            units='xy', offsets=self.offsets, offset_transform=ax.transData,
+            facecolors=[colors[cyl.id % len(colors)] for cyl in cylinders],
+            edgecolors='darkblue', linewidths=1.5, alpha=0.7, animated=True
+        )
+        ax.add_collection(self.circles)
+
+        largest = sorted(cylinders, key=lambda c: c.radius, reverse=True)[:label_threshold]
+        self.labels = {
+            cyl.id: ax.text(0, 0, str(cyl.id), ha='center', va='center', fontsize=8, fontweight='bold',
+                            visible=False, animated=True)
+            for cyl in largest
+        }
+        self.center, = ax.plot([], [], marker='+', markersize=16, markeredgewidth=3, color='red', animated=True)
+        self.info = ax.text(0.02, 0.98, '', transform=ax.transAxes, fontsize=9, verticalalignment='top',
+                            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8), animated=True)
+
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    @property
+    def size(self):
+        # (width, height) of a frame in pixels
+        width, height = self.canvas.get_width_height()
+        return int(width), int(height)
+
+    def frame(self, positions, generation=None, fitness=None):
+        """
+        Render one layout
+
+        Args:
+            positions: iterable of (id, x, y) for the placed cylinders
+            generation, fitness: Shown in the info box
+
+        Returns:
+            (height, width, 4) uint8 RGBA array
+        """
+        self.offsets[:] = np.nan
+        for label in self.labels.values():
+            label.set_visible(False)
+
+        for cyl_id, x, y in positions:
+            self.offsets[self.index[cyl_id]] = (x, y)
+            label = self.labels.get(cyl_id)
+            if label is not None:
+                label.set_position((x, y))
+                label.set_visible(True)
+        self.circles.set_offsets(self.offsets)
+
+        placed = ~np.isnan(self.offsets[:, 0])
+        total_weight = self.weights[placed].sum()
+        if total_weight > 0:
+            center = self.weights[placed] @ self.offsets[placed] / total_weight
+            self.center.set_data([center[0]], [center[1]])
+        else:
+            self.center.set_data([], [])
+
+        lines = [f"Cylinders: {int(placed.sum())}/{len(self.cylinders)}"]
+        if generation is not None:
+            lines.insert(0, f"Generation {generation}")
+        if fitness is not None:
+            lines.append(f"Best fitness: {fitness:.2f}")
+        self.info.set_text('\n'.join(lines))
+
+        # Blit: restore the static background and draw only what moves
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.circles)
+        for label in self.labels.values():
+            if label.get_visible():
+                self.ax.draw_artist(label)
+        self.ax.draw_artist(self.center)
+        self.ax.draw_artist(self.info)
+        return np.asarray(self.canvas.buffer_rgba()).copy()
+
+
+class FramesWriter:
+    # One PNG per frame: <directory>/frame_00000.png, ...
+    def __init__(self, directory, fps=10):
+        self.directory = directory
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, frame):
+        from PIL import Image
+        Image.fromarray(frame).save(os.path.join(self.directory, f'frame_{self.count:05d}.png'))
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+class GifWriter:
+    # Frames are kept as palette images until close() writes the file
+    def __init__(self, path, fps=10):
+        self.path = path
+        self.duration = int(round(1000 / fps))
+        self.images = []
+
+    def write(self, frame):
+        from PIL import Image
+        self.images.append(Image.fromarray(frame).convert('RGB').quantize(colors=256))
+
+    def close(self):
+        if not self.images:
+            return
+        first, rest = self.images[0], self.images[1:]
+        first.save(self.path, save_all=True, append_images=rest, duration=self.duration, loop=0)
+        self.images = []
+
+
+class FFmpegWriter:
+    """
+    Pipes raw RGBA frames into a local ffmpeg
+
+    Raises:
+        RuntimeError: if no ffmpeg binary is on the PATH
+    """
+    def __init__(self, path, fps=10, ffmpeg=None):
+        self.path = path
+        self.fps = fps
+        self.ffmpeg = ffmpeg or shutil.which('ffmpeg')
+        if self.ffmpeg is None:
+            raise RuntimeError("ffmpeg not found; install it or write a .gif or a frame directory instead")
+        self.process = None
+
+    def write(self, frame):
+        if self.process is None:
+            height, width = frame.shape[:2]
+            self.process = subprocess.Popen(
+                [self.ffmpeg, '-y', '-loglevel', 'error',
+                 '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(self.fps), '-i', '-',
+                 # H.264 wants even dimensions
+                 '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', '-vcodec', 'libx264', self.path],
+                stdin=subprocess.PIPE
+            )
+        self.process.stdin.write(frame.tobytes())
+
+    def close(self):
+        if self.process is None:
+            return
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed writing {self.path}")
+        self.process = None
+
+
+def make_writer(path, fps=10):
+    # .gif -> GifWriter, .mp4 -> FFmpegWriter, anything else is a frame directory
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.gif':
+        return GifWriter(path, fps)
+    if extension == '.mp4':
+        return FFmpegWriter(path, fps)
+    return FramesWriter(path, fps)
+
+
+def export_animation(solver, output, max_generations=100, fps=10, label_threshold=50, title=None, **solve_options):
+    """
+    Run a solver and record every improvement of its best solution
+
+    Args:
+        solver: A fresh CargoPackingSolver
+        output: .gif, .mp4 or a directory for PNG frames
+        solve_options: Passed on to iter_solve (target_fitness, time_limit, ...)
+
+    Returns:
+        dict with frames, generations, best_fitness, solve_seconds and
+        render_seconds
+    """
+    if title is None:
+        title = f"GA convergence ({len(solver.cylinders)} cylinders)"
+    animator = GAAnimator(solver.container, solver.cylinders, title=title, label_threshold=label_threshold)
+    writer = make_writer(output, fps)
+
+    frames = 0
+    render_seconds = 0.0
+    start = time.perf_counter()
+    summary = {'generations': 0, 'best_fitness': None}
+    try:
+        for event in solver.iter_solve(max_generations=max_generations, **solve_options):
+            if event['type'] == 'complete':
+                summary = {'generations': event['generations'], 'best_fitness': event['best_fitness']}
+                continue
+            # Generations that did not beat the best have nothing new to show;
+            # a local search result does
+            improved = (event['type'] == 'generation' and event['improved']) or (
+                event['type'] == 'local_search' and event['after'] > event['before'])
+            if not improved or solver.best_solution is None:
+                continue
+
+            render_start = time.perf_counter()
+            details = solver.get_solution_details(solver.best_solution)
+            if details is None:
+                continue
+            positions = [(cyl.id, cyl.x, cyl.y) for cyl in details['cylinders'] if cyl.placed]
+            generation = event.get('generation', len(solver.generation_history) - 1)
+            writer.write(animator.frame(positions, generation, solver.best_fitness))
+            frames += 1
+            render_seconds += time.perf_counter() - render_start
+    finally:
+        writer.close()
+
+    summary['frames'] = frames
+    summary['render_seconds'] = render_seconds
+    summary['solve_seconds'] = time.perf_counter() - start - render_seconds
+    return summary
@@ -4,10 +4,22 @@ from matplotlib.collections import PatchCollection
 import os
 
 class MatplotlibDrawer:
-    def __init__(self, container, cylinders, title="Container Packing Solution"):
+    """
+    Draws a container and its placed cylinders
+
+    Args:
+        fast: Draw all circles as one PatchCollection instead of one patch
+            each, which matters once there are thousands of cylinders
+        label_threshold: With more placed cylinders than this, only the ids
+            of the label_threshold largest cylinders are written (None
+            labels everything)
+    """
+    def __init__(self, container, cylinders, title="Container Packing Solution", fast=False, label_threshold=None):
         self.container = container
         self.cylinders = cylinders
         self.title = title
+        self.fast = fast
+        self.label_threshold = label_threshold
     
     def draw(self, save_path=None, show=True, dpi=150):
         # Draw the solution using matplotlib
@@ -77,24 +89,45 @@ class MatplotlibDrawer:
     def _draw_cylinders(self, ax):
         """Draw all placed cylinders"""
         colors = plt.cm.Set3.colors
+        placed = [cyl for cyl in self.cylinders if cyl.placed]
         
-        for cyl in self.cylinders:
-            if not cyl.placed:
-                continue
-            
-            color = colors[cyl.id % len(colors)]
-            
-            circle = patches.Circle(
-                (cyl.x, cyl.y),
-                cyl.radius,
-                fill=True,
-                facecolor=color,
-                edgecolor='darkblue',
-                linewidth=2,
+        if self.fast:
+            circles = [patches.Circle((cyl.x, cyl.y), cyl.radius) for cyl in placed]
+            collection = PatchCollection(
+                circles,
+                facecolors=[colors[cyl.id % len(colors)] for cyl in placed],
+                edgecolors='darkblue',
+                linewidths=2,
                 alpha=0.7
             )
-            ax.add_patch(circle)
-            
+            ax.add_collection(collection)
+        else:
+            for cyl in placed:
+                circle = patches.Circle(
+                    (cyl.x, cyl.y),
+                    cyl.radius,
+                    fill=True,
+                    facecolor=colors[cyl.id % len(colors)],
+                    edgecolor='darkblue',
+                    linewidth=2,
+                    alpha=0.7
+                )
+                ax.add_patch(circle)
+        
+        if self.label_threshold is not None and len(placed) > self.label_threshold:
+            # Too many to read anyway: ids on the largest cylinders only
+            largest = sorted(placed, key=lambda c: c.radius, reverse=True)[:self.label_threshold]
+            for cyl in largest:
+                ax.text(
+                    cyl.x, cyl.y,
+                    f"{cyl.id}",
+                    ha='center', va='center',
+                    fontsize=8, fontweight='bold',
+                    color='black'
+                )
+            return
+        
+        for cyl in placed:
             ax.text(
                 cyl.x, cyl.y,
                 f"{cyl.id}",
@@ -172,31 +205,90 @@ class MatplotlibDrawer:
         ax.legend(loc='upper right', fontsize=9)
 
 
-def visualize_solution_from_files(instance_file, solution_file, save_path=None, show=True):
+def visualize_solution_from_files(instance_file, solution_file=None, save_path=None, show=True,
+                                  fast=False, label_threshold=None):
     # Load and visualize a solution from files
+    # Either file may be in the binary format; a binary instance file that
+    # holds its own solution needs no solution_file
+    # fast and label_threshold are passed on to MatplotlibDrawer
 
-    from utils import load_instance_from_file, load_solution_from_file
+    from utils import load_instance_from_file, load_solution_from_file, load_binary, is_binary_file
+    
+    if is_binary_file(instance_file):
+        packing = load_binary(instance_file)
+        container = packing.container
+        cylinders = packing.cylinders(with_positions=False)
+        solution = packing.solution()
+    else:
+        container, cylinders = load_instance_from_file(instance_file)
+        solution = None
+    
+    if solution_file is not None:
+        if is_binary_file(solution_file):
+            solution = load_binary(solution_file).solution()
+        else:
+            solution = load_solution_from_file(solution_file)
     
-    container, cylinders = load_instance_from_file(instance_file)
-    solution = load_solution_from_file(solution_file)
+    if solution is None:
+        raise ValueError(f"No solution found for {instance_file}")
     
     for cyl_data in solution['cylinders']:
         cyl_id = cyl_data['id']
         cylinders[cyl_id].set_position(cyl_data['x'], cyl_data['y'])
     
-    instance_name = os.path.basename(instance_file).replace('.txt', '')
+    instance_name = os.path.splitext(os.path.basename(instance_file))[0]
     title = f"Solution: {instance_name} (Fitness: {solution['fitness']:.2f})"
     
-    drawer = MatplotlibDrawer(container, cylinders, title=title)
+    drawer = MatplotlibDrawer(container, cylinders, title=title, fast=fast, label_threshold=label_threshold)
     return drawer.draw(save_path=save_path, show=show)
 
 
-def visualize_all_solutions(solutions_dir="data/solutions", output_dir="visualizations", show=False):
-    # Generate visualizations for all saved solutions
+def is_up_to_date(output_path, *input_paths):
+    # True if output_path exists and is at least as new as every input
+    if not os.path.exists(output_path):
+        return False
+    output_mtime = os.path.getmtime(output_path)
+    return all(os.path.getmtime(path) <= output_mtime for path in input_paths)
+
+
+def _render_file(instance_file, solution_file, output_path, fast, label_threshold):
+    # Worker for visualize_all_solutions; returns an error message or None
+    plt.switch_backend('Agg')
+    try:
+        visualize_solution_from_files(
+            instance_file,
+            solution_file,
+            save_path=output_path,
+            show=False,
+            fast=fast,
+            label_threshold=label_threshold
+        )
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def visualize_all_solutions(solutions_dir="data/solutions", output_dir="visualizations", show=False,
+                            workers=1, fast=False, label_threshold=None, force=False, data_dir="data"):
+    """
+    Generate visualizations for all saved solutions
+
+    Args:
+        workers: Render files in this many processes (ignored when show is
+            True, since figures are then shown one by one)
+        fast, label_threshold: See MatplotlibDrawer
+        force: Also redraw images that are newer than their solution and
+            instance files
+
+    Returns:
+        dict with the number of images rendered, skipped and failed
+    """
     import glob
     
     os.makedirs(output_dir, exist_ok=True)
+    counts = {'rendered': 0, 'skipped': 0, 'failed': 0}
     
+    tasks = []
     for category in ['reference', 'challenging']:
         solution_path = os.path.join(solutions_dir, category)
         
@@ -205,11 +297,9 @@ def visualize_all_solutions(solutions_dir="data/solutions", output_dir="visualiz
         
         solution_files = glob.glob(os.path.join(solution_path, "*_solution.txt"))
         
-        print(f"\nGenerating visualizations for {category} instances...")
-        
         for solution_file in sorted(solution_files):
             instance_name = os.path.basename(solution_file).replace('_solution.txt', '')
-            instance_file = os.path.join('data', category, f'{instance_name}.txt')
+            instance_file = os.path.join(data_dir, category, f'{instance_name}.txt')
             
             if not os.path.exists(instance_file):
                 print(f"  Warning: Instance file not found: {instance_file}")
@@ -217,18 +307,47 @@ def visualize_all_solutions(solutions_dir="data/solutions", output_dir="visualiz
             
             output_path = os.path.join(output_dir, category, f'{instance_name}.png')
             
-            print(f"  Generating: {instance_name}.png")
+            if not force and is_up_to_date(output_path, solution_file, instance_file):
+                counts['skipped'] += 1
+                continue
             
+            tasks.append((instance_file, solution_file, output_path))
+    
+    print(f"\nGenerating {len(tasks)} visualizations ({counts['skipped']} up to date)...")
+    
+    def report(output_path, error):
+        name = os.path.relpath(output_path, output_dir)
+        if error is None:
+            counts['rendered'] += 1
+            print(f"  Generated: {name}")
+        else:
+            counts['failed'] += 1
+            print(f"  Error generating {name}: {error}")
+    
+    if workers > 1 and not show and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = {
+                executor.submit(_render_file, instance_file, solution_file, output_path, fast, label_threshold): output_path
+                for instance_file, solution_file, output_path in tasks
+            }
+            for future in as_completed(futures):
+                report(futures[future], future.result())
+    else:
+        for instance_file, solution_file, output_path in tasks:
             try:
                 visualize_solution_from_files(
                     instance_file,
                     solution_file,
                     save_path=output_path,
-                    show=show
+                    show=show,
+                    fast=fast,
+                    label_threshold=label_threshold
                 )
+                error = None
             except Exception as e:
-                print(f"  Error generating {instance_name}: {e}")
-        
-        print(f"  Completed {category} instances")
+                error = str(e)
+            report(output_path, error)
     
-    print(f"\nAll visualizations saved to {output_dir}/")
\ No newline at end of file
+    print(f"\nAll visualizations saved to {output_dir}/")
+    return counts
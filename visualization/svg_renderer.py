@@ -0,0 +1,144 @@
+"""
+Dependency-free SVG rendering of a packing
+
+Draws the same picture as MatplotlibDrawer (container, safe zone,
+cylinders and center of mass) as plain SVG text, without importing
+matplotlib. Output is produced in chunks, so large layouts can be
+streamed straight into a response or a file.
+"""
+from xml.sax.saxutils import escape
+
+from utils import calculate_center_of_mass
+
+# matplotlib's Set3, so both renderers color cylinders alike
+COLORS = (
+    '#8dd3c7', '#ffffb3', '#bebada', '#fb8072', '#80b1d3', '#fdb462',
+    '#b3de69', '#fccde5', '#d9d9d9', '#bc80bd', '#ccebc5', '#ffed6f'
+)
+
+# Space around the container, in meters
+MARGIN = 0.5
+
+
+def _num(value):
+    # Millimeter precision is plenty and keeps the output small
+    text = f"{value:.3f}".rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+class SvgRenderer:
+    """
+    Renders a container and its placed cylinders as SVG
+
+    Args:
+        width_px: Width of the image; the height follows the container
+        labels: Write the cylinder ids
+        label_threshold: With more placed cylinders than this, only the ids
+            of the label_threshold largest cylinders are written (None
+            labels everything)
+        title: Optional <title> of the image
+    """
+    def __init__(self, container, cylinders, width_px=600, labels=True, label_threshold=None, title=None):
+        self.container = container
+        self.cylinders = cylinders
+        self.width_px = width_px
+        self.labels = labels
+        self.label_threshold = label_threshold
+        self.title = title
+
+    def iter_svg(self, chunk_size=256):
+        """
+        Yield the document in pieces of about chunk_size elements
+
+        One SVG unit is one meter; y is flipped so the rear wall (y = 0)
+        is at the bottom, as in the matplotlib pictures.
+        """
+        buffer = []
+        for element in self._elements():
+            buffer.append(element)
+            if len(buffer) >= chunk_size:
+                yield ''.join(buffer)
+                buffer = []
+        if buffer:
+            yield ''.join(buffer)
+
+    def render(self):
+        return ''.join(self.iter_svg())
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for chunk in self.iter_svg():
+                f.write(chunk)
+
+    def _y(self, y):
+        # Solution y (up) to SVG y (down)
+        return self.container.depth - y
+
+    def _elements(self):
+        container = self.container
+        view_width = container.width + 2 * MARGIN
+        view_depth = container.depth + 2 * MARGIN
+        height_px = self.width_px * view_depth / view_width
+        # Line widths are given in pixels of the output image
+        px = view_width / self.width_px
+
+        yield (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{_num(self.width_px)}" height="{_num(height_px)}" '
+            f'viewBox="{_num(-MARGIN)} {_num(-MARGIN)} {_num(view_width)} {_num(view_depth)}">\n'
+        )
+        if self.title:
+            yield f'<title>{escape(self.title)}</title>\n'
+
+        # Container and safe zone
+        yield (
+            f'<rect x="0" y="0" width="{_num(container.width)}" height="{_num(container.depth)}" '
+            f'fill="white" stroke="black" stroke-width="{_num(2.5 * px)}"/>\n'
+        )
+        yield (
+            f'<rect x="{_num(container.safe_x_min)}" y="{_num(self._y(container.safe_y_max))}" '
+            f'width="{_num(container.safe_x_max - container.safe_x_min)}" '
+            f'height="{_num(container.safe_y_max - container.safe_y_min)}" '
+            f'fill="lightgreen" fill-opacity="0.2" stroke="green" stroke-width="{_num(1.5 * px)}" '
+            f'stroke-dasharray="{_num(6 * px)} {_num(4 * px)}"/>\n'
+        )
+
+        placed = [cyl for cyl in self.cylinders if cyl.placed]
+
+        yield f'<g stroke="darkblue" stroke-width="{_num(1.5 * px)}" fill-opacity="0.7">\n'
+        for cyl in placed:
+            yield (
+                f'<circle cx="{_num(cyl.x)}" cy="{_num(self._y(cyl.y))}" r="{_num(cyl.radius)}" '
+                f'fill="{COLORS[cyl.id % len(COLORS)]}"/>\n'
+            )
+        yield '</g>\n'
+
+        if self.labels and placed:
+            labelled = placed
+            if self.label_threshold is not None and len(placed) > self.label_threshold:
+                labelled = sorted(placed, key=lambda c: c.radius, reverse=True)[:self.label_threshold]
+            yield '<g text-anchor="middle" dominant-baseline="central" font-family="sans-serif" font-weight="bold">\n'
+            for cyl in labelled:
+                yield (
+                    f'<text x="{_num(cyl.x)}" y="{_num(self._y(cyl.y))}" '
+                    f'font-size="{_num(cyl.radius * 0.8)}">{cyl.id}</text>\n'
+                )
+            yield '</g>\n'
+
+        center_x, center_y = calculate_center_of_mass(self.cylinders)
+        if center_x is not None:
+            size = 0.02 * max(container.width, container.depth)
+            cx, cy = _num(center_x), _num(self._y(center_y))
+            yield (
+                f'<g stroke="red" stroke-width="{_num(2 * px)}" fill="none">'
+                f'<title>{escape(f"Center of Mass ({center_x:.2f}, {center_y:.2f})")}</title>'
+                f'<path d="M{_num(center_x - size)} {cy}H{_num(center_x + size)}'
+                f'M{cx} {_num(self._y(center_y) - size)}V{_num(self._y(center_y) + size)}"/>'
+                f'<circle cx="{cx}" cy="{cy}" r="{_num(size * 0.75)}"/></g>\n'
+            )
+
+        yield '</svg>\n'
+
+
+def render_svg(container, cylinders, **options):
+    # Whole document as one string; see SvgRenderer for the options
+    return SvgRenderer(container, cylinders, **options).render()